@@ -0,0 +1,167 @@
+"""Benchmark of the storage of the rate prices.
+
+Compares the read and aggregate cost of the prices stored as they used to be
+(``DecimalField(10, 2)``), as they are (``DecimalField(20, 10)``) and as
+integers scaled by 10**10, on throwaway tables of the configured database,
+dropped afterwards.
+
+Usage:
+    python -m benchmarks.bench_price_precision --rows 200000 --repeat 5
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "currency_exchange.settings")
+django.setup()
+
+# pylint: disable=C0413
+from django.db import connection, models  # noqa: E402
+from django.db.models import Avg, Max, Min  # noqa: E402
+
+# pylint: enable=C0413
+
+SCALE = 10**10
+
+
+def build_model(name: str, price: models.Field) -> type:
+    """
+    Build an unmanaged rate model, holding its price in the given field.
+
+    Args:
+        name (str): The name of the model.
+        price (models.Field): The price field.
+
+    Returns:
+        type: The model.
+    """
+    meta = type(
+        "Meta",
+        (),
+        {"app_label": "exchange_rates", "db_table": f"bench_{name}", "managed": False},
+    )
+    return type(
+        name,
+        (models.Model,),
+        {
+            "__module__": __name__,
+            "Meta": meta,
+            "date": models.DateField(),
+            "currency_id": models.IntegerField(),
+            "price": price,
+        },
+    )
+
+
+MODELS = {
+    "decimal(10, 2)": (
+        build_model(
+            "PriceDecimal10x2", models.DecimalField(max_digits=10, decimal_places=2)
+        ),
+        lambda price: price.quantize(Decimal("0.01")),
+    ),
+    "decimal(20, 10)": (
+        build_model(
+            "PriceDecimal20x10", models.DecimalField(max_digits=20, decimal_places=10)
+        ),
+        lambda price: price,
+    ),
+    "bigint / 10**10": (
+        build_model("PriceScaledInteger", models.BigIntegerField()),
+        lambda price: int(price * SCALE),
+    ),
+}
+
+
+def build_prices(rows: int) -> list:
+    """
+    Build synthetic ``(date, currency_id, price)`` rows, prices spanning the
+    magnitudes of real rates.
+
+    Args:
+        rows (int): Number of rows.
+
+    Returns:
+        list: The rows.
+    """
+    random.seed(0)
+    return [
+        (
+            date(2000, 1, 3) + timedelta(days=index // 32),
+            index % 32 + 1,
+            Decimal(str(round(random.uniform(0.0001, 20000), 10))),
+        )
+        for index in range(rows)
+    ]
+
+
+def measure(function, repeat: int) -> float:
+    """
+    Returns the best wall time of several runs of a function.
+
+    Args:
+        function (callable): The function to be measured.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: The best run time, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print the cost of each storage."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    prices = build_prices(args.rows)
+
+    print(f"rows: {args.rows} ({connection.vendor})")
+    print(f"{'storage':16} {'read':>12} {'aggregate':>12}")
+    for name, (model, convert) in MODELS.items():
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(model)
+        try:
+            model.objects.bulk_create(
+                [
+                    model(date=day, currency_id=currency_id, price=convert(price))
+                    for day, currency_id, price in prices
+                ],
+                batch_size=5000,
+            )
+
+            def read(model=model):
+                return list(model.objects.values_list("date", "currency_id", "price"))
+
+            def aggregate(model=model):
+                return list(
+                    model.objects.values("currency_id").annotate(
+                        mean=Avg("price"), low=Min("price"), high=Max("price")
+                    )
+                )
+
+            read_seconds = measure(read, args.repeat)
+            aggregate_seconds = measure(aggregate, args.repeat)
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(model)
+
+        print(
+            f"{name:16} {read_seconds * 1000:10.1f}ms {aggregate_seconds * 1000:10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark of the RateMatrix analytics.
+
+Compares converting amounts and computing cross rates row by row, the way
+consumers loop over ORM rows, with the batch RateMatrix APIs. No database is
+needed.
+
+Usage:
+    python -m benchmarks.bench_rate_matrix --days 5000 --currencies 32
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from exchange_rates.core.entities.rate_matrix import RateMatrix
+
+
+def build_rows(days: int, currencies: int) -> list:
+    """
+    Build synthetic ``(date, currency_id, price)`` rows.
+
+    Args:
+        days (int): Number of days.
+        currencies (int): Number of currencies.
+
+    Returns:
+        list: The rows.
+    """
+    first_day = date(2000, 1, 3)
+    return [
+        (first_day + timedelta(days=day), currency_id, random.uniform(0.5, 200))
+        for day in range(days)
+        for currency_id in range(1, currencies + 1)
+    ]
+
+
+def measure(function) -> float:
+    """
+    Returns the wall time of a function call.
+
+    Args:
+        function (callable): The function to be measured.
+
+    Returns:
+        float: The run time, in seconds.
+    """
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark and print the time of each approach."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=5000)
+    parser.add_argument("--currencies", type=int, default=32)
+    parser.add_argument("--amounts", type=int, default=100000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.days, args.currencies)
+    names = {
+        currency_id: f"C{currency_id:02d}"
+        for currency_id in range(1, args.currencies + 1)
+    }
+    amounts = [random.uniform(1, 1000) for _ in range(args.amounts)]
+    from_currencies = [random.choice(list(names.values())) for _ in amounts]
+    to_currencies = [random.choice(list(names.values())) for _ in amounts]
+    dates = [rows[random.randrange(len(rows))][0] for _ in amounts]
+
+    def loop():
+        prices = {(day, names[currency_id]): price for day, currency_id, price in rows}
+        converted = [
+            amount * prices[(day, to_currency)] / prices[(day, from_currency)]
+            for amount, from_currency, to_currency, day in zip(
+                amounts, from_currencies, to_currencies, dates
+            )
+        ]
+        cross_rates = {
+            (day, currency): price / prices[(day, "C01")]
+            for (day, currency), price in prices.items()
+        }
+        return converted, cross_rates
+
+    matrix = None
+
+    def build():
+        nonlocal matrix
+        matrix = RateMatrix.from_rows("C01", rows, names)
+
+    def batch():
+        return (
+            matrix.convert(amounts, from_currencies, to_currencies, dates),
+            matrix.cross_rates("C01"),
+        )
+
+    loop_seconds = measure(loop)
+    build_seconds = measure(build)
+    batch_seconds = measure(batch)
+
+    print(f"rates: {len(rows)}, amounts: {args.amounts}")
+    print(f"loop:  {loop_seconds * 1000:10.1f} ms")
+    print(f"build: {build_seconds * 1000:10.1f} ms (RateMatrix.from_rows)")
+    print(f"batch: {batch_seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Benchmark of the /rates/ hot path, offline.
+
+Seeds a throwaway test database with a synthetic rate history, points the
+VAT client at a local stub of the VATcomply API answering with an injected
+latency, then requests ``RatesView`` through the Django test client. Each
+scenario reports the latency percentiles, the queries per request, the rows
+served per second and the upstream calls made:
+
+- cached: the same stored day, served by the response cache.
+- warm: stored days, the response cache cleared before each request.
+- cold_day: a single day missing from the database per request.
+- cold_range: five missing week days per request.
+- full_history: the whole history, walked page by page (``page_size`` capped
+  to ``RATES_MAX_PAGE_SIZE``) following the ``next`` cursors.
+
+Results are written as JSON and, given a previous result, compared to it,
+exiting with status 1 when a scenario got slower than the tolerance.
+
+Usage:
+    python -m benchmarks.bench_rates_view --days 2500 --latency 0.05 \
+        --output results.json
+    python -m benchmarks.bench_rates_view --compare results.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import quote
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "currency_exchange.settings")
+django.setup()
+
+# pylint: disable=C0413
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClient  # noqa: E402
+from exchange_rates.core.services.rates_service import RatesService  # noqa: E402
+from exchange_rates.infra.cache.rates_response_cache import (  # noqa: E402
+    RatesResponseCache,
+)
+from exchange_rates.infra.views.pagination import (  # noqa: E402
+    RateKeysetPagination,
+)
+from exchange_rates.models import Currency, Rate  # noqa: E402
+from tests.stubs.vatcomply import VATComplyStub  # noqa: E402
+
+# pylint: enable=C0413
+
+LAST_SEEDED_DAY = date(2019, 12, 31)
+
+
+def seed_history(days: int) -> tuple:
+    """
+    Store the canonical rates of every currency on the week days ending on
+    ``LAST_SEEDED_DAY``.
+
+    Args:
+        days (int): Number of week days.
+
+    Returns:
+        tuple: The seeded days, in order, and the synthetic prices of each
+        currency relative to the base.
+    """
+    random.seed(0)
+    currencies = list(Currency.objects.all())
+    base = Currency.objects.get(short_name=RatesService.canonical_base_rate)
+    prices = {
+        currency.short_name: 1.0 if currency == base else random.uniform(0.1, 20000)
+        for currency in currencies
+    }
+
+    seeded, day = [], LAST_SEEDED_DAY
+    while len(seeded) < days:
+        if day.weekday() < 5:
+            seeded.insert(0, day)
+        day -= timedelta(days=1)
+
+    Rate.objects.bulk_create(
+        [
+            Rate(
+                base=base,
+                currency=currency,
+                date=item,
+                price=round(prices[currency.short_name] * random.uniform(0.9, 1.1), 10),
+            )
+            for item in seeded
+            for currency in currencies
+        ],
+        batch_size=5000,
+    )
+    return seeded, prices
+
+
+def percentile(values: list, rank: float) -> float:
+    """
+    Returns the nearest-rank percentile of some values.
+
+    Args:
+        values (list): The values.
+        rank (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile.
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+def run_scenario(
+    client: Client, stub: VATComplyStub, urls: list, before=None, follow=False
+) -> dict:
+    """
+    Request each url in turn, measuring every request.
+
+    Args:
+        client (Client): The Django test client.
+        stub (VATComplyStub): The stub answering the upstream calls.
+        urls (list): The urls requested.
+        before (callable, optional): Called before each request.
+        follow (bool, optional): Whether the ``next`` cursor of each response
+        is requested too.
+
+    Returns:
+        dict: The measures of the scenario.
+    """
+    timings, queries, rows = [], 0, 0
+    upstream_calls = len(stub.requests)
+    urls = list(urls)
+    while urls:
+        url = urls.pop(0)
+        if before:
+            before()
+
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = client.get(url)
+            timings.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise RuntimeError(f"{url} answered {response.status_code}.")
+
+        content = json.loads(response.content)
+        queries += len(context.captured_queries)
+        rows += len(content["rates"])
+        if follow and content["next"]:
+            urls.append(f"{url.split('&cursor=')[0]}&cursor={quote(content['next'])}")
+
+    elapsed = sum(timings)
+    return {
+        "requests": len(timings),
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p90_ms": percentile(timings, 90) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+        "mean_ms": elapsed / len(timings) * 1000,
+        "queries_per_request": queries / len(timings),
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+        "upstream_calls": len(stub.requests) - upstream_calls,
+    }
+
+
+def run(args) -> dict:
+    """
+    Run every scenario against the seeded test database.
+
+    Args:
+        args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        dict: The results, keyed by scenario.
+    """
+    params = f"&rate_base={args.rate_base}{args.params}"
+    client = Client()
+    results = {}
+
+    seeded, prices = seed_history(args.days)
+    cold_days = RatesService.extract_week_days(
+        LAST_SEEDED_DAY + timedelta(days=1),
+        LAST_SEEDED_DAY + timedelta(days=args.requests * 2),
+    )[: args.requests]
+    first_monday = cold_days[-1] + timedelta(days=7 - cold_days[-1].weekday())
+    cold_weeks = [first_monday + timedelta(weeks=week) for week in range(args.requests)]
+
+    with VATComplyStub(latency=args.latency, rates=prices) as stub:
+        stub.timeseries = args.timeseries
+        VATClient.base_url = stub.url
+        VATClient.supports_timeseries = args.timeseries
+
+        RatesResponseCache.clear()
+        client.get(f"/rates/?date={seeded[-1]}{params}")
+        results["cached"] = run_scenario(
+            client, stub, [f"/rates/?date={seeded[-1]}{params}"] * args.requests
+        )
+        results["warm"] = run_scenario(
+            client,
+            stub,
+            [
+                f"/rates/?date={seeded[-1 - index % len(seeded)]}{params}"
+                for index in range(args.requests)
+            ],
+            before=RatesResponseCache.clear,
+        )
+        results["cold_day"] = run_scenario(
+            client, stub, [f"/rates/?date={item}{params}" for item in cold_days]
+        )
+        results["cold_range"] = run_scenario(
+            client,
+            stub,
+            [
+                f"/rates/?date={monday}&until_date={monday + timedelta(days=4)}{params}"
+                for monday in cold_weeks
+            ],
+        )
+        results["full_history"] = run_scenario(
+            client,
+            stub,
+            [f"/rates/?page_size={RateKeysetPagination.max_page_size}{params}"],
+            follow=True,
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """
+    Print the change of each scenario against a previous result.
+
+    Args:
+        results (dict): The current results.
+        baseline (dict): The previous results.
+        tolerance (float): The slowdown of the p50 latency tolerated, as a
+        fraction.
+
+    Returns:
+        bool: Whether a scenario got slower than the tolerance.
+    """
+    regressed = False
+    for name, result in results.items():
+        if not (previous := baseline.get(name)):
+            continue
+        change = result["p50_ms"] / previous["p50_ms"] - 1
+        flag = ""
+        if change > tolerance:
+            flag, regressed = "  REGRESSION", True
+        print(
+            f"{name:14} p50 {previous['p50_ms']:9.2f}ms -> "
+            f"{result['p50_ms']:9.2f}ms ({change:+.1%}){flag}"
+        )
+    return regressed
+
+
+def main() -> None:
+    """Run the benchmark, print, store and compare its results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=2500)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--rate-base", default="USD")
+    parser.add_argument("--params", default="", help='e.g. "&serializer=fast"')
+    parser.add_argument("--no-timeseries", dest="timeseries", action="store_false")
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        results = run(args)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    print(
+        f"{'scenario':14} {'p50':>9} {'p90':>9} {'p99':>9} {'queries':>8} {'rows/s':>12}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:14} {result['p50_ms']:7.2f}ms {result['p90_ms']:7.2f}ms "
+            f"{result['p99_ms']:7.2f}ms {result['queries_per_request']:8.1f} "
+            f"{result['rows_per_sec']:12,.0f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "meta": {
+                        **vars(args),
+                        "vendor": connection.vendor,
+                        "python": platform.python_version(),
+                        "created": datetime.now(timezone.utc).isoformat(),
+                    },
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark of the /rates/ serializers.
+
+Compares the rows/sec of the DRF RateResponseSerializer with the
+FastRateSerializer, rendering the same synthetic rates to JSON bytes. No
+database is needed.
+
+Usage:
+    python -m benchmarks.bench_serializers --rows 20000 --repeat 5
+"""
+import argparse
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "currency_exchange.settings")
+django.setup()
+
+# pylint: disable=C0413
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from exchange_rates.infra.serializers.fast_rates_serializer import (  # noqa: E402
+    FastRateSerializer,
+)
+from exchange_rates.infra.serializers.rates_response_serializer import (  # noqa: E402
+    RateResponseSerializer,
+)
+from exchange_rates.models import Currency, Rate  # noqa: E402
+
+# pylint: enable=C0413
+
+
+def build_rates(rows: int) -> tuple:
+    """
+    Build synthetic rates, as model instances and as value tuples.
+
+    Args:
+        rows (int): Number of rates.
+
+    Returns:
+        tuple: The currencies keyed by id, the Rate instances and the rows.
+    """
+    now = datetime(2023, 8, 29, 13, 26, 7, tzinfo=timezone.utc)
+    currencies = {
+        currency_id: Currency(
+            id=currency_id,
+            name=f"Currency {currency_id}",
+            short_name=f"C{currency_id:02d}",
+            symbol=f"{currency_id}",
+            created=now,
+            updated=now,
+        )
+        for currency_id in range(1, 33)
+    }
+    base = currencies[1]
+
+    instances, values = [], []
+    for rate_id in range(1, rows + 1):
+        currency = currencies[rate_id % 32 + 1]
+        day = date(2000, 1, 3) + timedelta(days=rate_id // 32)
+        price = Decimal(rate_id % 997) / 100
+        instances.append(
+            Rate(
+                id=rate_id,
+                base=base,
+                currency=currency,
+                date=day,
+                price=price,
+                created=now,
+                updated=now,
+            )
+        )
+        values.append((rate_id, day, price, now, now, base.id, currency.id))
+    return currencies, instances, values
+
+
+def measure(function, repeat: int) -> float:
+    """
+    Returns the best wall time of several runs of a function.
+
+    Args:
+        function (callable): The function to be measured.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: The best run time, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print the rows/sec of each serializer."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    currencies, instances, values = build_rates(args.rows)
+
+    def drf():
+        data = RateResponseSerializer(instances, many=True).data
+        return JSONRenderer().render({"rates": data, "next": None})
+
+    def fast():
+        return FastRateSerializer(currencies).render({"rates": values, "next": None})
+
+    drf_seconds = measure(drf, args.repeat)
+    fast_seconds = measure(fast, args.repeat)
+
+    print(f"rows: {args.rows}")
+    print(f"drf:  {args.rows / drf_seconds:12,.0f} rows/sec")
+    print(f"fast: {args.rows / fast_seconds:12,.0f} rows/sec")
+    print(f"gain: {drf_seconds / fast_seconds:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
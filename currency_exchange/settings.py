@@ -47,6 +47,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "exchange_rates.infra.timing.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -101,6 +102,55 @@ DATABASES = {
     },
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # shared tier of the /rates/ response cache, e.g.
+    # django.core.cache.backends.redis.RedisCache at redis://redis:6379
+    "rates": {
+        "BACKEND": config(
+            "RATES_CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("RATES_CACHE_LOCATION", default="rates"),
+    },
+}
+
+# Logging
+# https://docs.djangoproject.com/en/4.2/topics/logging/
+# JSON lines written to stdout by a background thread, per-row events
+# (``extra={"sample": True}``) kept at LOG_SAMPLE_RATE, records dropped
+# beyond LOG_QUEUE_SIZE waiting to be written
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "filters": {
+        "sampling": {
+            "()": "exchange_rates.infra.log.sampling_filter.SamplingFilter",
+            "rate": config("LOG_SAMPLE_RATE", default=0.01, cast=float),
+        },
+    },
+    "handlers": {
+        "queue": {
+            "()": "exchange_rates.infra.log.queue_handler.QueueLogHandler",
+            "max_size": config("LOG_QUEUE_SIZE", default=10000, cast=int),
+            "filters": ["sampling"],
+        },
+    },
+    "loggers": {
+        "exchange_rates": {
+            "handlers": ["queue"],
+            "level": config("LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
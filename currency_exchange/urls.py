@@ -17,9 +17,15 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from exchange_rates.infra.views.async_rates_view import AsyncRatesView
+from exchange_rates.infra.views.conversion_view import ConversionBatchView
+from exchange_rates.infra.views.rates_export_view import RatesExportView
 from exchange_rates.infra.views.rates_view import RatesView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("rates/", RatesView.as_view(), name="payment_tokens"),
+    path("rates/async/", AsyncRatesView.as_view(), name="rates_async"),
+    path("rates/export/", RatesExportView.as_view(), name="rates_export"),
+    path("convert/batch", ConversionBatchView.as_view(), name="convert_batch"),
 ]
@@ -11,26 +11,46 @@ import Exporting from "highcharts/modules/exporting";
 // Initialize exporting module.
 Exporting(Highcharts);
 
+const RATES_URL = "http://localhost:8000/rates/";
+const PAGE_SIZE = 1000;
+
+// Read every page of the columnar rates, following the `next` cursor until
+// the last page, and merge them. Currencies are keyed by id on every page.
+async function fetchAllRates() {
+  const merged = { currencies: {}, dates: [], currency_ids: [], prices: [] };
+  let cursor = null;
+  do {
+    const params = { format: "columnar", page_size: PAGE_SIZE };
+    if (cursor) {
+      params.cursor = cursor;
+    }
+    const { data } = await axios(RATES_URL, { params });
+    Object.assign(merged.currencies, data.currencies);
+    merged.dates.push(...data.dates);
+    merged.currency_ids.push(...data.currency_ids);
+    merged.prices.push(...data.prices);
+    cursor = data.next;
+  } while (cursor);
+  return merged;
+}
+
 function App() {
   const finalRates = [];
   useEffect(() => {
-    void axios("http://localhost:8000/rates").then((response) => {
+    void fetchAllRates().then((rates) => {
       const rateList = ["EUR", "USD", "JPY", "BRL"];
       const rateDict = { rates: [] };
+      const { currencies, dates, currency_ids, prices } = rates;
 
       rateList.forEach(function (item) {
         const tempData = [];
         rateDict.rates.push({ name: item });
 
-        response.data.rates
-          .filter(function (rate) {
-            return rate.currency.short_name === item;
-          })
-          .forEach((it) => {
-            // console.log(`{${item}: ${it.price}}`);
-            // debugger;
-            tempData.push([Date(it.date), it.price]);
-          });
+        currency_ids.forEach((currencyId, index) => {
+          if (currencies[currencyId].short_name === item) {
+            tempData.push([Date(dates[index]), prices[index]]);
+          }
+        });
         const temp = rateDict.rates.filter((at) => {
           return at.name === item;
         })[0];
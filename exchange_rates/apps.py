@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ExchangeRatesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "exchange_rates"
+
+    def ready(self):
+        # pylint: disable=C0415
+        from exchange_rates import signals  # noqa: F401
+        from exchange_rates.infra.timing import request_timings  # noqa: F401
@@ -3,3 +3,4 @@
 """
 from .currency import Currency  # no-qa
 from .rate import Rate  # no-qa
+from .rate_matrix import RateMatrix  # no-qa
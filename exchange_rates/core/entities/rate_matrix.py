@@ -0,0 +1,261 @@
+"""Rate Matrix Entity
+"""
+from datetime import date as Date
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+
+
+class RateMatrix:
+    """
+    Exchange rates held as a ``date x currency`` NumPy matrix, for analytics
+    computed in batch instead of row by row.
+
+    Row ``i`` holds the prices of every currency on ``dates[i]`` against the
+    ``base`` currency, NaN where a currency has no rate on a date. Cross
+    rates, conversions, returns and rolling averages are computed over whole
+    columns at once.
+
+    NumPy is an optional dependency (the ``analytics`` extra).
+
+    Attributes:
+        base (str): The short name of the base currency.
+        dates (np.ndarray): The sorted dates of the rows, as datetime64[D].
+        currencies (list): The short names of the columns.
+        prices (np.ndarray): The ``date x currency`` float64 prices.
+
+    Usage:
+        matrix = RatesService(base_rate="EUR").get_rate_matrix(date, until_date)
+        usd_brl = matrix.rate("USD", "BRL")
+        amounts = matrix.convert([10, 20], ["USD", "BRL"], ["JPY", "EUR"], dates)
+    """
+
+    def __init__(self, base: str, dates, currencies: list, prices) -> None:
+        """
+        Initialize a RateMatrix.
+
+        Args:
+            base (str): The short name of the base currency.
+            dates (array-like): The sorted dates of the rows.
+            currencies (list): The short names of the columns.
+            prices (array-like): The ``date x currency`` prices.
+
+        Raises:
+            Exception: If NumPy is not installed or the shapes do not match.
+        """
+        if np is None:
+            raise Exception("RateMatrix requires numpy (the analytics extra).")
+
+        self.base = base
+        self.dates = self.to_days(dates)
+        self.currencies = list(currencies)
+        self.prices = np.asarray(prices, dtype=np.float64).reshape(
+            len(self.dates), len(self.currencies)
+        )
+        self._columns = {currency: index for index, currency in enumerate(currencies)}
+
+    @classmethod
+    def from_rows(cls, base: str, rows, currency_names: dict) -> "RateMatrix":
+        """
+        Build a matrix from rate rows.
+
+        Args:
+            base (str): The short name of the base currency of the rows.
+            rows (iterable): ``(date, currency_id, price)`` tuples.
+            currency_names (dict): The currency short names keyed by id.
+
+        Returns:
+            RateMatrix: The rates of the rows.
+        """
+        if np is None:
+            raise Exception("RateMatrix requires numpy (the analytics extra).")
+
+        dates, currency_ids, prices = [], [], []
+        for date, currency_id, price in rows:
+            dates.append(date)
+            currency_ids.append(currency_id)
+            prices.append(price)
+
+        row_dates, row_index = np.unique(cls.to_days(dates), return_inverse=True)
+        column_ids, column_index = np.unique(
+            np.asarray(currency_ids, dtype=np.int64), return_inverse=True
+        )
+
+        matrix = np.full((len(row_dates), len(column_ids)), np.nan)
+        matrix[row_index, column_index] = np.asarray(prices, dtype=np.float64)
+        return cls(
+            base,
+            row_dates,
+            [currency_names[currency_id] for currency_id in column_ids.tolist()],
+            matrix,
+        )
+
+    def column(self, currency: str) -> int:
+        """
+        Get the column of a currency.
+
+        Args:
+            currency (str): The short name of the currency.
+
+        Returns:
+            int: The index of the column.
+
+        Raises:
+            Exception: If the matrix holds no rate of the currency.
+        """
+        try:
+            return self._columns[currency]
+        except KeyError as err:
+            raise Exception(f"No rates of {currency}.") from err
+
+    def rows(self, dates) -> "np.ndarray":
+        """
+        Get the rows of several dates.
+
+        Args:
+            dates (array-like): The dates.
+
+        Returns:
+            np.ndarray: The index of the row of each date.
+
+        Raises:
+            Exception: If the matrix holds no rates of a date.
+        """
+        dates = self.to_days(dates)
+        index = np.searchsorted(self.dates, dates)
+        found = index < len(self.dates)
+        found[found] = self.dates[index[found]] == dates[found]
+        if not found.all():
+            raise Exception(f"No rates on {dates[~found][0]}.")
+        return index
+
+    def rate(self, base: str, currency: str) -> "np.ndarray":
+        """
+        Get the cross rate of two currencies on every date.
+
+        Args:
+            base (str): The short name of the base currency.
+            currency (str): The short name of the target currency.
+
+        Returns:
+            np.ndarray: The price of ``currency`` in ``base`` on each date.
+        """
+        return self.prices[:, self.column(currency)] / self.prices[:, self.column(base)]
+
+    def cross_rates(self, base: str) -> "RateMatrix":
+        """
+        Express every rate against another base currency.
+
+        Args:
+            base (str): The short name of the new base currency.
+
+        Returns:
+            RateMatrix: The cross rates.
+        """
+        column = self.column(base)
+        return RateMatrix(
+            base,
+            self.dates,
+            self.currencies,
+            self.prices / self.prices[:, [column]],
+        )
+
+    def convert(self, amounts, from_currencies, to_currencies, dates) -> "np.ndarray":
+        """
+        Convert many amounts at once, each one between its own currencies on
+        its own date.
+
+        Args:
+            amounts (array-like): The amounts to be converted.
+            from_currencies (str or array-like): The short names of the
+            currencies of the amounts.
+            to_currencies (str or array-like): The short names of the
+            currencies the amounts are converted to.
+            dates (date or array-like): The dates of the rates used.
+
+        Returns:
+            np.ndarray: The converted amounts, NaN where a rate is missing.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        size = amounts.shape
+        rows = np.broadcast_to(self.rows(dates), size)
+        from_columns = np.broadcast_to(self._columns_of(from_currencies), size)
+        to_columns = np.broadcast_to(self._columns_of(to_currencies), size)
+        return amounts * self.prices[rows, to_columns] / self.prices[rows, from_columns]
+
+    def returns(self, periods: int = 1, log: bool = False) -> "np.ndarray":
+        """
+        Compute the returns of every currency.
+
+        Args:
+            periods (int, optional): The number of rows between the prices
+            compared.
+            log (bool, optional): Whether log returns are computed.
+
+        Returns:
+            np.ndarray: The ``(dates - periods) x currency`` returns, row
+            ``i`` holding the return up to ``dates[i + periods]``.
+        """
+        ratio = self.prices[periods:] / self.prices[:-periods]
+        return np.log(ratio) if log else ratio - 1
+
+    def rolling_mean(self, window: int) -> "np.ndarray":
+        """
+        Compute the rolling average price of every currency.
+
+        Args:
+            window (int): The number of rows averaged.
+
+        Returns:
+            np.ndarray: The ``(dates - window + 1) x currency`` averages, row
+            ``i`` holding the average up to ``dates[i + window - 1]``.
+        """
+        if window > len(self.dates):
+            return np.empty((0, len(self.currencies)))
+        return np.lib.stride_tricks.sliding_window_view(
+            self.prices, window, axis=0
+        ).mean(axis=-1)
+
+    def _columns_of(self, currencies) -> "np.ndarray":
+        """
+        Get the columns of one or several currencies.
+
+        Args:
+            currencies (str or array-like): The short names of the currencies.
+
+        Returns:
+            np.ndarray: The index of the column of each currency.
+        """
+        if isinstance(currencies, str):
+            return np.asarray(self.column(currencies))
+        return np.fromiter(map(self.column, currencies), dtype=np.intp)
+
+    @staticmethod
+    def to_days(dates) -> "np.ndarray":
+        """
+        Convert one or several dates to a datetime64[D] array.
+
+        ``datetime.date`` objects are converted through their ordinal, much
+        faster than NumPy parses them one by one.
+
+        Args:
+            dates (date or array-like): The dates, as ``datetime.date``,
+            ISO strings or datetime64.
+
+        Returns:
+            np.ndarray: The dates.
+        """
+        if isinstance(dates, Date):
+            dates = [dates]
+        if isinstance(dates, np.ndarray):
+            return np.atleast_1d(dates.astype("datetime64[D]"))
+
+        dates = list(dates)
+        if dates and isinstance(dates[0], Date):
+            ordinals = np.fromiter(map(Date.toordinal, dates), np.int64, len(dates))
+            return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+        return np.asarray(dates, dtype="datetime64[D]")
@@ -0,0 +1,94 @@
+"""Abstract Rates Provider
+"""
+from abc import ABC, abstractmethod
+
+
+class TimeseriesNotSupported(Exception):
+    """Raised when a provider can not serve a range of days in one call."""
+
+
+class RatesProvider(ABC):
+    """
+    Abstract base class for the upstream providers of exchange rates.
+
+    A provider is built for a base currency and a date, and answers with
+    VATcomply-like payloads.
+
+    Attributes:
+        supports_timeseries (bool): Whether the provider can serve a range of
+        days with a single call.
+    """
+
+    supports_timeseries = True
+
+    @abstractmethod
+    def rate(self) -> dict:
+        """
+        Fetch the exchange rates of the provider's base currency and date.
+
+        Returns:
+            dict: A payload like ``{"date": ..., "base": ..., "rates": {}}``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def timeseries(self, until_date) -> dict:
+        """
+        Fetch the exchange rates of every day from the provider's date up to
+        the given date, with a single call.
+
+        Args:
+            until_date (datetime.date): The last day to be fetched.
+
+        Returns:
+            dict: A payload like ``{"base": ..., "start_date": ...,
+            "end_date": ..., "rates": {"<iso date>": {}}}``. Days without
+            published rates are left out.
+
+        Raises:
+            TimeseriesNotSupported: If the provider can not serve ranges.
+        """
+        raise NotImplementedError
+
+
+class AsyncRatesProvider(ABC):
+    """
+    Abstract base class for the asyncio upstream providers of exchange rates.
+
+    Like RatesProvider, but its calls are coroutines, so waiting for the
+    upstream service does not hold a thread.
+
+    Attributes:
+        supports_timeseries (bool): Whether the provider can serve a range of
+        days with a single call.
+    """
+
+    supports_timeseries = True
+
+    @abstractmethod
+    async def rate(self) -> dict:
+        """
+        Fetch the exchange rates of the provider's base currency and date.
+
+        Returns:
+            dict: A payload like ``{"date": ..., "base": ..., "rates": {}}``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def timeseries(self, until_date) -> dict:
+        """
+        Fetch the exchange rates of every day from the provider's date up to
+        the given date, with a single call.
+
+        Args:
+            until_date (datetime.date): The last day to be fetched.
+
+        Returns:
+            dict: A payload like ``{"base": ..., "start_date": ...,
+            "end_date": ..., "rates": {"<iso date>": {}}}``.
+
+        Raises:
+            TimeseriesNotSupported: If the provider can not serve ranges.
+        """
+        raise NotImplementedError
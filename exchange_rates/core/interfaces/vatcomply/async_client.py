@@ -0,0 +1,208 @@
+"""An asyncio client to consume a VAT service api
+https://www.vatcomply.com/documentation
+"""
+import asyncio
+import time
+import weakref
+from datetime import datetime
+
+import httpx
+from decouple import config
+
+from exchange_rates.core.interfaces.rates_provider import (
+    AsyncRatesProvider,
+    TimeseriesNotSupported,
+)
+from exchange_rates.core.interfaces.vatcomply.client import VATClient, VATClientError
+
+codes = httpx.codes
+
+
+class AsyncVATClient(AsyncRatesProvider):
+    """
+    An asyncio client for retrieving VAT rates, the counterpart of VATClient
+    for async views.
+
+    Calls are coroutines over a connection-pooled ``httpx.AsyncClient``
+    shared by every client of the running event loop, so a single process can
+    wait on hundreds of upstream calls without holding a thread for each.
+    Connection errors, timeouts and 5xx responses are retried with
+    exponential backoff, and the calls are recorded in ``VATClient.metrics``.
+
+    Attributes:
+        base_url (str): The base URL for the VAT service.
+        base_rate (str): The base currency code for VAT rate conversions.
+        date (datetime.date): The date for which VAT rates are to be fetched.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for a response.
+        max_retries (int): Retries made on connection errors and 5xx.
+        backoff_factor (float): Backoff factor between retries.
+        pool_size (int): Maximum connections opened to the VAT service.
+        timeseries_path (str): The path of the timeseries endpoint.
+        supports_timeseries (bool): Whether the timeseries endpoint is
+        available (``VAT_TIMESERIES_ENABLED``). VATcomply has none, so it is
+        off by default. A 404 turns it off for the answering client only.
+        metrics (ClientMetrics): Latency metrics of the calls made.
+
+    Usage:
+        client = AsyncVATClient(base_rate="USD")
+        vat_rates = await client.rate()
+    """
+
+    base_url = VATClient.base_url
+    connect_timeout = VATClient.connect_timeout
+    read_timeout = VATClient.read_timeout
+    max_retries = VATClient.max_retries
+    backoff_factor = VATClient.backoff_factor
+    pool_size = config("VAT_ASYNC_POOL_SIZE", default=100, cast=int)
+    timeseries_path = VATClient.timeseries_path
+    supports_timeseries = VATClient.supports_timeseries
+
+    metrics = VATClient.metrics
+
+    _clients = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self, base_rate: str = "USD", date=None, client: httpx.AsyncClient = None
+    ) -> None:
+        """
+        Initializes a new instance of the AsyncVATClient.
+
+        Args:
+            base_rate (str, optional): The base currency code for VAT
+            rate conversions.
+            date (datetime.date, optional): The date for which VAT
+            rates are to be fetched.
+            client (httpx.AsyncClient, optional): The client used for the
+            calls. Defaults to the client shared in the running event loop.
+        """
+        self.base_rate = base_rate
+
+        if not date:
+            date = datetime.now().date()
+
+        self.date = date
+        self.client = client
+
+    @classmethod
+    def build_client(cls) -> httpx.AsyncClient:
+        """
+        Builds a connection-pooled async client.
+
+        Returns:
+            httpx.AsyncClient: The configured client.
+        """
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(cls.read_timeout, connect=cls.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=cls.pool_size,
+                max_keepalive_connections=cls.pool_size,
+            ),
+        )
+
+    @classmethod
+    def shared_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the client shared in the running event loop, building it
+        once per loop.
+
+        Returns:
+            httpx.AsyncClient: The shared client.
+        """
+        loop = asyncio.get_running_loop()
+        if (client := cls._clients.get(loop)) is None:
+            client = cls._clients[loop] = cls.build_client()
+        return client
+
+    async def rate(self):
+        """
+        Fetches VAT rates for the specified base currency and date.
+
+        Returns:
+            dict: A dictionary containing VAT rates for different currencies.
+
+        Raises:
+            VATClientError: If the VAT service could not be reached or did
+            not answer successfully, after the retries.
+        """
+        url = f"{self.base_url}/rates"
+
+        querystring = {"base": self.base_rate, "date": self.date.isoformat()}
+        return await self._get(url, querystring)
+
+    async def timeseries(self, until_date):
+        """
+        Fetches VAT rates of every day from the client's date up to the given
+        date, with a single call.
+
+        Args:
+            until_date (datetime.date): The last day to be fetched.
+
+        Returns:
+            dict: A dictionary containing VAT rates for different currencies,
+            keyed by ISO date.
+
+        Raises:
+            TimeseriesNotSupported: If the VAT service has no timeseries
+            endpoint.
+            VATClientError: If the VAT service could not be reached or did
+            not answer successfully, after the retries.
+        """
+        if not self.supports_timeseries:
+            raise TimeseriesNotSupported("VAT service does not serve ranges.")
+
+        url = f"{self.base_url}{self.timeseries_path}"
+
+        querystring = {
+            "base": self.base_rate,
+            "start_date": self.date.isoformat(),
+            "end_date": until_date.isoformat(),
+        }
+        try:
+            return await self._get(url, querystring)
+        except VATClientError as err:
+            if err.status_code != codes.NOT_FOUND:
+                raise
+            self.supports_timeseries = False
+            raise TimeseriesNotSupported("VAT service does not serve ranges.") from err
+
+    async def _get(self, url: str, querystring: dict) -> dict:
+        """
+        Calls the VAT service, retrying failed calls with exponential backoff.
+
+        Args:
+            url (str): The url to be called.
+            querystring (dict): The query parameters of the call.
+
+        Returns:
+            dict: The decoded JSON response.
+
+        Raises:
+            VATClientError: If the call still failed after the retries.
+        """
+        client = self.client or self.shared_client()
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
+            started = time.perf_counter()
+            try:
+                response = await client.get(url, params=querystring)
+            except httpx.TransportError as err:
+                self.metrics.record(time.perf_counter() - started, failed=True)
+                error = VATClientError(f"VAT service unavailable: {err!r}")
+                continue
+
+            failed = not response.is_success
+            self.metrics.record(time.perf_counter() - started, failed=failed)
+            if not failed:
+                return response.json()
+
+            error = VATClientError(
+                f"VAT service answered with status {response.status_code}.",
+                response.status_code,
+            )
+            if response.status_code < codes.INTERNAL_SERVER_ERROR:
+                break
+
+        raise error
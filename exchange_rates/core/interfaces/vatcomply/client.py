@@ -1,37 +1,145 @@
 """A client to consume a VAT service api
 https://www.vatcomply.com/documentation
 """
+import threading
+import time
 from datetime import datetime
 
 import requests
 from decouple import config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from exchange_rates.core.interfaces.rates_provider import (
+    RatesProvider,
+    TimeseriesNotSupported,
+)
+from exchange_rates.infra.timing.request_timings import RequestTimings
 
 codes = requests.codes
 
 
-class VATClient:
+class VATClientError(Exception):
+    """Raised when the VAT service can not provide the requested rates.
+
+    Attributes:
+        status_code (int): The status answered by the VAT service, if any.
+    """
+
+    def __init__(self, message: str, status_code: int = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ClientMetrics:
+    """
+    Thread-safe latency metrics of the calls made to the VAT service.
+
+    Attributes:
+        calls (int): Number of calls made.
+        errors (int): Number of calls that failed.
+        total_seconds (float): Time spent on all the calls.
+        last_seconds (float): Time spent on the last call.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty metrics.
+        """
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        """
+        Record a call to the VAT service, in the process metrics and in the
+        timings of the current request.
+
+        Args:
+            seconds (float): Time spent on the call.
+            failed (bool, optional): Whether the call failed.
+        """
+        with self._lock:
+            self.calls += 1
+            self.errors += int(failed)
+            self.total_seconds += seconds
+            self.last_seconds = seconds
+        RequestTimings.record("upstream", seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current metrics.
+
+        Returns:
+            dict: The calls, errors, total, average and last call seconds.
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_seconds": self.total_seconds,
+                "average_seconds": self.total_seconds / self.calls
+                if self.calls
+                else 0.0,
+                "last_seconds": self.last_seconds,
+            }
+
+
+class VATClient(RatesProvider):
     """
     A client for retrieving VAT (Value Added Tax) rates.
 
     This client allows fetching VAT rates for different currencies and dates
-    from a specified base URL.
+    from a specified base URL. Every instance shares a connection-pooled,
+    keep-alive session that retries connection errors and 5xx responses with
+    exponential backoff, and every call is bounded by connect/read timeouts.
+    Ranges of days can be fetched with a single call to the timeseries
+    endpoint, when the service provides one.
 
     Attributes:
         base_url (str): The base URL for the VAT service.
         base_rate (str): The base currency code for VAT rate conversions.
         date (datetime.date): The date for which VAT rates are to be fetched.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for a response.
+        max_retries (int): Retries made on connection errors and 5xx.
+        backoff_factor (float): Backoff factor between retries.
+        pool_size (int): Maximum connections kept alive to the VAT service.
+        timeseries_path (str): The path of the timeseries endpoint.
+        supports_timeseries (bool): Whether the timeseries endpoint is
+        available (``VAT_TIMESERIES_ENABLED``). VATcomply has none, so it is
+        off by default. A 404 turns it off for the answering client only.
+        metrics (ClientMetrics): Latency metrics of the calls made.
 
     Methods:
         rate(): Fetches VAT rates for the specified base currency and date.
+        timeseries(until_date): Fetches VAT rates of every day up to a date.
 
     Usage:
         client = VATClient(base_rate="USD")
         vat_rates = client.rate()
+        vat_rates_by_day = client.timeseries(until_date=date)
     """
 
     base_url = config("VAT_BASE_URL")
+    connect_timeout = config("VAT_CONNECT_TIMEOUT", default=3.05, cast=float)
+    read_timeout = config("VAT_READ_TIMEOUT", default=10.0, cast=float)
+    max_retries = config("VAT_MAX_RETRIES", default=3, cast=int)
+    backoff_factor = config("VAT_BACKOFF_FACTOR", default=0.3, cast=float)
+    pool_size = config("VAT_POOL_SIZE", default=10, cast=int)
+    timeseries_path = config("VAT_TIMESERIES_PATH", default="/timeseries")
+    supports_timeseries = config("VAT_TIMESERIES_ENABLED", default=False, cast=bool)
+
+    metrics = ClientMetrics()
 
-    def __init__(self, base_rate: str = "USD", date=None) -> None:
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(
+        self, base_rate: str = "USD", date=None, session: requests.Session = None
+    ) -> None:
         """
         Initializes a new instance of the VATClient.
 
@@ -40,6 +148,8 @@ class VATClient:
             rate conversions.
             date (datetime.date, optional): The date for which VAT
             rates are to be fetched.
+            session (requests.Session, optional): The session used for the
+            calls. Defaults to the session shared by every client.
         """
         self.base_rate = base_rate
 
@@ -47,6 +157,52 @@ class VATClient:
             date = datetime.now().date()
 
         self.date = date
+        self.session = session or self.shared_session()
+
+    @classmethod
+    def build_session(cls) -> requests.Session:
+        """
+        Builds a connection-pooled session retrying failed calls.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        retry = Retry(
+            total=cls.max_retries,
+            backoff_factor=cls.backoff_factor,
+            status_forcelist=[
+                codes.INTERNAL_SERVER_ERROR,
+                codes.BAD_GATEWAY,
+                codes.SERVICE_UNAVAILABLE,
+                codes.GATEWAY_TIMEOUT,
+            ],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=cls.pool_size,
+            pool_maxsize=cls.pool_size,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """
+        Returns the session shared by every client, building it once.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = cls.build_session()
+        return cls._session
 
     def rate(self):
         """
@@ -54,18 +210,89 @@ class VATClient:
 
         Returns:
             dict: A dictionary containing VAT rates for different currencies.
+
+        Raises:
+            VATClientError: If the VAT service could not be reached or did
+            not answer successfully, after the retries.
         """
         url = f"{self.base_url}/rates"
 
         querystring = {"base": self.base_rate, "date": self.date.isoformat()}
-        response = requests.get(url, params=querystring)
+        return self._get(url, querystring)
+
+    def timeseries(self, until_date):
+        """
+        Fetches VAT rates of every day from the client's date up to the given
+        date, with a single call.
 
-        if response.status_code not in [
+        Args:
+            until_date (datetime.date): The last day to be fetched.
+
+        Returns:
+            dict: A dictionary containing VAT rates for different currencies,
+            keyed by ISO date.
+
+        Raises:
+            TimeseriesNotSupported: If the VAT service has no timeseries
+            endpoint.
+            VATClientError: If the VAT service could not be reached or did
+            not answer successfully, after the retries.
+        """
+        if not self.supports_timeseries:
+            raise TimeseriesNotSupported("VAT service does not serve ranges.")
+
+        url = f"{self.base_url}{self.timeseries_path}"
+
+        querystring = {
+            "base": self.base_rate,
+            "start_date": self.date.isoformat(),
+            "end_date": until_date.isoformat(),
+        }
+        try:
+            return self._get(url, querystring)
+        except VATClientError as err:
+            if err.status_code != codes.NOT_FOUND:
+                raise
+            self.supports_timeseries = False
+            raise TimeseriesNotSupported("VAT service does not serve ranges.") from err
+
+    def _get(self, url: str, querystring: dict) -> dict:
+        """
+        Calls the VAT service, recording the latency of the call.
+
+        Args:
+            url (str): The url to be called.
+            querystring (dict): The query parameters of the call.
+
+        Returns:
+            dict: The decoded JSON response.
+
+        Raises:
+            VATClientError: If the call failed.
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.get(
+                url,
+                params=querystring,
+                timeout=(self.connect_timeout, self.read_timeout),
+            )
+        except requests.RequestException as err:
+            self.metrics.record(time.perf_counter() - started, failed=True)
+            raise VATClientError(f"VAT service unavailable: {err}") from err
+
+        failed = response.status_code not in [
             codes.OK,
             codes.CREATED,
             codes.ACCEPTED,
             codes.NO_CONTENT,
-        ]:
-            return NotImplementedError
+        ]
+        self.metrics.record(time.perf_counter() - started, failed=failed)
+
+        if failed:
+            raise VATClientError(
+                f"VAT service answered with status {response.status_code}.",
+                response.status_code,
+            )
 
         return response.json()
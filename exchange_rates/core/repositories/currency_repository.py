@@ -32,3 +32,25 @@ class CurrencyRepository(ABC):
             CurrencyEntity: The corresponding currency entity.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_currencies(self) -> list:
+        """Retrieve every currency entity.
+
+        Returns:
+            list: The currency entities.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_currencies_by_short_names(self, short_names: list) -> dict:
+        """Retrieve several currency entities at once using their short names.
+
+        Args:
+            short_names (list): The short names or codes of the currencies.
+
+        Returns:
+            dict: The currency entities found, keyed by short name. Unknown
+            short names are left out.
+        """
+        raise NotImplementedError
@@ -27,6 +27,154 @@ class RateRepository(ABC):
         """
         return NotImplementedError
 
+    @abstractmethod
+    def get_rates_version(self, date: str = None, until_date: str = None) -> dict:
+        """
+        Summarize the exchange rate data of a date range without loading it.
+
+        Args:
+            date (str, optional): The first date of the range.
+            until_date (str, optional): The last date of the range.
+
+        Returns:
+            dict: The ``count`` of rates and their ``last_modified`` time.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def get_prices_by_date(self, currency, dates: list) -> dict:
+        """
+        Retrieve the price of a currency on several dates.
+
+        Args:
+            currency: The target currency.
+            dates (list): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date. Dates without a rate are left out.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def get_covered_dates(self, dates: list, expired_before) -> set:
+        """
+        Tell which of several dates need no fetch: the dates with stored
+        rates, or fetched already without rates.
+
+        Args:
+            dates (list): The dates to be checked.
+            expired_before (datetime): Fetches without rates recorded during
+            their own day, and before this moment, are expired.
+
+        Returns:
+            set: The covered dates.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def get_fetched_dates(self, dates: list) -> set:
+        """
+        Tell which of several dates hold rates: the dates with stored rates,
+        or fetched already with rates.
+
+        Args:
+            dates (list): The dates to be checked.
+
+        Returns:
+            set: The dates holding rates.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def get_day_prices(self, dates: list) -> dict:
+        """
+        Retrieve the prices of every currency on several dates.
+
+        Args:
+            dates (list): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date, then by currency id. Dates without
+            rates are left out.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def iter_rates(
+        self,
+        fields: tuple,
+        date: str = None,
+        until_date: str = None,
+        chunk_size: int = 2000,
+    ):
+        """
+        Iterate over the exchange rate data of an unbounded date range,
+        without loading it all at once.
+
+        Args:
+            fields (tuple): The rate fields read, in tuple order.
+            date (str, optional): The first date of the range.
+            until_date (str, optional): The last date of the range.
+            chunk_size (int, optional): Rates read from the database at once.
+
+        Returns:
+            Iterator: The rates, as tuples of ``fields``.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def get_imprecise_dates(self, date: str = None, until_date: str = None) -> list:
+        """
+        Find the dates holding rates stored with 2 decimal places only, by
+        the schema preceding the 10 decimal places prices.
+
+        Args:
+            date (str, optional): The first date of the range.
+            until_date (str, optional): The last date of the range.
+
+        Returns:
+            list: The sorted dates.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def rederive_rates(self, dates: list) -> int:
+        """
+        Recompute the stored rates of every other base from the rates of the
+        repository's base, on several dates.
+
+        Args:
+            dates (list): The dates of the rates.
+
+        Returns:
+            int: The number of rates recomputed.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
     @abstractmethod
     def create_rate(self, base_rate: str, currency: str, date: str, price: float):
         """
@@ -45,3 +193,44 @@ class RateRepository(ABC):
             NotImplementedError: This method must be implemented by subclasses.
         """
         return NotImplementedError
+
+    @abstractmethod
+    def bulk_create_rates(self, base_rate: str, rates: list, fetched_days: list = None):
+        """
+        Create several exchange rate entries at once.
+
+        Args:
+            base_rate (str): The currency base to use on exchange rates
+            rates (list): A list of dicts with the currency, date and price
+            of each exchange rate to be created.
+            fetched_days (list, optional): A list of dicts with the date,
+            status and effective date of each day fetched.
+
+        Returns:
+            list: The created rate entries.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
+
+    @abstractmethod
+    def load_rates(self, base_rate: str, rates: list, fetched_days: list = None) -> int:
+        """
+        Load a large batch of exchange rates, e.g. imported from historical
+        files, updating the ones already stored.
+
+        Args:
+            base_rate (str): The currency base to use on exchange rates
+            rates (list): A list of dicts with the currency, date and price
+            of each exchange rate to be loaded.
+            fetched_days (list, optional): A list of dicts with the date,
+            status and effective date of each day loaded.
+
+        Returns:
+            int: The number of rates loaded.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        return NotImplementedError
@@ -0,0 +1,208 @@
+"""Async Rate Service
+"""
+import asyncio
+import weakref
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from decouple import config
+
+from exchange_rates.core.interfaces.rates_provider import (
+    AsyncRatesProvider,
+    TimeseriesNotSupported,
+)
+from exchange_rates.core.interfaces.vatcomply.async_client import AsyncVATClient
+from exchange_rates.core.services.rates_service import RatesService
+
+
+class AsyncRatesService:
+    """
+    A service class fetching the missing exchange rates of async views
+    without holding a thread while the rates provider answers.
+
+    Reads and writes still go through RatesService, on the thread Django
+    runs the ORM on, while the upstream calls are coroutines of an
+    AsyncRatesProvider, ``max_workers`` of them in flight at once.
+    Concurrent requests of the same process missing the same day share a
+    single fetch, and the rates are stored with an upsert, so a day fetched
+    by two processes at once is still stored once.
+
+    Attributes:
+        max_workers (int): Maximum number of upstream calls in flight for a
+        single fetch.
+
+    Usage:
+        service = await AsyncRatesService.create(base_rate="USD")
+        await service.prefetch([date(2023, 8, 21)])
+    """
+
+    max_workers = config("VAT_ASYNC_MAX_WORKERS", default=20, cast=int)
+
+    _in_flight = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        rates_service: RatesService,
+        rates_provider: type[AsyncRatesProvider] = AsyncVATClient,
+    ) -> None:
+        """
+        Initialize the AsyncRatesService.
+
+        Args:
+            rates_service (RatesService): The service reading and storing the
+            rates.
+            rates_provider (type[AsyncRatesProvider], optional): The provider
+            class used to fetch missing rates. Defaults to AsyncVATClient.
+        """
+        self.rates_service = rates_service
+        self._rates_provider = rates_provider
+
+    @classmethod
+    async def create(
+        cls,
+        base_rate: str,
+        rates_provider: type[AsyncRatesProvider] = AsyncVATClient,
+    ) -> "AsyncRatesService":
+        """
+        Build an AsyncRatesService, resolving its currencies off the event
+        loop.
+
+        Args:
+            base_rate (str): The short name of the base currency.
+            rates_provider (type[AsyncRatesProvider], optional): The provider
+            class used to fetch missing rates. Defaults to AsyncVATClient.
+
+        Returns:
+            AsyncRatesService: The service.
+
+        Raises:
+            Exception: If the base currency does not exist.
+        """
+        rates_service = await sync_to_async(RatesService)(base_rate=base_rate)
+        return cls(rates_service, rates_provider)
+
+    async def prefetch(self, days: list) -> list:
+        """
+        Fetch and store the canonical rates of the days not stored yet.
+
+        Days already being fetched for another request of the same event
+        loop are awaited instead of fetched again.
+
+        Args:
+            days (list): The dates to be prefetched.
+
+        Returns:
+            list: The dates this call fetched.
+        """
+        days = sorted(set(days))
+        missing_days = await sync_to_async(self.rates_service.get_missing_days)(days)
+        if not missing_days:
+            return []
+
+        base = self.rates_service.canonical_base.short_name
+        in_flight = self._in_flight.setdefault(asyncio.get_running_loop(), {})
+        fetched_days = [item for item in missing_days if (base, item) not in in_flight]
+        if fetched_days:
+            task = asyncio.ensure_future(self._fetch_and_store(fetched_days))
+            for item in fetched_days:
+                in_flight[(base, item)] = task
+            task.add_done_callback(
+                lambda _: [in_flight.pop((base, item), None) for item in fetched_days]
+            )
+
+        await asyncio.gather(*{in_flight[(base, item)] for item in missing_days})
+        return fetched_days
+
+    async def _fetch_and_store(self, days: list) -> None:
+        """
+        Fetch the exchange rates of several days and store them.
+
+        Args:
+            days (list): The dates to be fetched.
+        """
+        response_rates = await self.fetch_rates(days)
+        await sync_to_async(self.rates_service.get_or_create_rates)(response_rates)
+
+    async def fetch_rates(self, days: list) -> dict:
+        """
+        Fetch the exchange rates of several days from the rates provider.
+
+        Like ``RatesService.fetch_rates``, runs of consecutive days are
+        fetched with a single timeseries call each, when the provider
+        supports it, and the remaining days one by one, concurrently.
+
+        Args:
+            days (list): The dates to be fetched.
+
+        Returns:
+            dict: The API responses keyed by the date they were fetched for.
+        """
+        response_rates = {}
+
+        ranges = [days for days in RatesService.split_in_ranges(days) if len(days) > 1]
+        if ranges and self._rates_provider.supports_timeseries:
+            for response in await self._gather(self.fetch_timeseries, ranges):
+                response_rates.update(response)
+
+        remaining_days = [item for item in days if item not in response_rates]
+        response_rates.update(
+            zip(remaining_days, await self._gather(self.fetch_rate, remaining_days))
+        )
+        return response_rates
+
+    async def fetch_rate(self, item: datetime) -> dict:
+        """
+        Fetch the exchange rates of a single day from the rates provider.
+
+        Args:
+            item (datetime): The date to be fetched.
+
+        Returns:
+            dict: The API response containing exchange rates.
+        """
+        client = self._rates_provider(
+            base_rate=self.rates_service.canonical_base.short_name, date=item
+        )
+        return await client.rate()
+
+    async def fetch_timeseries(self, days: list) -> dict:
+        """
+        Fetch the exchange rates of a run of consecutive days with a single
+        call to the rates provider.
+
+        Args:
+            days (list): The consecutive dates to be fetched.
+
+        Returns:
+            dict: Single day API responses keyed by date, without rates for
+            the days the provider has none for. Every day is left out when it
+            can not serve ranges.
+        """
+        client = self._rates_provider(
+            base_rate=self.rates_service.canonical_base.short_name, date=days[0]
+        )
+        try:
+            response = await client.timeseries(until_date=days[-1])
+        except TimeseriesNotSupported:
+            return {}
+        return RatesService.split_timeseries(days, response)
+
+    async def _gather(self, function, items: list) -> list:
+        """
+        Await a coroutine function for each item, up to ``max_workers`` at
+        once.
+
+        Args:
+            function (callable): The coroutine function to be awaited.
+            items (list): The arguments of each call.
+
+        Returns:
+            list: The results, in the same order as the items.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(item):
+            async with semaphore:
+                return await function(item)
+
+        return await asyncio.gather(*(call(item) for item in items))
@@ -0,0 +1,126 @@
+"""Conversion Service
+"""
+from decimal import Decimal
+
+from decouple import config
+
+from exchange_rates.core.interfaces.rates_provider import RatesProvider
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.core.services.currency_service import CurrencyService
+from exchange_rates.core.services.rates_service import RatesService
+
+
+class ConversionService:
+    """
+    A service class converting batches of amounts between currencies.
+
+    Every conversion is computed from the canonical rates of its day, as
+    ``amount * price(to) / price(from)``. The days of a batch are loaded
+    together, whatever the number of conversions, with the missing ones
+    fetched in bulk, and the rate of each ``(date, from, to)`` is computed
+    once. A day that can not be fetched only fails the conversions of that
+    day.
+
+    Attributes:
+        decimal_places (int): Decimal places of the converted amounts.
+        rate_decimal_places (int): Decimal places of the rates returned.
+
+    Usage:
+        results = ConversionService().convert(
+            [(Decimal("10"), "USD", "BRL", date(2023, 8, 21))]
+        )
+    """
+
+    decimal_places = config("CONVERT_DECIMAL_PLACES", default=2, cast=int)
+    rate_decimal_places = config("CONVERT_RATE_DECIMAL_PLACES", default=10, cast=int)
+
+    def __init__(self, rates_provider: type[RatesProvider] = VATClient) -> None:
+        """
+        Initialize the ConversionService.
+
+        Args:
+            rates_provider (type[RatesProvider], optional): The provider class
+            used to fetch missing rates. Defaults to VATClient.
+        """
+        self._currency_service = CurrencyService()
+        self._rates_service = RatesService(
+            base_rate=RatesService.canonical_base_rate, rates_provider=rates_provider
+        )
+
+    def convert(self, conversions: list) -> list:
+        """
+        Convert a batch of amounts.
+
+        Args:
+            conversions (list): ``(amount, from, to, date)`` tuples, with a
+            Decimal amount, the short names of both currencies and the date
+            of the rates used.
+
+        Returns:
+            list: The result of each conversion, in input order: the
+            converted ``amount`` and the ``rate`` used, as strings, or an
+            ``error`` message.
+        """
+        short_names = {
+            short_name
+            for _, from_currency, to_currency, _ in conversions
+            for short_name in (from_currency, to_currency)
+        }
+        currencies = self._currency_service.get_currencies_by_short_names(
+            short_names=short_names
+        )
+        prices, errors = self._rates_service.get_day_prices(
+            [date for *_, date in conversions]
+        )
+
+        amount_exponent = Decimal(10) ** -self.decimal_places
+        rate_exponent = Decimal(10) ** -self.rate_decimal_places
+        rates = {}
+        results = []
+        for amount, from_currency, to_currency, date in conversions:
+            key = (date, from_currency, to_currency)
+            if key not in rates:
+                rates[key] = (
+                    f"Rates of {date} could not be fetched: {errors[date]}"
+                    if date in errors
+                    else self._rate(prices, currencies, *key)
+                )
+
+            rate = rates[key]
+            if isinstance(rate, str):
+                results.append({"error": rate})
+                continue
+            results.append(
+                {
+                    "amount": f"{(amount * rate).quantize(amount_exponent):f}",
+                    "rate": f"{rate.quantize(rate_exponent):f}",
+                }
+            )
+        return results
+
+    @staticmethod
+    def _rate(prices: dict, currencies: dict, date, from_currency, to_currency):
+        """
+        Compute the rate converting a currency to another on a date.
+
+        Args:
+            prices (dict): The canonical prices keyed by date, then by
+            currency id.
+            currencies (dict): The currencies keyed by short name.
+            date (datetime.date): The date of the rate.
+            from_currency (str): The short name of the converted currency.
+            to_currency (str): The short name of the target currency.
+
+        Returns:
+            Decimal or str: The rate, or the reason it can not be computed.
+        """
+        for short_name in (from_currency, to_currency):
+            if short_name not in currencies:
+                return f"Unknown currency {short_name}."
+
+        day_prices = prices.get(date, {})
+        from_price = day_prices.get(currencies[from_currency].id)
+        to_price = day_prices.get(currencies[to_currency].id)
+        if not from_price or to_price is None:
+            return f"No rates of {from_currency}/{to_currency} on {date}."
+        return Decimal(to_price) / Decimal(from_price)
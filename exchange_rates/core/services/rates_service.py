@@ -1,81 +1,117 @@
 """Rate Service
 """
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timedelta, timezone
+
+from decouple import config
 
 from exchange_rates.core.entities.rate import Rate
+from exchange_rates.core.entities.rate_matrix import RateMatrix
+from exchange_rates.core.interfaces.rates_provider import (
+    RatesProvider,
+    TimeseriesNotSupported,
+)
 from exchange_rates.core.interfaces.vatcomply.client import VATClient
 from exchange_rates.core.services.currency_service import CurrencyService
 from exchange_rates.infra.repositories.django_rate_repository import (
     DjangoRateRepository,
 )
-from exchange_rates.models import Currency as CurrencyModel
+from exchange_rates.infra.repositories.single_flight import SingleFlight
+from exchange_rates.models import FetchedDay
 
 
 class RatesService:
     """
     A service class to manage exchange rates and currency data.
 
+    Rates are fetched and stored once, against the canonical base currency.
+    The rates of any other base are cross rates derived on read, dividing the
+    canonical prices of a day by the canonical price of the base on that day
+    (see ``derive_rates`` and ``derive_rows``), so a new base costs no fetch
+    at all.
+
     Attributes:
-        base_rate (str): The short name of the base currency.
+        base_rate (CurrencyModel): The base currency of the rates read.
+        canonical_base (CurrencyModel): The base currency the rates are
+        fetched and stored against.
+        canonical_base_rate (str): The short name of the canonical base.
+        max_workers (int): Maximum number of days fetched concurrently from
+        the VAT service.
+        no_data_ttl (int): Seconds a day fetched without rates during the day
+        itself (e.g. before the publication) is not fetched again.
+        prices_batch_size (int): Missing days fetched and locked at once by
+        ``get_day_prices``.
     """
 
-    def __init__(self, base_rate: str) -> None:
+    canonical_base_rate = config("RATES_CANONICAL_BASE", default="EUR")
+    max_workers = config("VAT_MAX_WORKERS", default=5, cast=int)
+    no_data_ttl = config("RATES_NO_DATA_TTL", default=3600, cast=int)
+    prices_batch_size = config("RATES_PRICES_BATCH_SIZE", default=50, cast=int)
+
+    def __init__(
+        self, base_rate: str, rates_provider: type[RatesProvider] = VATClient
+    ) -> None:
         """
         Initialize the RatesService with a base currency.
 
         Args:
             base_rate (str): The short name of the base currency.
+            rates_provider (type[RatesProvider], optional): The provider class
+            used to fetch missing rates. Defaults to VATClient.
         """
         self._currency_service = CurrencyService()
         self.base_rate = self._currency_service.get_currency_by_short_name(
             short_name=base_rate
         )
-        self._rate_repository = DjangoRateRepository(base_rate=self.base_rate)
-        self._vat_client = VATClient
+        self.canonical_base = self._currency_service.get_currency_by_short_name(
+            short_name=self.canonical_base_rate
+        )
+        self._rate_repository = DjangoRateRepository(base_rate=self.canonical_base)
+        self._rates_provider = rates_provider
 
     def proccess(
-        self, date: datetime, until_date: datetime, search_days_list: list = []
+        self,
+        date: datetime,
+        until_date: datetime,
+        search_days_list: list = None,
+        fetch_missing: bool = True,
     ) -> [Rate]:
         """
         Get or create exchange rates for specified date range and search days.
 
+        The rates are the stored canonical ones, to be expressed against
+        ``base_rate`` with ``derive_rates`` or ``derive_rows`` once paginated.
+
         Args:
             date (datetime): The starting date of the rate retrieval.
             until_date (datetime): The ending date of the rate retrieval.
             search_days_list (list, optional): List of specific days to search
             for rates.
+            fetch_missing (bool, optional): Whether the missing days are
+            looked up and fetched, False when they were just prefetched (e.g.
+            by AsyncRatesService).
 
         Returns:
-            [Rate]: A list of Rate objects.
+            [Rate]: A list of Rate objects, against the canonical base.
 
         Raises:
             Exception: If the date interval is more than 5 days or if invalid
             week days are provided.
         """
         if date:
-            if until_date:
-                search_days_list = self.extract_week_days(date, until_date)
-            else:
-                search_days_list.append(date)
-
-            # 1º bussiness rule
-            # you just can filter by date intervals of up to 5 days.
-            if len(search_days_list) > 5:
-                raise Exception(
-                    "You can only filter intervals of up to 5 days, \
-                        including only on week days (Mon, Tue, Wed, Thu, Fri)"
-                )  # no-qa
+            search_days_list = self.get_search_days(date, until_date, search_days_list)
+            missing_days = fetch_missing and self.get_missing_days(search_days_list)
 
-            for item in search_days_list:
-                query = self._rate_repository.get_rates(date=item)
-
-                if not query:
-                    client = self._vat_client(
-                        base_rate=self.base_rate.short_name, date=date
-                    )
-                    response_rate = client.rate()
-
-                    self.get_or_create_rate(item, response_rate)
+            if missing_days:
+                # 3º bussiness rule
+                # a day is fetched by a single worker at a time, the others
+                # wait for it and reuse the stored rates.
+                with SingleFlight.acquire(
+                    [(self.canonical_base.short_name, item) for item in missing_days]
+                ):
+                    missing_days = self.get_missing_days(missing_days)
+                    self.get_or_create_rates(self.fetch_rates(missing_days))
 
             query = self._rate_repository.get_rates(
                 date=date, until_date=until_date
@@ -85,6 +121,567 @@ class RatesService:
 
         return query
 
+    @classmethod
+    def get_search_days(
+        cls, date: datetime, until_date: datetime = None, search_days_list: list = None
+    ) -> list:
+        """
+        Get the days a date range is made of, enforcing the filter rules.
+
+        Args:
+            date (datetime): The starting date of the range.
+            until_date (datetime, optional): The ending date of the range.
+            search_days_list (list, optional): List of specific days to search
+            for rates.
+
+        Returns:
+            list: The days to be searched.
+
+        Raises:
+            Exception: If the date interval is more than 5 days or if invalid
+            week days are provided.
+        """
+        if until_date:
+            search_days_list = cls.extract_week_days(date, until_date)
+        else:
+            search_days_list = [*(search_days_list or []), date]
+
+        # 1º bussiness rule
+        # you just can filter by date intervals of up to 5 days.
+        if len(search_days_list) > 5:
+            raise Exception(
+                "You can only filter intervals of up to 5 days, \
+                    including only on week days (Mon, Tue, Wed, Thu, Fri)"
+            )  # no-qa
+        return search_days_list
+
+    def export(
+        self,
+        fields: tuple,
+        date: datetime = None,
+        until_date: datetime = None,
+        chunk_size: int = 2000,
+    ):
+        """
+        Iterate over the stored exchange rates of a date range of any size,
+        against the canonical base.
+
+        Unlike ``proccess``, exports are not limited to 5 days and missing
+        days are not fetched from the rates provider: only the stored rates
+        are read, lazily.
+
+        Args:
+            fields (tuple): The rate fields read, in tuple order.
+            date (datetime, optional): The first date of the range.
+            until_date (datetime, optional): The last date of the range.
+            chunk_size (int, optional): Rates read from the database at once.
+
+        Returns:
+            Iterator: The rates, as tuples of ``fields``.
+
+        Raises:
+            Exception: If until_date is less than date.
+        """
+        if date and until_date and until_date < date:
+            raise Exception("You can only use a until date bigger than date")
+
+        return self._rate_repository.iter_rates(
+            fields, date=date, until_date=until_date, chunk_size=chunk_size
+        )
+
+    def get_rate_matrix(
+        self, date: datetime = None, until_date: datetime = None
+    ) -> RateMatrix:
+        """
+        Load the stored exchange rates of a date range of any size as a
+        RateMatrix against ``base_rate``, for analytics computed in batch.
+
+        Like ``export``, missing days are not fetched from the rates provider.
+
+        Args:
+            date (datetime, optional): The first date of the range.
+            until_date (datetime, optional): The last date of the range.
+
+        Returns:
+            RateMatrix: The rates of the range.
+
+        Raises:
+            Exception: If until_date is less than date, or NumPy is not
+            installed.
+        """
+        currency_names = {
+            currency.id: currency.short_name
+            for currency in self._currency_service.get_currencies()
+        }
+        matrix = RateMatrix.from_rows(
+            self.canonical_base.short_name,
+            self.export(("date", "currency_id", "price"), date, until_date),
+            currency_names,
+        )
+        if self.base_rate.id == self.canonical_base.id:
+            return matrix
+        return matrix.cross_rates(self.base_rate.short_name)
+
+    def derive_rates(self, rates: list) -> list:
+        """
+        Express canonical Rate instances against ``base_rate``.
+
+        Args:
+            rates (list): Rate instances against the canonical base.
+
+        Returns:
+            list: The same instances, with the price and base of the cross
+            rates (they are not saved). Rates of days without a price of
+            ``base_rate`` are left out.
+        """
+        rates = list(rates)
+        if self.base_rate.id == self.canonical_base.id:
+            return rates
+
+        divisors = self._get_divisors({rate.date for rate in rates})
+        derived = []
+        for rate in rates:
+            if divisor := divisors.get(rate.date):
+                rate.base = self.base_rate
+                rate.price = rate.price / divisor
+                derived.append(rate)
+        return derived
+
+    def derive_rows(self, rows: list, fields: tuple) -> list:
+        """
+        Express canonical rate rows, as read by ``values_list``, against
+        ``base_rate``.
+
+        The rows of each day are divided by the price of ``base_rate`` on
+        that day, read with a single query for the whole page.
+
+        Args:
+            rows (list): Rate tuples against the canonical base.
+            fields (tuple): The rate fields of the tuples, holding at least
+            ``date``, ``price`` and ``base_id``.
+
+        Returns:
+            list: The tuples of the cross rates. Rows of days without a price
+            of ``base_rate`` are left out.
+        """
+        rows = list(rows)
+        if self.base_rate.id == self.canonical_base.id:
+            return rows
+
+        date_index = fields.index("date")
+        price_index = fields.index("price")
+        base_index = fields.index("base_id")
+
+        divisors = self._get_divisors({row[date_index] for row in rows})
+        derived = []
+        for row in rows:
+            if divisor := divisors.get(row[date_index]):
+                row = list(row)
+                row[price_index] = row[price_index] / divisor
+                row[base_index] = self.base_rate.id
+                derived.append(tuple(row))
+        return derived
+
+    def _get_divisors(self, dates: set) -> dict:
+        """
+        Get the canonical price of ``base_rate`` on several dates.
+
+        Args:
+            dates (set): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date.
+        """
+        if not dates:
+            return {}
+        return self._rate_repository.get_prices_by_date(self.base_rate, list(dates))
+
+    def prefetch(self, days: list, refetch_no_data: bool = False) -> list:
+        """
+        Fetch and store the canonical rates of the days not stored yet, so
+        later reads are served from the database.
+
+        Missing days are found with a single query (see
+        ``get_missing_days``), fetched like in ``proccess`` (ranges with a
+        single call, other days concurrently on up to ``max_workers``
+        threads) and stored with a single bulk insert.
+
+        Args:
+            days (list): The dates to be prefetched.
+            refetch_no_data (bool, optional): Whether the days fetched
+            without rates are fetched again, e.g. while waiting for their
+            publication, instead of being left out (see
+            ``get_unfetched_days``).
+
+        Returns:
+            list: The dates that were fetched.
+        """
+        get_missing_days = (
+            self.get_unfetched_days if refetch_no_data else self.get_missing_days
+        )
+        days = sorted(set(days))
+        if not (missing_days := get_missing_days(days)):
+            return []
+
+        with SingleFlight.acquire(
+            [(self.canonical_base.short_name, item) for item in missing_days]
+        ):
+            missing_days = get_missing_days(missing_days)
+            if missing_days:
+                self.get_or_create_rates(self.fetch_rates(missing_days))
+        return missing_days
+
+    def get_imprecise_days(
+        self, date: datetime = None, until_date: datetime = None
+    ) -> list:
+        """
+        Find the days whose canonical rates were stored with 2 decimal places
+        only, and need a repair.
+
+        Args:
+            date (datetime, optional): The first date of the range.
+            until_date (datetime, optional): The last date of the range.
+
+        Returns:
+            list: The sorted dates.
+        """
+        return self._rate_repository.get_imprecise_dates(
+            date=date, until_date=until_date
+        )
+
+    def repair(self, days: list) -> list:
+        """
+        Fetch the canonical rates of several days again, overwriting the
+        stored ones, then recompute the rates stored against any other base
+        from them.
+
+        Days are fetched like in ``prefetch``, and the canonical rates are
+        upserted with a single bulk insert.
+
+        Args:
+            days (list): The dates to be repaired.
+
+        Returns:
+            list: The dates the rates provider had rates for.
+        """
+        days = sorted(set(days))
+        if not days:
+            return []
+
+        with SingleFlight.acquire(
+            [(self.canonical_base.short_name, item) for item in days]
+        ):
+            response_rates = {
+                item: response_rate
+                for item, response_rate in self.fetch_rates(days).items()
+                if response_rate.get("rates")
+            }
+            self.get_or_create_rates(response_rates)
+            self._rate_repository.rederive_rates(list(response_rates))
+        return sorted(response_rates)
+
+    def import_days(self, response_rates: list) -> dict:
+        """
+        Store the rates of several days read from historical files, without
+        fetching anything.
+
+        The days are VATcomply single day responses of any base, expressed
+        against the canonical base (which must then be among their rates),
+        resolved against the currencies with a single lookup and loaded with
+        a single ``load_rates`` call, recording them in the ledger of fetched
+        days. The rates stored against any other base on those days are then
+        recomputed from them.
+
+        Args:
+            response_rates (list): The days, as VATcomply single day
+            responses.
+
+        Returns:
+            dict: The number of ``days`` imported, of ``skipped`` days (with
+            no rates, or none against the canonical base) and of ``rates``
+            loaded.
+        """
+        canonical = self.canonical_base.short_name
+        prices_by_day, skipped = {}, 0
+        for response_rate in response_rates:
+            base, rates = response_rate["base"], response_rate["rates"]
+            if base != canonical:
+                if not rates.get(canonical):
+                    skipped += 1
+                    continue
+                divisor = rates[canonical]
+                rates = {
+                    **{key: value / divisor for key, value in rates.items()},
+                    base: 1 / divisor,
+                }
+            if not rates:
+                skipped += 1
+                continue
+            item = datetime.fromisoformat(response_rate["date"]).date()
+            prices_by_day.setdefault(item, {}).update({**rates, canonical: 1})
+
+        short_names = {key for prices in prices_by_day.values() for key in prices}
+        currencies = (
+            self._currency_service.get_currencies_by_short_names(
+                short_names=short_names
+            )
+            if short_names
+            else {}
+        )
+        rates = [
+            {"currency": currencies[key], "date": item, "price": value}
+            for item, prices in prices_by_day.items()
+            for key, value in prices.items()
+            if key in currencies
+        ]
+
+        loaded = self._rate_repository.load_rates(
+            base_rate=self.canonical_base,
+            rates=rates,
+            fetched_days=[
+                {"date": item, "status": FetchedDay.FETCHED, "effective_date": item}
+                for item in prices_by_day
+            ],
+        )
+        if prices_by_day:
+            self._rate_repository.rederive_rates(list(prices_by_day))
+        return {"days": len(prices_by_day), "skipped": skipped, "rates": loaded}
+
+    def get_day_prices(self, days: list) -> tuple:
+        """
+        Get the canonical prices of every currency on several days of any
+        number, fetching the missing days in bulk.
+
+        Stored days are read with a single query. Missing days, unless
+        fetched already without rates, are fetched ``prices_batch_size`` at
+        a time, like in ``proccess`` (ranges with a single call, other days
+        concurrently, one worker per day), each batch locked on its own and
+        read back with one more query. A batch failing to be fetched is
+        fetched again day by day, so a failing day (e.g. a future date the
+        rates provider rejects) does not fail the others.
+
+        Args:
+            days (list): The dates of the prices.
+
+        Returns:
+            tuple: The prices keyed by date, then by currency id, and the
+            errors of the days that could not be fetched, keyed by date.
+            Days the rates provider has no rates for are left out of both.
+        """
+        days = sorted(set(days))
+        prices = self._rate_repository.get_day_prices(days)
+        errors = {}
+
+        missing_days = [item for item in days if item not in prices]
+        if missing_days:
+            missing_days = self.get_missing_days(missing_days)
+        for index in range(0, len(missing_days), self.prices_batch_size):
+            batch = missing_days[index : index + self.prices_batch_size]
+            try:
+                prices.update(self._fetch_day_prices(batch))
+            # pylint: disable=W0703
+            except Exception as err:
+                # pylint: enable=W0703
+                if len(batch) == 1:
+                    errors[batch[0]] = err
+                    continue
+                for item in batch:
+                    try:
+                        prices.update(self._fetch_day_prices([item]))
+                    # pylint: disable=W0703
+                    except Exception as day_err:
+                        # pylint: enable=W0703
+                        errors[item] = day_err
+        return prices, errors
+
+    def _fetch_day_prices(self, days: list) -> dict:
+        """
+        Fetch the days still missing once they are locked, and read their
+        prices.
+
+        Args:
+            days (list): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date, then by currency id.
+
+        Raises:
+            Exception: If the rates provider fails, e.g. VATClientError.
+        """
+        with SingleFlight.acquire(
+            [(self.canonical_base.short_name, item) for item in days]
+        ):
+            if missing_days := self.get_missing_days(days):
+                self.get_or_create_rates(self.fetch_rates(missing_days))
+        return self._rate_repository.get_day_prices(days)
+
+    def get_version(self, date: datetime = None, until_date: datetime = None) -> dict:
+        """
+        Summarize the stored exchange rates of a date range without loading
+        them, e.g. to build HTTP validators.
+
+        Args:
+            date (datetime, optional): The starting date of the range.
+            until_date (datetime, optional): The ending date of the range.
+
+        Returns:
+            dict: The ``count`` of rates and their ``last_modified`` time.
+        """
+        return self._rate_repository.get_rates_version(date=date, until_date=until_date)
+
+    def get_unfetched_days(self, days: list) -> list:
+        """
+        Get the days without rates yet, with a single query, including the
+        days fetched without rates (e.g. before their publication).
+
+        Args:
+            days (list): The dates to be checked.
+
+        Returns:
+            list: The dates without rates.
+        """
+        fetched_days = self._rate_repository.get_fetched_dates(days)
+        return [item for item in days if item not in fetched_days]
+
+    def get_missing_days(self, days: list) -> list:
+        """
+        Get the days to be fetched from the rates provider, with a single
+        query.
+
+        Days with stored rates are left out, and so are the days the
+        provider had no rates for (e.g. holidays), recorded in the ledger of
+        fetched days. Days fetched without rates during the day itself are
+        fetched again once ``no_data_ttl`` expires, as their rates may be
+        published later.
+
+        Args:
+            days (list): The dates to be checked.
+
+        Returns:
+            list: The dates to be fetched.
+        """
+        covered_days = self._rate_repository.get_covered_dates(
+            days,
+            expired_before=datetime.now(timezone.utc)
+            - timedelta(seconds=self.no_data_ttl),
+        )
+        return [item for item in days if item not in covered_days]
+
+    def fetch_rates(self, days: list) -> dict:
+        """
+        Fetch the exchange rates of several days from the rates provider.
+
+        Runs of consecutive missing days are fetched with a single timeseries
+        call each, when the provider supports it. The remaining days are
+        fetched one by one, concurrently, by a pool of up to ``max_workers``
+        threads, so fetching a range costs about one upstream round trip.
+
+        Args:
+            days (list): The dates to be fetched.
+
+        Returns:
+            dict: The API responses keyed by the date they were fetched for.
+        """
+        response_rates = {}
+
+        ranges = [days for days in self.split_in_ranges(days) if len(days) > 1]
+        if ranges and self._rates_provider.supports_timeseries:
+            for response in self._run_concurrently(self.fetch_timeseries, ranges):
+                response_rates.update(response)
+
+        remaining_days = [item for item in days if item not in response_rates]
+        response_rates.update(
+            zip(
+                remaining_days,
+                self._run_concurrently(self.fetch_rate, remaining_days),
+            )
+        )
+        return response_rates
+
+    def fetch_rate(self, item: datetime) -> dict:
+        """
+        Fetch the exchange rates of a single day from the rates provider.
+
+        Args:
+            item (datetime): The date to be fetched.
+
+        Returns:
+            dict: The API response containing exchange rates.
+        """
+        client = self._rates_provider(
+            base_rate=self.canonical_base.short_name, date=item
+        )
+        return client.rate()
+
+    def fetch_timeseries(self, days: list) -> dict:
+        """
+        Fetch the exchange rates of a run of consecutive days with a single
+        call to the rates provider.
+
+        Args:
+            days (list): The consecutive dates to be fetched.
+
+        Returns:
+            dict: Single day API responses keyed by date, without rates for
+            the days the provider has none for. Every day is left out when it
+            can not serve ranges.
+        """
+        client = self._rates_provider(
+            base_rate=self.canonical_base.short_name, date=days[0]
+        )
+        try:
+            response = client.timeseries(until_date=days[-1])
+        except TimeseriesNotSupported:
+            return {}
+        return self.split_timeseries(days, response)
+
+    @staticmethod
+    def split_timeseries(days: list, response: dict) -> dict:
+        """
+        Split a timeseries API response in single day API responses.
+
+        Args:
+            days (list): The consecutive dates that were fetched.
+            response (dict): The timeseries API response.
+
+        Returns:
+            dict: Single day API responses keyed by date, without rates for
+            the days the provider has none for.
+        """
+        rates_by_day = response.get("rates", {})
+        return {
+            item: {
+                "date": item.isoformat(),
+                "base": response.get("base"),
+                "rates": rates_by_day.get(item.isoformat(), {}),
+            }
+            for item in days
+        }
+
+    def _run_concurrently(self, function, items: list) -> list:
+        """
+        Call a function for each item, on a pool of up to ``max_workers``
+        threads, each call running in a copy of the caller's context (so it
+        is recorded in the timings of the current request).
+
+        Args:
+            function (callable): The function to be called.
+            items (list): The arguments of each call.
+
+        Returns:
+            list: The results, in the same order as the items.
+        """
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items))
+        ) as executor:
+            futures = [
+                executor.submit(copy_context().run, function, item) for item in items
+            ]
+            return [future.result() for future in futures]
+
     def get_or_create_rate(self, item, response_rate):
         """
         Get or create exchange rates for a specific day.
@@ -94,26 +691,122 @@ class RatesService:
             response_rate (dict): The API response containing exchange rates.
 
         Returns:
+            list: The created rate entries.
+
+        Raises:
             None
+        """
+        return self.get_or_create_rates({item: response_rate})
+
+    def get_or_create_rates(self, response_rates: dict):
+        """
+        Get or create exchange rates for several days in one batch.
+
+        Every currency code found in the API responses is resolved with a
+        single query and all the rates are written with a single bulk insert,
+        whatever the number of days and currencies involved. Every day also
+        gets the rate of the canonical base against itself, so it can be
+        derived against any other base.
+
+        Every day is recorded in the ledger of fetched days, in the same
+        transaction. Days answered without rates, or with the rates of
+        another day (e.g. the last business day before a holiday), are
+        recorded without rates and not stored.
+
+        Args:
+            response_rates (dict): The API responses containing exchange
+            rates, keyed by the date they were requested for.
+
+        Returns:
+            list: The created rate entries.
 
         Raises:
             None
         """
-        for key, value in response_rate.get("rates").items():
-            try:
-                self.currency = self._currency_service.get_currency_by_short_name(
-                    short_name=key
-                )  # no-qa
-                if self.currency:
-                    self._rate_repository.create_rate(
-                        base_rate=self.base_rate,
-                        currency=self.currency,
-                        date=item,
-                        price=value,
-                    )
-
-            except CurrencyModel.DoesNotExist:
-                continue
+        canonical = self.canonical_base.short_name
+        fetched_days = {
+            item: self.to_fetched_day(item, response_rate)
+            for item, response_rate in response_rates.items()
+        }
+        response_rates = {
+            item: {
+                **response_rate,
+                "rates": {**response_rate["rates"], canonical: 1},
+            }
+            for item, response_rate in response_rates.items()
+            if fetched_days[item]["status"] == FetchedDay.FETCHED
+        }
+        short_names = {
+            key
+            for response_rate in response_rates.values()
+            for key in response_rate["rates"]
+        }
+        if not fetched_days:
+            return []
+
+        currencies = (
+            self._currency_service.get_currencies_by_short_names(
+                short_names=short_names
+            )
+            if short_names
+            else {}
+        )
+
+        rates = [
+            {"currency": currencies[key], "date": item, "price": value}
+            for item, response_rate in response_rates.items()
+            for key, value in response_rate["rates"].items()
+            if key in currencies
+        ]
+
+        return self._rate_repository.bulk_create_rates(
+            base_rate=self.canonical_base,
+            rates=rates,
+            fetched_days=list(fetched_days.values()),
+        )
+
+    @staticmethod
+    def to_fetched_day(item, response_rate: dict) -> dict:
+        """
+        Build the ledger entry of a day fetched from the rates provider.
+
+        Args:
+            item (datetime): The date that was requested.
+            response_rate (dict): The API response.
+
+        Returns:
+            dict: The ``date``, ``status`` and ``effective_date`` of the day.
+        """
+        effective_date = item
+        if response_date := response_rate.get("date"):
+            effective_date = datetime.fromisoformat(response_date).date()
+
+        status = FetchedDay.NO_DATA
+        if response_rate.get("rates") and effective_date == item:
+            status = FetchedDay.FETCHED
+        return {"date": item, "status": status, "effective_date": effective_date}
+
+    @staticmethod
+    def split_in_ranges(days: list) -> list:
+        """
+        Split a list of week days in runs of consecutive week days.
+
+        Args:
+            days (list): Sorted week days.
+
+        Returns:
+            list: Lists of consecutive week days, a weekend between two days
+            not breaking a run.
+        """
+        ranges = []
+        for item in days:
+            if ranges and (item - ranges[-1][-1]).days <= (
+                3 if ranges[-1][-1].weekday() == 4 else 1
+            ):
+                ranges[-1].append(item)
+            else:
+                ranges.append([item])
+        return ranges
 
     @staticmethod
     def extract_week_days(date, until_date):
@@ -0,0 +1,262 @@
+"""Rates Response Cache
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import date as Date
+from datetime import datetime, timezone
+
+from decouple import config
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class LRUCache:
+    """
+    A thread-safe, size bounded, least recently used cache with expiring
+    entries.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        """
+        Retrieve an entry, marking it as the most recently used.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, expires: float) -> None:
+        """
+        Store an entry, evicting the least recently used ones if needed.
+
+        Args:
+            key (str): The key of the entry.
+            value: The value to be stored.
+            expires (float): The timestamp the entry expires at.
+        """
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RatesResponseCache:
+    """
+    A two tiers cache of the rendered ``/rates/`` responses and their HTTP
+    validators.
+
+    Published rates rarely change, so a response covering only past days is
+    kept for a long time, while a response covering today (or no date at
+    all) is kept for a short time only. Responses are looked up in a process
+    local LRU tier first, then in a shared tier backed by the Django cache
+    framework (``RATES_CACHE_ALIAS``), e.g. Redis.
+
+    Every key embeds a generation counter kept in the shared tier, so
+    ``clear`` retires the responses cached by every process, including
+    their local tiers, by bumping it, without flushing the shared backend.
+    The old entries are never read again and expire on their own. Each
+    process keeps a copy of the generation for ``generation_ttl`` seconds,
+    so a hit of the local tier makes no call to the shared one, and a
+    ``clear`` from another process is seen within that delay. The shared
+    tier must be shared by the web workers and the management commands
+    (not a LocMemCache) for their ``clear`` to reach the workers.
+
+    Attributes:
+        historical_ttl (int): Seconds a response of past days is kept.
+        recent_ttl (int): Seconds a response including today is kept.
+        memory_size (int): Maximum responses kept in the process local tier.
+        cache_alias (str): The Django cache used as shared tier.
+        generation_key (str): The shared tier key of the generation counter.
+        generation_ttl (float): Seconds the generation is kept by a process
+        before being read again from the shared tier.
+
+    Usage:
+        key = RatesResponseCache.key(rate_base="USD", date=date)
+        response = RatesResponseCache.get(key)
+    """
+
+    historical_ttl = config("RATES_CACHE_HISTORICAL_TTL", default=2592000, cast=int)
+    recent_ttl = config("RATES_CACHE_RECENT_TTL", default=60, cast=int)
+    memory_size = config("RATES_CACHE_MEMORY_SIZE", default=512, cast=int)
+    cache_alias = config("RATES_CACHE_ALIAS", default="rates")
+    generation_key = "rates:generation"
+    generation_ttl = config("RATES_CACHE_GENERATION_TTL", default=1.0, cast=float)
+
+    _memory = LRUCache(max_size=memory_size)
+    _generation = None
+
+    @classmethod
+    def key(cls, **params) -> str:
+        """
+        Build the cache key of a request, in the current generation.
+
+        The key is to be built before the rates are read, so a response read
+        before a ``clear`` is stored in the retired generation.
+
+        Args:
+            **params: The request parameters, e.g. rate_base, date,
+            until_date and page.
+
+        Returns:
+            str: The cache key.
+        """
+        normalized = "&".join(
+            f"{name}={value}"
+            for name, value in sorted(params.items())
+            if value is not None
+        )
+        return (
+            f"rates:v1:{cls.generation()}:"
+            + hashlib.sha1(normalized.encode()).hexdigest()
+        )
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        Get the current generation of the cached responses, read from the
+        shared tier at most once every ``generation_ttl`` seconds.
+
+        A missing counter, e.g. evicted, starts again from the current time
+        in nanoseconds, above any generation used before.
+
+        Returns:
+            int: The generation.
+        """
+        if (local := cls._generation) is not None and local[0] > time.monotonic():
+            return local[1]
+
+        cache = caches[cls.cache_alias]
+        if (generation := cache.get(cls.generation_key)) is None:
+            cache.add(cls.generation_key, time.time_ns(), timeout=None)
+            generation = cache.get(cls.generation_key)
+        cls._generation = (time.monotonic() + cls.generation_ttl, generation)
+        return generation
+
+    @classmethod
+    def is_shared(cls) -> bool:
+        """
+        Tell whether the shared tier is reachable from other processes.
+
+        Returns:
+            bool: False if the shared tier is a process local cache.
+        """
+        return not isinstance(caches[cls.cache_alias], LocMemCache)
+
+    @staticmethod
+    def is_historical(date: Date = None, until_date: Date = None) -> bool:
+        """
+        Tell whether a response covers past days only, so it never changes.
+
+        Args:
+            date (datetime.date, optional): The first day of the response.
+            until_date (datetime.date, optional): The last day of the response.
+
+        Returns:
+            bool: Whether every day of the response is in the past.
+        """
+        last_day = until_date or date
+        return bool(last_day) and last_day < datetime.now(timezone.utc).date()
+
+    @classmethod
+    def ttl(cls, date: Date = None, until_date: Date = None) -> int:
+        """
+        Choose how long a response is kept.
+
+        Args:
+            date (datetime.date, optional): The first day of the response.
+            until_date (datetime.date, optional): The last day of the response.
+
+        Returns:
+            int: The seconds the response is kept.
+        """
+        if cls.is_historical(date, until_date):
+            return cls.historical_ttl
+        return cls.recent_ttl
+
+    @classmethod
+    def get(cls, key: str):
+        """
+        Retrieve a cached response.
+
+        Args:
+            key (str): The cache key of the request.
+
+        Returns:
+            The cached response, e.g. its rendered body and validators, or
+            None on a miss.
+        """
+        if (response := cls._memory.get(key)) is not None:
+            return response
+
+        entry = caches[cls.cache_alias].get(key)
+        if entry is None:
+            return None
+
+        expires, response = entry
+        cls._memory.set(key, response, expires)
+        return response
+
+    @classmethod
+    def set(cls, key: str, response, ttl: int) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            key (str): The cache key of the request.
+            response: The response to be cached, e.g. its rendered body and
+            validators. It must be picklable.
+            ttl (int): The seconds the response is kept.
+        """
+        expires = time.time() + ttl
+        cls._memory.set(key, response, expires)
+        caches[cls.cache_alias].set(key, (expires, response), timeout=ttl)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Retire every cached response, in every process, by bumping the
+        generation.
+        """
+        cache = caches[cls.cache_alias]
+        try:
+            generation = cache.incr(cls.generation_key)
+        except ValueError:
+            generation = time.time_ns()
+            if not cache.add(cls.generation_key, generation, timeout=None):
+                generation = cache.get(cls.generation_key)
+        cls._generation = (time.monotonic() + cls.generation_ttl, generation)
+        cls._memory.clear()
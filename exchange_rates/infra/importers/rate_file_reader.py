@@ -0,0 +1,232 @@
+"""Rate File Reader
+"""
+import csv
+import json
+import xml.etree.ElementTree as ElementTree
+from datetime import date as Date
+from decimal import Decimal, InvalidOperation
+from itertools import groupby, islice
+
+
+class RateFileReader:
+    """
+    Stream the days of rates held by historical rate files.
+
+    Each day is read as a VATcomply single day response, ``{"date": ...,
+    "base": ..., "rates": {"USD": Decimal(...), ...}}``, whatever the file
+    format, so days from every source are stored the same way:
+
+    - csv: either one rate per row, with ``date``, ``base``, ``currency`` and
+      ``price`` columns, the rows of a day next to each other, or one day per
+      row with a column per currency, like the ECB ``eurofxref-hist.csv``.
+    - xml: an ECB ``eurofxref`` document, read element by element.
+    - json: a VATcomply day or timeseries response, or a list of days. Files
+      ending with ``.ndjson`` or ``.jsonl`` hold a day per line and are
+      streamed, other ones are loaded at once.
+
+    Prices are read as Decimal, so they are stored exactly, and empty or
+    ``N/A`` prices are left out.
+
+    Attributes:
+        formats (dict): The format of each file extension.
+
+    Usage:
+        for days in RateFileReader("eurofxref-hist.csv").chunks(250):
+            ...
+    """
+
+    formats = {
+        ".csv": "csv",
+        ".xml": "xml",
+        ".json": "json",
+        ".ndjson": "json",
+        ".jsonl": "json",
+    }
+
+    def __init__(self, path: str, file_format: str = None, base: str = "EUR") -> None:
+        """
+        Initializes the reader.
+
+        Args:
+            path (str): The path of the file.
+            file_format (str, optional): ``csv``, ``xml`` or ``json``, guessed
+            from the extension by default.
+            base (str, optional): The base of the days not stating one, e.g.
+            the ECB files.
+
+        Raises:
+            Exception: If the format is unknown.
+        """
+        if file_format is None:
+            extension = path[path.rfind(".") :].lower() if "." in path else ""
+            file_format = self.formats.get(extension)
+        if file_format not in set(self.formats.values()):
+            raise Exception(f"Unknown rate file format for {path}.")
+
+        self.path = path
+        self.file_format = file_format
+        self.base = base
+
+    def __iter__(self):
+        """
+        Iterate over the days of the file.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        return getattr(self, f"read_{self.file_format}")()
+
+    def chunks(self, size: int):
+        """
+        Iterate over the days of the file, a few at a time.
+
+        Args:
+            size (int): The number of days of each chunk.
+
+        Returns:
+            Iterator: Lists of up to ``size`` days.
+        """
+        days = iter(self)
+        while chunk := list(islice(days, size)):
+            yield chunk
+
+    def read_csv(self):
+        """
+        Iterate over the days of a CSV file.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        with open(self.path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            header = [column.strip().lower() for column in next(reader, [])]
+            if {"date", "currency", "price"} <= set(header):
+                yield from self._read_csv_rows(reader, header)
+                return
+
+            currencies = [column.upper() for column in header[1:]]
+            for row in reader:
+                if not row or not row[0].strip():
+                    continue
+                yield self.build_day(row[0], self.base, zip(currencies, row[1:]))
+
+    def _read_csv_rows(self, reader, header: list):
+        """
+        Iterate over the days of a CSV file holding a rate per row.
+
+        Args:
+            reader (csv.reader): The reader, past the header.
+            header (list): The lower case column names.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        columns = {name: header.index(name) for name in header}
+
+        def key(row):
+            base = row[columns["base"]] if "base" in columns else self.base
+            return row[columns["date"]].strip(), base.strip().upper()
+
+        rows = (row for row in reader if row)
+        for (day, base), day_rows in groupby(rows, key=key):
+            yield self.build_day(
+                day,
+                base,
+                (
+                    (row[columns["currency"]].strip().upper(), row[columns["price"]])
+                    for row in day_rows
+                ),
+            )
+
+    def read_xml(self):
+        """
+        Iterate over the days of an ECB XML file.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        for _, element in ElementTree.iterparse(self.path):
+            if element.tag.rpartition("}")[2] != "Cube" or "time" not in element.attrib:
+                continue
+            yield self.build_day(
+                element.get("time"),
+                self.base,
+                (
+                    (cube.get("currency"), cube.get("rate"))
+                    for cube in element
+                    if cube.get("currency")
+                ),
+            )
+            element.clear()
+
+    def read_json(self):
+        """
+        Iterate over the days of a VATcomply JSON file.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        with open(self.path, encoding="utf-8") as file:
+            if self.path.lower().endswith((".ndjson", ".jsonl")):
+                for line in file:
+                    if line.strip():
+                        yield from self._read_response(
+                            json.loads(line, parse_float=Decimal)
+                        )
+                return
+            yield from self._read_response(json.load(file, parse_float=Decimal))
+
+    def _read_response(self, response):
+        """
+        Iterate over the days of a VATcomply response.
+
+        Args:
+            response (dict | list): A day or timeseries response, or a list
+            of them.
+
+        Returns:
+            Iterator: The days, as VATcomply single day responses.
+        """
+        if isinstance(response, list):
+            for item in response:
+                yield from self._read_response(item)
+            return
+
+        base = response.get("base") or self.base
+        rates = response.get("rates", {})
+        if "date" in response:
+            yield self.build_day(response["date"], base, rates.items())
+            return
+        for day, day_rates in rates.items():
+            yield self.build_day(day, base, day_rates.items())
+
+    @staticmethod
+    def build_day(day: str, base: str, prices) -> dict:
+        """
+        Build a VATcomply single day response.
+
+        Args:
+            day (str): The ISO date of the day.
+            base (str): The short name of the base.
+            prices (iterable): The ``(short_name, price)`` pairs of the day,
+            prices given as str or numbers.
+
+        Returns:
+            dict: The day.
+
+        Raises:
+            Exception: If the date is invalid.
+        """
+        rates = {}
+        for short_name, price in prices:
+            try:
+                price = Decimal(str(price).strip())
+            except InvalidOperation:
+                continue
+            if price.is_finite() and price > 0:
+                rates[short_name.strip().upper()] = price
+        return {
+            "date": Date.fromisoformat(day.strip()).isoformat(),
+            "base": base.upper(),
+            "rates": rates,
+        }
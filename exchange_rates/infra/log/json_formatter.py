@@ -0,0 +1,51 @@
+"""JSON Formatter
+"""
+import json
+import logging
+from datetime import datetime, timezone
+
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter writing each log record as a single JSON line.
+
+    The line holds the time, level, logger and message of the record, plus
+    every field passed through ``extra``, so operational details stay
+    queryable instead of being interpolated into the message.
+
+    Example:
+        logger.info("Rates created.", extra={"base": "EUR", "count": 32})
+
+        {"time": "2023-08-18T12:00:00.000000+00:00", "level": "INFO",
+        "logger": "exchange_rates...", "message": "Rates created.",
+        "base": "EUR", "count": 32}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            str: The record as a JSON line.
+        """
+        line = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **{
+                name: value
+                for name, value in vars(record).items()
+                if name not in RECORD_ATTRIBUTES
+            },
+        }
+        if record.exc_info:
+            line["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            line["exc_info"] = record.exc_text
+        return json.dumps(line, default=str)
@@ -0,0 +1,137 @@
+"""Queue Handler
+"""
+import atexit
+import copy
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from exchange_rates.infra.log.json_formatter import JSONFormatter
+
+
+class _QueueListener(QueueListener):
+    """
+    A QueueListener waiting for room in a full bounded queue to enqueue its
+    stop sentinel, instead of failing.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """
+        Enqueue the sentinel telling the listener thread to stop.
+        """
+        self.queue.put(self._sentinel)
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Handler moving the formatting and writing of log records off the
+    calling thread.
+
+    Records are put on a bounded in-memory queue, a cheap non-blocking call,
+    and a background listener thread, started on the first record, formats
+    them as JSON lines and writes them to the stream. When the stream can not
+    keep up and the queue is full, records are dropped and counted rather
+    than blocking the callers. The listener is stopped, flushing the queue,
+    when the handler is closed or the process exits.
+
+    Attributes:
+        listener (QueueListener): The thread writing the records.
+        dropped (int): The records dropped because the queue was full.
+
+    Usage:
+        LOGGING = {
+            "handlers": {
+                "queue": {
+                    "()": "exchange_rates.infra.log.queue_handler.QueueLogHandler",
+                    "max_size": 10000,
+                }
+            },
+        }
+    """
+
+    def __init__(self, stream=None, max_size: int = 10000) -> None:
+        """
+        Initializes the handler, its listener being started on the first
+        record.
+
+        Args:
+            stream (optional): The stream written to, stdout by default.
+            max_size (int, optional): The records the queue holds at most.
+        """
+        super().__init__(queue.Queue(maxsize=max_size))
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.target.setFormatter(JSONFormatter())
+        self.listener = _QueueListener(self.queue, self.target)
+        self.dropped = 0
+        self._started = False
+
+    def start(self) -> None:
+        """
+        Start the listener, once.
+        """
+        if not self._started:
+            self._started = True
+            self.listener.start()
+            atexit.register(self.stop)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record, dropping it when the queue is full.
+
+        Args:
+            record (logging.LogRecord): The prepared log record.
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record to be enqueued, merging its message arguments and
+        rendering its traceback, so it can be formatted on another thread.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            logging.LogRecord: A copy of the record.
+        """
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def stop(self) -> None:
+        """
+        Stop the listener, once the records already enqueued are written,
+        reporting the records dropped.
+        """
+        if self.listener._thread is None:  # pylint: disable=W0212
+            return
+
+        self.listener.stop()
+        if self.dropped:
+            self.target.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": f"{self.dropped} log records dropped, "
+                        "the log queue was full.",
+                        "dropped": self.dropped,
+                    }
+                )
+            )
+
+    def close(self) -> None:
+        """
+        Close the handler, stopping its listener.
+        """
+        self.stop()
+        super().close()
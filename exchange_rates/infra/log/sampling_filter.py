@@ -0,0 +1,47 @@
+"""Sampling Filter
+"""
+import logging
+import random
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Filter keeping only a fraction of the per-row log records.
+
+    Records logged with ``extra={"sample": True}``, e.g. one per rate
+    written, are kept with the given probability and tagged with it, so
+    counts can be extrapolated from the logs. Other records always pass.
+    Attached to the queue handler, the dropped records are never formatted
+    nor enqueued.
+
+    Attributes:
+        rate (float): The fraction of the sampled records kept, between 0
+        and 1.
+    """
+
+    def __init__(self, rate: float = 1.0) -> None:
+        """
+        Initializes the filter.
+
+        Args:
+            rate (float, optional): The fraction of the sampled records kept.
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is logged.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            bool: Whether the record is kept.
+        """
+        if not getattr(record, "sample", False):
+            return True
+        if self.rate < 1 and random.random() >= self.rate:
+            return False
+        record.sample = self.rate
+        return True
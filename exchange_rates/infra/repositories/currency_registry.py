@@ -0,0 +1,174 @@
+"""Currency Registry
+"""
+import threading
+import time
+
+from decouple import config
+
+from exchange_rates.models import Currency as CurrencyModel
+
+
+class CurrencyRegistry:
+    """
+    A process-wide, in-memory index of the currency table.
+
+    The currency table is tiny and nearly static, so it is loaded once and
+    indexed by id, name and short name. The registry is invalidated by the
+    ``post_save``/``post_delete`` signals of the Currency model (see
+    ``exchange_rates.signals``) and reloaded at most every
+    ``CURRENCY_REGISTRY_TTL`` seconds, so changes made by other processes are
+    picked up as well.
+
+    Attributes:
+        ttl (int): Maximum age, in seconds, of a loaded registry.
+
+    Methods:
+        get_by_id(currency_id: int) -> CurrencyModel
+        get_by_name(name: str) -> CurrencyModel
+        get_by_short_name(short_name: str) -> CurrencyModel
+        get_many_by_short_names(short_names: list) -> dict
+        get_all() -> list
+        invalidate() -> None
+
+    Usage:
+        currency = CurrencyRegistry.get_by_short_name("USD")
+    """
+
+    ttl = config("CURRENCY_REGISTRY_TTL", default=300, cast=int)
+
+    _lock = threading.Lock()
+    _generation = 0
+    _indexes = None
+
+    @classmethod
+    def get_by_id(cls, currency_id: int) -> CurrencyModel:
+        """Retrieve a currency by its id.
+
+        Args:
+            currency_id (int): The id of the currency.
+
+        Returns:
+            CurrencyModel: The corresponding currency.
+
+        Raises:
+            DoesNotExist: If no currency with the given id is found.
+        """
+        return cls._lookup("id", currency_id)
+
+    @classmethod
+    def get_by_name(cls, name: str) -> CurrencyModel:
+        """Retrieve a currency by its full name.
+
+        Args:
+            name (str): The full name of the currency.
+
+        Returns:
+            CurrencyModel: The corresponding currency.
+
+        Raises:
+            DoesNotExist: If no currency with the given name is found.
+        """
+        return cls._lookup("name", name)
+
+    @classmethod
+    def get_by_short_name(cls, short_name: str) -> CurrencyModel:
+        """Retrieve a currency by its short name.
+
+        Args:
+            short_name (str): The short name of the currency.
+
+        Returns:
+            CurrencyModel: The corresponding currency.
+
+        Raises:
+            DoesNotExist: If no currency with the given short name is found.
+        """
+        return cls._lookup("short_name", short_name)
+
+    @classmethod
+    def get_many_by_short_names(cls, short_names: list) -> dict:
+        """Retrieve several currencies by their short names.
+
+        Args:
+            short_names (list): The short names of the currencies.
+
+        Returns:
+            dict: The currencies keyed by short name. Short names without a
+            matching currency are left out.
+        """
+        by_short_name = cls._get_indexes()["short_name"]
+        return {
+            short_name: by_short_name[short_name]
+            for short_name in short_names
+            if short_name in by_short_name
+        }
+
+    @classmethod
+    def get_all(cls) -> list:
+        """Retrieve every currency.
+
+        Returns:
+            list: The currencies, ordered by id.
+        """
+        by_id = cls._get_indexes()["id"]
+        return [by_id[currency_id] for currency_id in sorted(by_id)]
+
+    @classmethod
+    def invalidate(cls, **kwargs) -> None:
+        """Drop the loaded indexes, so the next lookup reloads them.
+
+        Args:
+            **kwargs: Signal arguments (unused).
+        """
+        with cls._lock:
+            cls._generation += 1
+            cls._indexes = None
+
+    @classmethod
+    def _lookup(cls, field: str, value) -> CurrencyModel:
+        """Retrieve a currency from one of the indexes.
+
+        Args:
+            field (str): The indexed field (id, name or short_name).
+            value: The value to look up.
+
+        Returns:
+            CurrencyModel: The corresponding currency.
+
+        Raises:
+            DoesNotExist: If no currency matches the value.
+        """
+        try:
+            return cls._get_indexes()[field][value]
+        except KeyError as err:
+            raise CurrencyModel.DoesNotExist(
+                f"Currency matching {field}={value} does not exist."
+            ) from err
+
+    @classmethod
+    def _get_indexes(cls) -> dict:
+        """Return the loaded indexes, loading them when needed.
+
+        Returns:
+            dict: The currencies keyed by field and then by value.
+        """
+        indexes = cls._indexes
+        if indexes is not None and indexes["expires"] > time.monotonic():
+            return indexes
+
+        with cls._lock:
+            generation = cls._generation
+
+        currencies = list(CurrencyModel.objects.all())
+        indexes = {
+            "id": {currency.id: currency for currency in currencies},
+            "name": {currency.name: currency for currency in currencies},
+            "short_name": {currency.short_name: currency for currency in currencies},
+            "expires": time.monotonic() + cls.ttl,
+        }
+
+        with cls._lock:
+            # a concurrent invalidation means the loaded rows may be stale
+            if generation == cls._generation:
+                cls._indexes = indexes
+        return indexes
@@ -1,10 +1,15 @@
 """DjangoCurrency Repository
 """
+import logging
+
 from exchange_rates.core.entities import Currency as CurrencyEntity
 from exchange_rates.core.repositories.currency_repository import (  # no-qa
     CurrencyRepository,
 )
-from exchange_rates.models import Currency as CurrencyModel
+from exchange_rates.infra.repositories.currency_registry import CurrencyRegistry
+from exchange_rates.infra.timing.request_timings import RequestTimings
+
+logger = logging.getLogger(__name__)
 
 
 class DjangoCurrencyRepository(CurrencyRepository):
@@ -14,7 +19,8 @@ class DjangoCurrencyRepository(CurrencyRepository):
     This class extends CurrencyRepository and provides methods to retrieve
     currency
     data from the Django ORM using both the currency's full name and short
-    name.
+    name. Lookups are served by the process-wide CurrencyRegistry, so they
+    only reach the database when the registry is (re)loaded.
 
     Attributes:
         None
@@ -25,8 +31,15 @@ class DjangoCurrencyRepository(CurrencyRepository):
 
         get_currency_by_short_name(short_name: str) -> CurrencyEntity:
             Retrieves a currency by its short name from the Django ORM.
+
+        get_currencies() -> list:
+            Retrieves every currency.
+
+        get_currencies_by_short_names(short_names: list) -> dict:
+            Retrieves several currencies by their short names at once.
     """
 
+    @RequestTimings.timed("currency")
     def get_currency_by_name(self, name: str) -> CurrencyEntity:
         """Retrieve a currency by its full name from the Django ORM.
 
@@ -40,11 +53,12 @@ class DjangoCurrencyRepository(CurrencyRepository):
         Raises:
             DoesNotExist: If no currency with the given name is found.
         """
-        if currency_orm := (CurrencyModel.objects.get(name=name)):
-            print("INFO: Currency successfully loaded.")
+        if currency_orm := (CurrencyRegistry.get_by_name(name)):
+            logger.debug("Currency loaded.", extra={"currency": name})
             return currency_orm
         return None
 
+    @RequestTimings.timed("currency")
     def get_currency_by_short_name(self, short_name: str) -> CurrencyEntity:
         """Retrieve a currency by its short name from the Django ORM.
 
@@ -58,7 +72,33 @@ class DjangoCurrencyRepository(CurrencyRepository):
         Raises:
             DoesNotExist: If no currency with the given short name is found.
         """
-        if currency_orm := (CurrencyModel.objects.get(short_name=short_name)):
-            print("INFO: Currency successfully loaded.")
+        if currency_orm := (CurrencyRegistry.get_by_short_name(short_name)):
+            logger.debug("Currency loaded.", extra={"currency": short_name})
             return currency_orm
         return None
+
+    @RequestTimings.timed("currency")
+    def get_currencies(self) -> list:
+        """Retrieve every currency.
+
+        Returns:
+            list: The currencies, ordered by id.
+        """
+        currencies = CurrencyRegistry.get_all()
+        logger.debug("Currencies loaded.", extra={"count": len(currencies)})
+        return currencies
+
+    @RequestTimings.timed("currency")
+    def get_currencies_by_short_names(self, short_names: list) -> dict:
+        """Retrieve several currencies by their short names at once.
+
+        Args:
+            short_names (list): The short names of the currencies.
+
+        Returns:
+            dict: The retrieved currencies keyed by short name. Short names
+            without a matching currency are left out.
+        """
+        currencies = CurrencyRegistry.get_many_by_short_names(short_names)
+        logger.debug("Currencies loaded.", extra={"count": len(currencies)})
+        return currencies
@@ -1,11 +1,25 @@
 """DjangoRate Repository
 """
+import csv
+import io
+import logging
+from datetime import datetime
+
+from django.db import connection, transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Now, Round
+
 from exchange_rates.core.entities import Rate as RateEntity
 from exchange_rates.core.repositories.rate_repository import RateRepository
 from exchange_rates.core.services.currency_service import CurrencyService
 from exchange_rates.models import Currency as CurrencyModel
+from exchange_rates.models import FetchedDay as FetchedDayModel
 from exchange_rates.models import Rate as RateModel
 
+UNIQUE_FIELDS = ["base", "date", "currency"]
+
+logger = logging.getLogger(__name__)
+
 
 class DjangoRateRepository(RateRepository):
     """
@@ -44,32 +58,269 @@ class DjangoRateRepository(RateRepository):
             of rates.
 
         Returns:
-            RateEntity: Exchange rate data retrieved from the database.
+            RateEntity: Exchange rate data retrieved from the database, with
+            the base and target currencies joined in the same query.
+        """
+        rate_orm = self._filter_rates(date=date, until_date=until_date).select_related(
+            "base", "currency"
+        )
+
+        logger.debug(
+            "Rates queried.",
+            extra={
+                "base": self.base_rate.short_name,
+                "date": date,
+                "until": until_date,
+            },
+        )
+        return rate_orm
+
+    def get_rates_version(self, date: str = None, until_date: str = None) -> dict:
+        """
+        Summarize the exchange rate data of a date range with a single
+        aggregate query, without loading the rates.
+
+        Args:
+            date (str, optional): The first date of the range.
+            until_date (str, optional): The last date of the range.
+
+        Returns:
+            dict: The ``count`` of rates and their ``last_modified`` time,
+            a ``count`` of 0 and a None ``last_modified`` when there are no
+            rates.
+        """
+        return self._filter_rates(date=date, until_date=until_date).aggregate(
+            count=Count("id"), last_modified=Max("updated")
+        )
+
+    def get_prices_by_date(self, currency: CurrencyModel, dates: list) -> dict:
+        """
+        Retrieve the price of a currency on several dates with a single query.
+
+        Args:
+            currency (CurrencyModel): The target currency.
+            dates (list): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date. Dates without a rate are left out.
+        """
+        return dict(
+            RateModel.objects.filter(
+                base=self.base_rate.id, currency=currency.id, date__in=dates
+            ).values_list("date", "price")
+        )
+
+    def get_covered_dates(self, dates: list, expired_before: datetime) -> set:
+        """
+        Tell which of several dates need no fetch, with a single query served
+        by the unique indexes of the ledger and of the rates.
+
+        A date is covered when it has stored rates, or a ledger entry telling
+        the provider had rates for it, or none. Entries without rates
+        recorded during the day itself (e.g. before the publication) expire.
+
+        Args:
+            dates (list): The dates to be checked.
+            expired_before (datetime): Entries without rates recorded during
+            their own day, and updated before this moment, are expired.
+
+        Returns:
+            set: The covered dates.
+        """
+        fetched_days = FetchedDayModel.objects.filter(
+            Q(status=FetchedDayModel.FETCHED)
+            | Q(updated__date__gt=F("date"))
+            | Q(updated__gte=expired_before),
+            base=self.base_rate.id,
+            date__in=dates,
+        ).values_list("date", flat=True)
+        stored_days = RateModel.objects.filter(
+            base=self.base_rate.id, date__in=dates
+        ).values_list("date", flat=True)
+        return set(fetched_days.union(stored_days))
+
+    def get_fetched_dates(self, dates: list) -> set:
+        """
+        Tell which of several dates hold rates, with a single query: the
+        dates with stored rates, or a ledger entry telling the provider had
+        rates for them. Dates fetched without rates are left out.
+
+        Args:
+            dates (list): The dates to be checked.
+
+        Returns:
+            set: The dates holding rates.
+        """
+        fetched_days = FetchedDayModel.objects.filter(
+            base=self.base_rate.id, date__in=dates, status=FetchedDayModel.FETCHED
+        ).values_list("date", flat=True)
+        stored_days = RateModel.objects.filter(
+            base=self.base_rate.id, date__in=dates
+        ).values_list("date", flat=True)
+        return set(fetched_days.union(stored_days))
+
+    def get_day_prices(self, dates: list) -> dict:
+        """
+        Retrieve the prices of every currency on several dates with a single
+        query, served by the covering index on base and date.
+
+        Args:
+            dates (list): The dates of the prices.
+
+        Returns:
+            dict: The prices keyed by date, then by currency id. Dates without
+            rates are left out.
+        """
+        prices = {}
+        for date, currency_id, price in RateModel.objects.filter(
+            base=self.base_rate.id, date__in=dates
+        ).values_list("date", "currency_id", "price"):
+            prices.setdefault(date, {})[currency_id] = price
+        return prices
+
+    def get_imprecise_dates(self, date: str = None, until_date: str = None) -> list:
+        """
+        Find the dates holding rates stored with 2 decimal places only, by
+        the schema preceding the 10 decimal places prices, with a single
+        query.
+
+        Prices upstream have many more decimal places, so a price equal to
+        its 2 decimal places rounding was truncated. The rate of the base
+        against itself is always 1 and is left out.
+
+        Args:
+            date (str, optional): The first date of the range.
+            until_date (str, optional): The last date of the range.
+
+        Returns:
+            list: The sorted dates.
+        """
+        rates = RateModel.objects.filter(base=self.base_rate.id)
+        if date:
+            rates = rates.filter(date__gte=date)
+        if until_date:
+            rates = rates.filter(date__lte=until_date)
+
+        return list(
+            rates.exclude(currency=self.base_rate.id)
+            .annotate(rounded_price=Round("price", 2))
+            .filter(price=F("rounded_price"))
+            .order_by("date")
+            .values_list("date", flat=True)
+            .distinct()
+        )
+
+    def rederive_rates(self, dates: list) -> int:
+        """
+        Recompute the stored rates of every other base from the rates of the
+        repository's base, with a single update.
+
+        Each rate becomes ``price(currency) / price(base)`` of the day. Rates
+        of days missing either price are left untouched.
+
+        Args:
+            dates (list): The dates of the rates.
+
+        Returns:
+            int: The number of rates recomputed.
+        """
+        day_rates = RateModel.objects.filter(
+            base=self.base_rate.id, date=OuterRef("date")
+        )
+        currency_rates = day_rates.filter(currency=OuterRef("currency"))
+        base_rates = day_rates.filter(currency=OuterRef("base"))
+
+        updated = (
+            RateModel.objects.filter(date__in=dates)
+            .exclude(base=self.base_rate.id)
+            .filter(Exists(currency_rates), Exists(base_rates))
+            .update(
+                price=Subquery(currency_rates.values("price")[:1])
+                / Subquery(base_rates.values("price")[:1]),
+                updated=Now(),
+            )
+        )
+        logger.info(
+            "Rates rederived.",
+            extra={
+                "base": self.base_rate.short_name,
+                "days": len(dates),
+                "count": updated,
+            },
+        )
+        return updated
+
+    def iter_rates(
+        self,
+        fields: tuple,
+        date: str = None,
+        until_date: str = None,
+        chunk_size: int = 2000,
+    ):
+        """
+        Iterate over the exchange rate data of an unbounded date range.
+
+        Rates are read through a server-side cursor (on PostgreSQL), in
+        chunks, ordered by date, currency and id, so memory stays flat
+        whatever the size of the range.
+
+        Args:
+            fields (tuple): The rate fields read, in tuple order.
+            date (str, optional): The first date of the range. Defaults to
+            the oldest rate.
+            until_date (str, optional): The last date of the range. Defaults
+            to the newest rate.
+            chunk_size (int, optional): Rates read from the database at once.
+
+        Returns:
+            Iterator: The rates, as tuples of ``fields``.
+        """
+        rate_orm = RateModel.objects.filter(base=self.base_rate.id)
+        if date:
+            rate_orm = rate_orm.filter(date__gte=date)
+        if until_date:
+            rate_orm = rate_orm.filter(date__lte=until_date)
+
+        return (
+            rate_orm.order_by("date", "currency_id", "id")
+            .values_list(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    def _filter_rates(self, date: str = None, until_date: str = None):
+        """
+        Build the queryset of the rates of a date range, or of every rate of
+        the base currency when no date is given.
+
+        Args:
+            date (str, optional): The specific date for which rates
+            are retrieved.
+            until_date (str, optional): The end date for a date range
+            of rates.
+
+        Returns:
+            QuerySet: The rates of the range.
         """
         if not date and not until_date:
-            rate_orm = RateModel.objects.all()
-        elif not until_date:
-            rate_orm = RateModel.objects.filter(
+            return RateModel.objects.filter(base=self.base_rate.id)
+        if not until_date:
+            return RateModel.objects.filter(
                 date__range=[date, date],
                 base=self.base_rate.id,
             )
-        else:
-            rate_orm = RateModel.objects.filter(
-                date__range=(date, until_date),
-                base=self.base_rate.id,
-            )
-
-        if not rate_orm:
-            print("INFO: Rate not loaded.")
-
-        print("INFO: Rate successfully loaded.")
-        return rate_orm
+        return RateModel.objects.filter(
+            date__range=(date, until_date),
+            base=self.base_rate.id,
+        )
 
     def create_rate(
         self, base_rate: CurrencyModel, currency: CurrencyModel, date: str, price: float
     ):  # no-qa
         """
-        Create a new exchange rate entry in the database.
+        Create or update an exchange rate entry in the database.
+
+        The rate is upserted (``INSERT ... ON CONFLICT DO UPDATE``) on its
+        base, date and currency, so creating the same rate twice is harmless.
 
         Args:
             base_rate (CurrencyModel): The base currency for the rate.
@@ -78,13 +329,174 @@ class DjangoRateRepository(RateRepository):
             price (float): The exchange rate value.
 
         Returns:
-            RateModel: The created rate entry.
+            RateModel: The created or updated rate entry.
         """
+        self._upsert_rates(
+            [RateModel(base=base_rate, currency=currency, date=date, price=price)]
+        )
+
         if rate_orm := (
-            RateModel.objects.create(
-                base=base_rate, currency=currency, date=date, price=price
-            )
+            RateModel.objects.get(base=base_rate, currency=currency, date=date)
         ):
-            print("INFO: Rate successfully created.")
+            logger.info(
+                "Rate created.",
+                extra={
+                    "base": base_rate.short_name,
+                    "currency": currency.short_name,
+                    "date": date,
+                    "sample": True,
+                },
+            )
             return rate_orm
         return None
+
+    def bulk_create_rates(
+        self, base_rate: CurrencyModel, rates: list, fetched_days: list = None
+    ):
+        """
+        Create several exchange rate entries with a single insert.
+
+        All rows are upserted inside one transaction, along with the ledger
+        entries of the days fetched, so a day (or a whole range of days) is
+        either fully stored or not stored at all, and rates already stored by
+        a concurrent request are updated instead of duplicated.
+
+        Args:
+            base_rate (CurrencyModel): The base currency for the rates.
+            rates (list): A list of dicts with the ``currency``
+            (CurrencyModel), ``date`` and ``price`` of each rate.
+            fetched_days (list, optional): A list of dicts with the ``date``,
+            ``status`` and ``effective_date`` of each day fetched.
+
+        Returns:
+            list: The created rate entries.
+        """
+        if not rates and not fetched_days:
+            return []
+
+        with transaction.atomic():
+            FetchedDayModel.objects.bulk_create(
+                [
+                    FetchedDayModel(base=base_rate, **fetched_day)
+                    for fetched_day in fetched_days or []
+                ],
+                update_conflicts=True,
+                unique_fields=["base", "date"],
+                update_fields=["status", "effective_date", "updated"],
+            )
+            rate_orm_list = self._upsert_rates(
+                [
+                    RateModel(
+                        base=base_rate,
+                        currency=rate["currency"],
+                        date=rate["date"],
+                        price=rate["price"],
+                    )
+                    for rate in rates
+                ]
+            )
+
+        logger.info(
+            "Rates created.",
+            extra={
+                "base": base_rate.short_name,
+                "count": len(rate_orm_list),
+                "days": len(fetched_days or []),
+            },
+        )
+        return rate_orm_list
+
+    def load_rates(
+        self, base_rate: CurrencyModel, rates: list, fetched_days: list = None
+    ) -> int:
+        """
+        Load a large batch of exchange rates, e.g. imported from historical
+        files.
+
+        On PostgreSQL the rows are streamed with ``COPY`` into a temporary
+        table and moved with a single ``INSERT ... ON CONFLICT DO UPDATE``,
+        sparing the building and binding of a parameter per value; on other
+        databases they are upserted like in ``bulk_create_rates``. Either way
+        the rates and the ledger entries of their days are written in one
+        transaction.
+
+        Args:
+            base_rate (CurrencyModel): The base currency for the rates.
+            rates (list): A list of dicts with the ``currency``
+            (CurrencyModel), ``date`` and ``price`` of each rate, a single
+            one per currency and date.
+            fetched_days (list, optional): A list of dicts with the ``date``,
+            ``status`` and ``effective_date`` of each day loaded.
+
+        Returns:
+            int: The number of rates loaded.
+        """
+        if connection.vendor != "postgresql":
+            return len(self.bulk_create_rates(base_rate, rates, fetched_days))
+        if not rates and not fetched_days:
+            return 0
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for rate in rates:
+            writer.writerow([rate["currency"].id, rate["date"], rate["price"]])
+        buffer.seek(0)
+
+        table = RateModel._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            FetchedDayModel.objects.bulk_create(
+                [
+                    FetchedDayModel(base=base_rate, **fetched_day)
+                    for fetched_day in fetched_days or []
+                ],
+                update_conflicts=True,
+                unique_fields=["base", "date"],
+                update_fields=["status", "effective_date", "updated"],
+            )
+            cursor.execute(
+                "CREATE TEMPORARY TABLE IF NOT EXISTS rate_import "
+                "(currency_id bigint, date date, price numeric(20, 10)) "
+                "ON COMMIT DROP"
+            )
+            cursor.execute("TRUNCATE rate_import")
+            cursor.copy_expert(
+                "COPY rate_import (currency_id, date, price) FROM STDIN WITH CSV",
+                buffer,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} "
+                "(base_id, currency_id, date, price, created, updated) "
+                "SELECT %s, currency_id, date, price, now(), now() FROM rate_import "
+                "ON CONFLICT (base_id, date, currency_id) "
+                "DO UPDATE SET price = EXCLUDED.price, updated = EXCLUDED.updated",
+                [base_rate.id],
+            )
+            loaded = cursor.rowcount
+
+        logger.info(
+            "Rates loaded.",
+            extra={
+                "base": base_rate.short_name,
+                "count": loaded,
+                "days": len(fetched_days or []),
+            },
+        )
+        return loaded
+
+    @staticmethod
+    def _upsert_rates(rate_orm_list: list) -> list:
+        """
+        Insert rates, updating the price of the ones already stored.
+
+        Args:
+            rate_orm_list (list): Unsaved RateModel instances.
+
+        Returns:
+            list: The given RateModel instances.
+        """
+        return RateModel.objects.bulk_create(
+            rate_orm_list,
+            update_conflicts=True,
+            unique_fields=UNIQUE_FIELDS,
+            update_fields=["price", "updated"],
+        )
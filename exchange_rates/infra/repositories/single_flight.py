@@ -0,0 +1,157 @@
+"""Single Flight
+"""
+import hashlib
+import threading
+from contextlib import contextmanager
+
+from decouple import config
+from django.db import connections
+
+
+class SingleFlight:
+    """
+    Lets a single worker at a time work on a key, like a ``(base, date)``
+    pair being fetched from the VAT service.
+
+    Threads of the same process are coordinated by in-process locks, and
+    processes sharing a PostgreSQL database by session-level advisory locks,
+    so concurrent requests for the same uncached day wait for the one doing
+    the fetch and then reuse its result instead of fetching it again.
+
+    Attributes:
+        use_advisory_locks (bool): Whether PostgreSQL advisory locks are
+        taken, coordinating every worker process.
+
+    Usage:
+        with SingleFlight.acquire([("USD", date)]):
+            ...  # check again, then fetch and store what is still missing
+    """
+
+    use_advisory_locks = config("RATES_ADVISORY_LOCKS", default=True, cast=bool)
+
+    _guard = threading.Lock()
+    _locks = {}
+
+    @classmethod
+    @contextmanager
+    def acquire(cls, keys: list, using: str = "default"):
+        """
+        Hold the locks of the given keys for the duration of the block.
+
+        Keys are always locked in the same order, so workers waiting on
+        overlapping sets of keys can not deadlock.
+
+        Args:
+            keys (list): Hashable keys to be locked.
+            using (str, optional): The database alias holding the advisory
+            locks.
+        """
+        keys = sorted(set(keys), key=repr)
+        locks = [cls._checkout(key) for key in keys]
+        acquired = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+
+            with cls._advisory_locks(keys, using):
+                yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            for key in keys:
+                cls._checkin(key)
+
+    @classmethod
+    @contextmanager
+    def _advisory_locks(cls, keys: list, using: str):
+        """
+        Hold PostgreSQL advisory locks on the keys, when enabled.
+
+        Args:
+            keys (list): Keys to be locked.
+            using (str): The database alias holding the locks.
+        """
+        connection = connections[using]
+        if not cls.use_advisory_locks or connection.vendor != "postgresql":
+            yield
+            return
+
+        lock_ids = [cls.lock_id(key) for key in keys]
+        locked = []
+        try:
+            with connection.cursor() as cursor:
+                for lock_id in lock_ids:
+                    cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+                    locked.append(lock_id)
+        except Exception:
+            # session-level locks outlive the request, release the ones taken
+            cls._advisory_unlock(connection, locked)
+            raise
+
+        try:
+            yield
+        finally:
+            cls._advisory_unlock(connection, lock_ids)
+
+    @staticmethod
+    def _advisory_unlock(connection, lock_ids: list) -> None:
+        """
+        Release PostgreSQL advisory locks, in the reverse order of their
+        acquisition.
+
+        Args:
+            connection: The database connection holding the locks.
+            lock_ids (list): The ids of the locks.
+        """
+        if not lock_ids:
+            return
+        with connection.cursor() as cursor:
+            for lock_id in reversed(lock_ids):
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+    @staticmethod
+    def lock_id(key) -> int:
+        """
+        Map a key to a stable signed 64 bits advisory lock id.
+
+        Args:
+            key: The key to be mapped.
+
+        Returns:
+            int: The advisory lock id.
+        """
+        digest = hashlib.blake2b(
+            f"exchange_rates:{key!r}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    @classmethod
+    def _checkout(cls, key) -> threading.Lock:
+        """
+        Return the in-process lock of a key, creating it when needed.
+
+        Args:
+            key: The key of the lock.
+
+        Returns:
+            threading.Lock: The lock of the key.
+        """
+        with cls._guard:
+            entry = cls._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+            return entry[0]
+
+    @classmethod
+    def _checkin(cls, key) -> None:
+        """
+        Release a reference to the lock of a key, dropping unused locks.
+
+        Args:
+            key: The key of the lock.
+        """
+        with cls._guard:
+            entry = cls._locks[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del cls._locks[key]
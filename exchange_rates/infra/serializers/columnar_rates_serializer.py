@@ -0,0 +1,117 @@
+"""
+Columnar serializer for rates response data.
+"""
+from decimal import Decimal
+
+from exchange_rates.infra.serializers.fast_rates_serializer import FastRateSerializer
+
+
+class ColumnarRateSerializer(FastRateSerializer):
+    """
+    Serializer rendering rate rows as parallel arrays.
+
+    Instead of repeating the nested base and currency of every rate, each
+    currency is listed once in ``currencies`` (keyed by id) and the rates are
+    given as the parallel ``dates``, ``currency_ids`` and ``prices`` arrays.
+    With ``pivot`` the rates are also given as a ``date x currency`` matrix,
+    holding null where a currency has no rate on a date.
+
+    Example:
+        rows = queryset.values_list(*ColumnarRateSerializer.fields)
+        content = ColumnarRateSerializer(pivot=True).render({"rates": rows})
+    """
+
+    def __init__(self, currencies: dict = None, pivot: bool = False) -> None:
+        """
+        Initializes the serializer.
+
+        Args:
+            currencies (dict, optional): Currencies keyed by id. Defaults to
+            the CurrencyRegistry.
+            pivot (bool, optional): Whether the ``date x currency`` matrix is
+            rendered.
+        """
+        super().__init__(currencies)
+        self.pivot = pivot
+
+    def to_representation(self, rows) -> dict:
+        """
+        Converts rate rows into their columnar representation.
+
+        Args:
+            rows (iterable): Rows read with ``fields``, ordered by date.
+
+        Returns:
+            dict: The ``base`` id, the ``currencies`` and the rate arrays, and
+            the ``pivot`` matrix when requested.
+        """
+        exponent = self._exponent
+        base = None
+        currencies = {}
+        dates, currency_ids, prices = [], [], []
+        for _, date, price, _, _, base_id, currency_id in rows:
+            base = base_id
+            for currency in (base_id, currency_id):
+                if currency not in currencies:
+                    currencies[currency] = self._currency(currency)
+            dates.append(date.isoformat())
+            currency_ids.append(currency_id)
+            prices.append(f"{Decimal(price).quantize(exponent):f}")
+
+        data = {
+            "base": base,
+            "currencies": {
+                str(currency_id): {
+                    key: currency[key] for key in ("name", "short_name", "symbol")
+                }
+                for currency_id, currency in currencies.items()
+            },
+            "dates": dates,
+            "currency_ids": currency_ids,
+            "prices": prices,
+        }
+        if self.pivot:
+            data["pivot"] = self.to_pivot(dates, currency_ids, prices)
+        return data
+
+    @staticmethod
+    def to_pivot(dates: list, currency_ids: list, prices: list) -> dict:
+        """
+        Arranges parallel rate arrays as a ``date x currency`` matrix.
+
+        Args:
+            dates (list): The date of each rate.
+            currency_ids (list): The currency id of each rate.
+            prices (list): The price of each rate.
+
+        Returns:
+            dict: The distinct ``dates`` (rows), ``currency_ids`` (columns)
+            and the ``prices`` matrix.
+        """
+        rows = {date: index for index, date in enumerate(dict.fromkeys(dates))}
+        columns = {
+            currency_id: index
+            for index, currency_id in enumerate(sorted(set(currency_ids)))
+        }
+        matrix = [[None] * len(columns) for _ in rows]
+        for date, currency_id, price in zip(dates, currency_ids, prices):
+            matrix[rows[date]][columns[currency_id]] = price
+        return {
+            "dates": list(rows),
+            "currency_ids": list(columns),
+            "prices": matrix,
+        }
+
+    def render(self, data: dict) -> bytes:
+        """
+        Renders a response to JSON bytes, replacing its ``rates`` rows with
+        their columnar representation.
+
+        Args:
+            data (dict): The response data, holding the rows as ``rates``.
+
+        Returns:
+            bytes: The JSON response.
+        """
+        rest = {key: value for key, value in data.items() if key != "rates"}
+        return self.dumps({**self.to_representation(data["rates"]), **rest})
@@ -0,0 +1,75 @@
+"""
+Serializers for handling conversion request data.
+"""
+from datetime import date as Date
+from decimal import Decimal, InvalidOperation
+
+from decouple import config
+from rest_framework import serializers
+
+
+class ConversionField(serializers.Field):
+    """
+    Field parsing a ``[amount, from, to, date]`` conversion.
+
+    The conversion is parsed in a single step, without a nested serializer,
+    so batches of thousands of conversions validate quickly.
+    """
+
+    default_error_messages = {
+        "invalid": "Expected an [amount, from, to, date] list, "
+        "with a finite amount and an ISO date.",
+    }
+
+    def to_internal_value(self, data) -> tuple:
+        """
+        Parse a conversion.
+
+        Args:
+            data (list): The ``[amount, from, to, date]`` conversion.
+
+        Returns:
+            tuple: The Decimal amount, the upper case short names of both
+            currencies and the date.
+        """
+        if not isinstance(data, (list, tuple)) or len(data) != 4:
+            self.fail("invalid")
+
+        amount, from_currency, to_currency, date = data
+        try:
+            amount = Decimal(str(amount))
+            date = Date.fromisoformat(date)
+        except (InvalidOperation, TypeError, ValueError):
+            self.fail("invalid")
+        if not amount.is_finite():
+            self.fail("invalid")
+        return amount, str(from_currency).upper(), str(to_currency).upper(), date
+
+    def to_representation(self, value) -> list:
+        """
+        Represent a conversion.
+
+        Args:
+            value (tuple): The parsed conversion.
+
+        Returns:
+            list: The ``[amount, from, to, date]`` conversion.
+        """
+        amount, from_currency, to_currency, date = value
+        return [str(amount), from_currency, to_currency, date.isoformat()]
+
+
+class ConversionBatchRequestSerializer(serializers.Serializer):
+    """
+    Serializer for handling batch conversion request data.
+
+    Attributes:
+        conversions (ListField): The ``[amount, from, to, date]``
+        conversions, up to ``CONVERT_BATCH_MAX_SIZE``.
+    """
+
+    conversions = serializers.ListField(
+        child=ConversionField(),
+        allow_empty=False,
+        max_length=config("CONVERT_BATCH_MAX_SIZE", default=10000, cast=int),
+    )
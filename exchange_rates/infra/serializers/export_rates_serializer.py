@@ -0,0 +1,49 @@
+"""
+Serializer for exported rates data.
+"""
+from decimal import Decimal
+
+from exchange_rates.infra.serializers.fast_rates_serializer import FastRateSerializer
+
+
+class ExportRateSerializer(FastRateSerializer):
+    """
+    Serializer turning rate rows into flat export records.
+
+    Each record holds the date, the short names of the base and target
+    currencies and the price of a rate, so it fits a CSV line as well as a
+    NDJSON one.
+
+    Attributes:
+        fields (tuple): The rate fields read, in tuple order.
+        header (tuple): The keys of each record, in column order.
+
+    Example:
+        rows = queryset.values_list(*ExportRateSerializer.fields)
+        records = ExportRateSerializer().to_representation(rows)
+    """
+
+    fields = ("date", "price", "base_id", "currency_id")
+    header = ("date", "base", "currency", "price")
+
+    def to_representation(self, rows) -> list:
+        """
+        Converts rate rows into export records.
+
+        Args:
+            rows (iterable): Rows read with ``fields``.
+
+        Returns:
+            list: The record of each rate.
+        """
+        currency = self._currency
+        exponent = self._exponent
+        return [
+            {
+                "date": date.isoformat(),
+                "base": currency(base_id)["short_name"],
+                "currency": currency(currency_id)["short_name"],
+                "price": f"{Decimal(price).quantize(exponent):f}",
+            }
+            for date, price, base_id, currency_id in rows
+        ]
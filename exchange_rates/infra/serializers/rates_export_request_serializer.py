@@ -0,0 +1,22 @@
+"""
+Serializers for handling rates export request data.
+"""
+from rest_framework import serializers
+
+
+class RateExportRequestSerializer(serializers.Serializer):
+    """
+    Serializer for handling rate export request parameters.
+
+    Attributes:
+        rate_base (CharField, optional): The base currency for rate
+        conversion.
+        date (DateField, optional): The first day exported. Defaults to the
+        oldest stored rate.
+        until_date (DateField, optional): The last day exported. Defaults to
+        the newest stored rate.
+    """
+
+    rate_base = serializers.CharField(required=False)
+    date = serializers.DateField(required=False)
+    until_date = serializers.DateField(required=False)
@@ -17,8 +17,21 @@ class RateRequestSerializer(serializers.Serializer):
         conversion.
         until_date (DateField, optional): The end date of the requested
         rate range.
+        page_size (IntegerField, optional): The rates per page.
+        cursor (CharField, optional): The cursor of the requested page, as
+        returned in the ``next`` field of the previous page.
+        serializer (ChoiceField, optional): ``fast`` renders the response
+        with FastRateSerializer instead of the DRF serializers.
+        pivot (BooleanField, optional): Whether a ``format=columnar`` response
+        also holds the ``date x currency`` price matrix.
     """
 
     date = serializers.DateField(required=False)
     rate_base = serializers.CharField(required=False)
     until_date = serializers.DateField(required=False)
+    page_size = serializers.IntegerField(required=False, min_value=1)
+    cursor = serializers.CharField(required=False)
+    serializer = serializers.ChoiceField(
+        choices=["default", "fast"], required=False, default="default"
+    )
+    pivot = serializers.BooleanField(required=False, default=False)
@@ -0,0 +1,134 @@
+"""Server Timing Middleware
+"""
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from decouple import config
+
+from exchange_rates.infra.timing.request_timings import RequestTimings
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware timing each request and exposing where the time went.
+
+    The database queries, VAT service calls, currency lookups and
+    serialization of a request are recorded by RequestTimings and sent back
+    in a ``Server-Timing`` header, readable in the browser developer tools,
+    and in a single structured log line. Recording costs a few counter
+    updates per query or call, so it is meant to stay on in production.
+
+    Attributes:
+        enabled (bool): Whether requests are timed at all.
+        log (bool): Whether a log line is written for each request.
+
+    Example:
+        Server-Timing: db;dur=3.1;desc="4 queries",
+            upstream;dur=212.0;desc="1 calls", serialize;dur=1.2, total;dur=220.4
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    enabled = config("SERVER_TIMING_ENABLED", default=True, cast=bool)
+    log = config("SERVER_TIMING_LOG", default=True, cast=bool)
+
+    descriptions = {"db": "queries", "upstream": "calls"}
+
+    def __init__(self, get_response) -> None:
+        """
+        Initializes the middleware.
+
+        Args:
+            get_response (callable): The next handler, sync or async.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Time a request.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            HttpResponse: The response, with the Server-Timing header.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        timings, token = RequestTimings.start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            RequestTimings.stop(token)
+        return self.finish(request, response, timings, started)
+
+    async def __acall__(self, request):
+        """
+        Time a request served by an async handler.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            HttpResponse: The response, with the Server-Timing header.
+        """
+        if not self.enabled:
+            return await self.get_response(request)
+
+        timings, token = RequestTimings.start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            RequestTimings.stop(token)
+        return self.finish(request, response, timings, started)
+
+    def finish(self, request, response, timings: RequestTimings, started: float):
+        """
+        Add the timings of a request to its response and log them.
+
+        Args:
+            request: The HTTP request object.
+            response: The response.
+            timings (RequestTimings): The timings of the request.
+            started (float): When the request started, in perf counter
+            seconds.
+
+        Returns:
+            HttpResponse: The same response.
+        """
+        total = time.perf_counter() - started
+
+        metrics = []
+        for name, seconds in timings.seconds.items():
+            metric = f"{name};dur={seconds * 1000:.1f}"
+            if description := self.descriptions.get(name):
+                metric += f';desc="{timings.counts[name]} {description}"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        response["Server-Timing"] = ", ".join(metrics)
+
+        if self.log:
+            line = {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "total_ms": round(total * 1000, 1),
+                **{
+                    f"{name}_ms": round(seconds * 1000, 1)
+                    for name, seconds in timings.seconds.items()
+                },
+                **{f"{name}_count": count for name, count in timings.counts.items()},
+            }
+            logger.info("Request timed.", extra=line)
+        return response
@@ -0,0 +1,175 @@
+"""Request Timings
+"""
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+class RequestTimings:
+    """
+    Time spent by the current request on each kind of work, e.g. database
+    queries, VAT service calls or serialization.
+
+    The timings of a request live in a context variable, so they follow the
+    request across threads started with ``copy_context`` and across
+    ``sync_to_async`` calls, and recording outside of a request is a no-op.
+    Every database connection reports its queries as ``db``.
+
+    Attributes:
+        counts (dict): The number of times each kind of work was done.
+        seconds (dict): The seconds spent on each kind of work.
+
+    Usage:
+        timings, token = RequestTimings.start()
+        with RequestTimings.measure("serialize"):
+            ...
+        RequestTimings.stop(token)
+        timings.seconds["serialize"]
+    """
+
+    _current = contextvars.ContextVar("request_timings", default=None)
+
+    def __init__(self) -> None:
+        """
+        Initializes empty timings.
+        """
+        self._lock = threading.Lock()
+        self.counts = {}
+        self.seconds = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Add some work to the timings.
+
+        Args:
+            name (str): The kind of work.
+            seconds (float): The time it took.
+        """
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    @classmethod
+    def start(cls) -> tuple:
+        """
+        Start recording the timings of the current context.
+
+        Returns:
+            tuple: The new timings and the token restoring the previous ones.
+        """
+        timings = cls()
+        return timings, cls._current.set(timings)
+
+    @classmethod
+    def stop(cls, token) -> None:
+        """
+        Stop recording the timings of the current context.
+
+        Args:
+            token (contextvars.Token): The token returned by ``start``.
+        """
+        cls._current.reset(token)
+
+    @classmethod
+    def current(cls) -> "RequestTimings":
+        """
+        Returns the timings being recorded, None outside of a request.
+        """
+        return cls._current.get()
+
+    @classmethod
+    def record(cls, name: str, seconds: float) -> None:
+        """
+        Add some work to the timings being recorded, if any.
+
+        Args:
+            name (str): The kind of work.
+            seconds (float): The time it took.
+        """
+        if (timings := cls._current.get()) is not None:
+            timings.add(name, seconds)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str):
+        """
+        Record the time spent in a block.
+
+        Args:
+            name (str): The kind of work.
+        """
+        if cls._current.get() is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(name, time.perf_counter() - started)
+
+    @classmethod
+    def timed(cls, name: str):
+        """
+        Decorate a function, recording the time spent in each call.
+
+        Args:
+            name (str): The kind of work.
+
+        Returns:
+            callable: The decorator.
+        """
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with cls.measure(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper recording the time of each query as ``db``.
+
+    Args:
+        execute (callable): The next execute function.
+        sql (str): The query.
+        params: The query parameters.
+        many (bool): Whether it is an ``executemany`` call.
+        context (dict): The connection and cursor.
+
+    Returns:
+        The result of the query.
+    """
+    if RequestTimings.current() is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        RequestTimings.record("db", time.perf_counter() - started)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    Record the queries of every new database connection, whatever the
+    thread it belongs to.
+
+    Args:
+        sender: The database wrapper class.
+        connection: The new connection.
+        **kwargs: Additional signal arguments (unused).
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
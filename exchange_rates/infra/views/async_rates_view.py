@@ -0,0 +1,74 @@
+"""
+Async view for handling exchange rates info.
+"""
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from requests import codes
+
+from exchange_rates.core.services.async_rates_service import AsyncRatesService
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.serializers.rates_request_serializer import (
+    RateRequestSerializer,
+)
+from exchange_rates.infra.views.rates_view import RatesView
+
+rates_view = RatesView.as_view()
+
+
+class AsyncRatesView(View):
+    """
+    Async API view for retrieving exchange rates, served under ASGI.
+
+    Cached responses are served first, without reading the database. The
+    days missing from the database are otherwise fetched from the VAT
+    service by the AsyncRatesService, on the event loop, so a worker waits on
+    any number of slow upstream calls without holding a thread. The rates are
+    then read and rendered by RatesView, which does not look for missing days
+    again, so the query parameters, formats, caching and validators of both
+    views are the same.
+
+    Example:
+        GET /rates/async/?rate_base=USD&date=2023-08-21&until_date=2023-08-25
+
+    Methods:
+        get(request): Handles GET requests for exchange rate information.
+    """
+
+    async def get(self, request):
+        """
+        Handle GET requests for exchange rate information.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            HttpResponse: The HTTP response containing exchange rate
+            information or an error message.
+
+        Raises:
+            None
+        """
+        if (
+            response := await sync_to_async(RatesView.cached_response)(request)
+        ) is not None:
+            return response
+
+        serializer = RateRequestSerializer(data=request.GET.dict())
+        if serializer.is_valid() and (date := serializer.validated_data.get("date")):
+            try:
+                days = RatesService.get_search_days(
+                    date, serializer.validated_data.get("until_date")
+                )
+                service = await AsyncRatesService.create(
+                    base_rate=serializer.validated_data.get("rate_base", "USD")
+                )
+                await service.prefetch(days)
+                request.rates_prefetched = True
+            # pylint: disable=W0703
+            except Exception as err:
+                # pylint: enable=W0703
+                result = {"error": {"message": err.args}}
+                return JsonResponse(result, status=codes.BAD_REQUEST)
+
+        return await sync_to_async(rates_view)(request)
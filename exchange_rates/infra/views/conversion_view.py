@@ -0,0 +1,59 @@
+"""
+View for converting amounts between currencies.
+"""
+from requests import codes
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from exchange_rates.core.services.conversion_service import ConversionService
+from exchange_rates.infra.serializers.conversion_request_serializer import (
+    ConversionBatchRequestSerializer,
+)
+
+
+class ConversionBatchView(APIView):
+    """
+    API view converting batches of amounts between currencies.
+
+    This view handles POST requests holding ``[amount, from, to, date]``
+    conversions and answers the converted amounts in input order, so a whole
+    billing job takes a single request.
+
+    Example:
+        POST /convert/batch
+        {"conversions": [["10.00", "USD", "BRL", "2023-08-21"]]}
+
+        {"results": [{"amount": "49.70", "rate": "4.9700000000"}]}
+
+    Methods:
+        post(request): Handles POST requests for batch conversions.
+    """
+
+    def post(self, request):
+        """
+        Handle POST requests for batch conversions.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            Response: The HTTP response containing the result of each
+            conversion, or an error message.
+
+        Raises:
+            None
+        """
+        serializer = ConversionBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            results = ConversionService().convert(
+                serializer.validated_data["conversions"]
+            )
+        # pylint: disable=W0703
+        except Exception as err:
+            # pylint: enable=W0703
+            result = {"error": {"message": err.args}}
+            return Response(result, status=codes.BAD_REQUEST)
+
+        return Response({"results": results}, status=codes.OK)
@@ -0,0 +1,132 @@
+"""
+Keyset pagination for exchange rates.
+"""
+import base64
+from datetime import date as Date
+
+from decouple import config
+from django.db.models import Q
+
+
+class RateKeysetPagination:
+    """
+    Paginates rates by keyset (a.k.a. cursor) on ``(date, currency_id, id)``.
+
+    Each page is read with an indexed range condition starting right after
+    the last row of the previous page, so reading page N costs the same as
+    reading the first one, and rows inserted meanwhile never shift pages.
+
+    Attributes:
+        ordering (tuple): The fields rates are ordered by.
+        page_size (int): Rates per page when none is requested.
+        max_page_size (int): Maximum rates per page.
+        next_cursor (str): The cursor of the next page, None on the last
+        page.
+
+    Usage:
+        pagination = RateKeysetPagination(page_size=100, cursor=cursor)
+        rates = pagination.paginate(queryset)
+        next_cursor = pagination.next_cursor
+    """
+
+    ordering = ("date", "currency_id", "id")
+    page_size = config("RATES_PAGE_SIZE", default=200, cast=int)
+    max_page_size = config("RATES_MAX_PAGE_SIZE", default=1000, cast=int)
+
+    def __init__(self, page_size: int = None, cursor: str = None) -> None:
+        """
+        Initializes the pagination of a request.
+
+        Args:
+            page_size (int, optional): The requested rates per page, capped
+            to ``max_page_size``.
+            cursor (str, optional): The cursor of the requested page.
+        """
+        self.page_size = min(page_size or self.page_size, self.max_page_size)
+        self.cursor = cursor
+        self.next_cursor = None
+
+    def paginate(self, queryset, position=None) -> list:
+        """
+        Read a page of rates.
+
+        Args:
+            queryset (QuerySet): The rates to be paginated.
+            position (callable, optional): Returns the date, currency id and
+            id of a rate read from the queryset. Defaults to reading the
+            attributes of a Rate instance.
+
+        Returns:
+            list: The rates of the page.
+
+        Raises:
+            Exception: If the cursor is invalid.
+        """
+        queryset = queryset.order_by(*self.ordering)
+
+        if self.cursor:
+            date, currency_id, rate_id = self.decode_cursor(self.cursor)
+            queryset = queryset.filter(
+                Q(date__gt=date)
+                | Q(date=date, currency_id__gt=currency_id)
+                | Q(date=date, currency_id=currency_id, id__gt=rate_id)
+            )
+
+        rates = list(queryset[: self.page_size + 1])
+        if len(rates) > self.page_size:
+            rates = rates[: self.page_size]
+            self.next_cursor = self.encode_cursor(
+                *(position or self.rate_position)(rates[-1])
+            )
+        return rates
+
+    @staticmethod
+    def rate_position(rate) -> tuple:
+        """
+        Returns the keyset position of a Rate instance.
+
+        Args:
+            rate (Rate): The rate.
+
+        Returns:
+            tuple: The date, currency id and id of the rate.
+        """
+        return rate.date, rate.currency_id, rate.id
+
+    @staticmethod
+    def encode_cursor(date: Date, currency_id: int, rate_id: int) -> str:
+        """
+        Build the opaque cursor of a position.
+
+        Args:
+            date (datetime.date): The date of the last rate read.
+            currency_id (int): The currency id of the last rate read.
+            rate_id (int): The id of the last rate read.
+
+        Returns:
+            str: The cursor.
+        """
+        position = f"{date.isoformat()}|{currency_id}|{rate_id}"
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        """
+        Read the position of an opaque cursor.
+
+        Args:
+            cursor (str): The cursor.
+
+        Returns:
+            tuple: The date, currency id and id of the last rate read.
+
+        Raises:
+            Exception: If the cursor is invalid.
+        """
+        try:
+            date, currency_id, rate_id = (
+                base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            )
+            return Date.fromisoformat(date), int(currency_id), int(rate_id)
+        except ValueError as err:
+            raise Exception("Invalid cursor.") from err
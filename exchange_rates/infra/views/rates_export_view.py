@@ -0,0 +1,111 @@
+"""
+View for exporting exchange rates.
+"""
+from itertools import islice
+
+from decouple import config
+from django.http import StreamingHttpResponse
+from requests import codes
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.serializers.export_rates_serializer import (
+    ExportRateSerializer,
+)
+from exchange_rates.infra.serializers.rates_export_request_serializer import (
+    RateExportRequestSerializer,
+)
+from exchange_rates.infra.views.renderers import CSVRenderer, NDJSONRenderer
+
+
+class RatesExportView(APIView):
+    """
+    API view streaming the stored exchange rates of date ranges of any size.
+
+    Rates are read through a server-side cursor, chunk by chunk, and every
+    chunk is sent as soon as it is rendered, so memory stays flat whatever the
+    size of the range and the first bytes arrive immediately. The export is
+    NDJSON by default, CSV with ``format=csv`` (or ``Accept: text/csv``).
+
+    Unlike RatesView, the range is not limited to 5 days and missing days are
+    not fetched from the VAT service.
+
+    Attributes:
+        chunk_size (int): Rates read from the database and sent at once.
+
+    Methods:
+        get(request): Handles GET requests for exchange rate exports.
+    """
+
+    chunk_size = config("RATES_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def get(self, request):
+        """
+        Handle GET requests for exchange rate exports.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            StreamingHttpResponse: The streamed rates, or a Response holding
+            an error message.
+
+        Raises:
+            None
+        """
+        serializer = RateExportRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+
+        rate_base = serializer.validated_data.get("rate_base", "USD")
+        date = serializer.validated_data.get("date")
+        until_date = serializer.validated_data.get("until_date")
+
+        try:
+            service = RatesService(base_rate=rate_base)
+            rows = service.export(
+                ExportRateSerializer.fields,
+                date=date,
+                until_date=until_date,
+                chunk_size=self.chunk_size,
+            )
+        # pylint: disable=W0703
+        except Exception as err:
+            # pylint: enable=W0703
+            result = {"error": {"message": err.args}}
+            return Response(result, status=codes.BAD_REQUEST)
+
+        renderer = request.accepted_renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        response = StreamingHttpResponse(
+            renderer.stream(self._chunks(service, rows), ExportRateSerializer.header),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="rates-{service.base_rate.short_name}'
+            f'.{renderer.format}"'
+        )
+        return response
+
+    def _chunks(self, service: RatesService, rows):
+        """
+        Group rate rows in chunks of export records, against the requested
+        base.
+
+        Args:
+            service (RatesService): The service of the requested base.
+            rows (iterator): Canonical rows read with
+            ``ExportRateSerializer.fields``.
+
+        Yields:
+            list: The export records of up to ``chunk_size`` rates.
+        """
+        serializer = ExportRateSerializer()
+        while chunk := list(islice(rows, self.chunk_size)):
+            yield serializer.to_representation(
+                service.derive_rows(chunk, ExportRateSerializer.fields)
+            )
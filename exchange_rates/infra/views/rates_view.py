@@ -1,18 +1,40 @@
 """
 View for handling exchange rates info.
 """
+import hashlib
+
+from decouple import config
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+from django.utils.http import http_date
 from requests import codes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 from exchange_rates.core.entities.rate import Rate
 from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.infra.serializers.columnar_rates_serializer import (
+    ColumnarRateSerializer,
+)
+from exchange_rates.infra.serializers.fast_rates_serializer import (
+    FastRateSerializer,
+)
 from exchange_rates.infra.serializers.rates_request_serializer import (
     RateRequestSerializer,
 )
 from exchange_rates.infra.serializers.rates_response_serializer import (
     RateResponseSerializer,
 )
+from exchange_rates.infra.timing.request_timings import RequestTimings
+from exchange_rates.infra.views.pagination import RateKeysetPagination
+from exchange_rates.infra.views.rendered_response import RenderedResponse
+from exchange_rates.infra.views.renderers import ColumnarJSONRenderer
 
 
 class RatesView(APIView):
@@ -20,16 +42,36 @@ class RatesView(APIView):
     API view for retrieving exchange rates based on query parameters.
 
     This view handles GET requests and returns exchange rate information
-    based on the provided query parameters. It supports pagination and allows
-    querying rates between specific dates.
+    based on the provided query parameters. It supports keyset pagination
+    (``page_size`` and the ``cursor`` returned as ``next``) and allows
+    querying rates between specific dates. With ``serializer=fast`` the
+    response is rendered by FastRateSerializer from plain rows, skipping the
+    DRF serializers. With ``format=columnar`` each currency is sent once and
+    the rates as parallel arrays (plus a ``date x currency`` matrix with
+    ``pivot=true``), see ColumnarRateSerializer. Rendered JSON responses are
+    kept in the RatesResponseCache, so repeated queries skip the database and
+    the serializers.
+
+    Responses carry ETag and Last-Modified validators, built from the count
+    and the last update of the rates they hold, and conditional requests
+    (If-None-Match / If-Modified-Since) are answered with a 304. Responses
+    covering past days only may be kept by browsers and CDNs for
+    ``historical_max_age`` seconds, then must be revalidated. They are not
+    marked immutable: repair_rates and import_rates can rewrite past days,
+    and bumping the cache generation does not reach the copies held by
+    browsers and CDNs.
 
     Attributes:
-        None
+        historical_max_age (int): Seconds browsers and CDNs may keep a
+        response covering past days only.
 
     Methods:
         get(request): Handles GET requests for exchange rate information.
     """
 
+    historical_max_age = config("RATES_HISTORICAL_MAX_AGE", default=3600, cast=int)
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+
     def get(self, request) -> Rate:
         """
         Handle GET requests for exchange rate information.
@@ -44,28 +86,284 @@ class RatesView(APIView):
         Raises:
             None
         """
-        self.page_number = self.request.query_params.get("page_number ", 1)
-        self.page_size = self.request.query_params.get("page_size ", 10)
+        params, pagination, cache_key = self._read_params(request)
+        rate_base = params["rate_base"]
+        date = params["date"]
+        until_date = params["until_date"]
+        fast = params["serializer"] == "fast"
+        columnar = params["format"] == ColumnarJSONRenderer.format
+        pivot = params["pivot"]
 
-        query_params = request.query_params.dict()
-        serializer = RateRequestSerializer(data=query_params)
-        serializer.is_valid(raise_exception=True)
+        if response := self._cached_response(request, cache_key, date, until_date):
+            return response
 
-        service = RatesService(
-            base_rate=serializer.validated_data.get("rate_base", "USD")
-        )
+        service = RatesService(base_rate=rate_base)
+        if self._is_conditional(request):
+            validators = self._validators(service.get_version(date, until_date), params)
+            if response := self._conditional_response(
+                request, validators, date, until_date
+            ):
+                return response
+
+        data = None
         try:
             result = service.proccess(
-                date=serializer.validated_data.get("date"),
-                until_date=serializer.validated_data.get("until_date", None),
+                date=date,
+                until_date=until_date,
+                fetch_missing=not getattr(request, "rates_prefetched", False),
             )
-            status_code = codes.OK
-            serializer = RateResponseSerializer(result, many=True)
-            result = {"rates": serializer.data}
+            if fast or columnar:
+                rows = service.derive_rows(
+                    pagination.paginate(
+                        result.values_list(*FastRateSerializer.fields),
+                        position=FastRateSerializer.position,
+                    ),
+                    FastRateSerializer.fields,
+                )
+                flat_serializer = (
+                    ColumnarRateSerializer(pivot=pivot)
+                    if columnar
+                    else FastRateSerializer()
+                )
+                with RequestTimings.measure("serialize"):
+                    content = flat_serializer.render(
+                        {"rates": rows, "next": pagination.next_cursor}
+                    )
+            else:
+                rates = service.derive_rates(pagination.paginate(result))
+                with RequestTimings.measure("serialize"):
+                    serializer = RateResponseSerializer(rates, many=True)
+                    data = {"rates": serializer.data, "next": pagination.next_cursor}
         # pylint: disable=W0703
         except Exception as err:
             # pylint: enable=W0703
             result = {"error": {"message": err.args}}
-            status_code = codes.BAD_REQUEST
+            return Response(result, status=codes.BAD_REQUEST)
+
+        validators = self._validators(service.get_version(date, until_date), params)
+
+        if cache_key is None:
+            return self._set_validators(
+                Response(data, status=codes.OK), validators, date, until_date
+            )
+
+        if not (fast or columnar):
+            with RequestTimings.measure("serialize"):
+                content = JSONRenderer().render(data)
+        RatesResponseCache.set(
+            cache_key,
+            {"content": content, "validators": validators},
+            RatesResponseCache.ttl(date, until_date),
+        )
+        return self._set_validators(
+            RenderedResponse(content, data=data, status=codes.OK),
+            validators,
+            date,
+            until_date,
+        )
+
+    @classmethod
+    def cached_response(cls, request):
+        """
+        Answer a request from the rates cache alone, without reading the
+        database, e.g. before AsyncRatesView fetches the missing days.
+
+        Args:
+            request (HttpRequest): The Django request.
+
+        Returns:
+            Response: The finalized cached response, or None when it is not
+            cached or the request is invalid, to be handled by ``get``.
+        """
+        view = cls()
+        view.setup(request)
+        request = view.request = view.initialize_request(request)
+        view.headers = view.default_response_headers
+        try:
+            view.initial(request)
+            params, _, cache_key = view._read_params(request)
+        # pylint: disable=W0703
+        except Exception:
+            # pylint: enable=W0703
+            return None
+
+        response = view._cached_response(
+            request, cache_key, params["date"], params["until_date"]
+        )
+        return response and view.finalize_response(request, response)
+
+    @staticmethod
+    def _read_params(request) -> tuple:
+        """
+        Read the query parameters of a request.
+
+        Args:
+            request: The HTTP request object, once its renderer is negotiated.
+
+        Returns:
+            tuple: The parameters identifying the response, its
+            RateKeysetPagination and its cache key, None for the formats not
+            cached.
+
+        Raises:
+            ValidationError: If the query parameters are invalid.
+        """
+        serializer = RateRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+
+        renderer_format = request.accepted_renderer.format
+        pagination = RateKeysetPagination(
+            page_size=serializer.validated_data.get("page_size"),
+            cursor=serializer.validated_data.get("cursor"),
+        )
+        params = {
+            "rate_base": serializer.validated_data.get("rate_base", "USD"),
+            "date": serializer.validated_data.get("date"),
+            "until_date": serializer.validated_data.get("until_date", None),
+            "page_size": pagination.page_size,
+            "cursor": pagination.cursor,
+            "serializer": serializer.validated_data.get("serializer"),
+            "format": renderer_format,
+            "pivot": renderer_format == ColumnarJSONRenderer.format
+            and serializer.validated_data.get("pivot"),
+        }
+
+        cache_key = None
+        if params["serializer"] == "fast" or renderer_format in (
+            ColumnarJSONRenderer.format,
+            "json",
+        ):
+            cache_key = RatesResponseCache.key(**params)
+        return params, pagination, cache_key
+
+    def _cached_response(self, request, cache_key: str, date, until_date):
+        """
+        Build the response of a request from the rates cache.
+
+        Args:
+            request: The HTTP request object.
+            cache_key (str): The cache key of the request, None when its
+            format is not cached.
+            date (datetime.date): The starting date of the requested range.
+            until_date (datetime.date): The ending date of the requested range.
+
+        Returns:
+            Response: The cached response, a 304 for an unchanged
+            representation, or None on a miss.
+        """
+        if cache_key is None or (cached := RatesResponseCache.get(cache_key)) is None:
+            return None
+
+        if response := self._conditional_response(
+            request, cached["validators"], date, until_date
+        ):
+            return response
+        return self._set_validators(
+            RenderedResponse(cached["content"], status=codes.OK),
+            cached["validators"],
+            date,
+            until_date,
+        )
+
+    @staticmethod
+    def _is_conditional(request) -> bool:
+        """
+        Tell whether a request carries conditional headers.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            bool: Whether If-None-Match or If-Modified-Since were sent.
+        """
+        return bool(
+            request.META.get("HTTP_IF_NONE_MATCH")
+            or request.META.get("HTTP_IF_MODIFIED_SINCE")
+        )
+
+    @staticmethod
+    def _validators(version: dict, params: dict) -> dict:
+        """
+        Build the HTTP validators of a response.
+
+        The ETag changes whenever a rate of the response is added or updated,
+        without the rates having to be loaded.
+
+        Args:
+            version (dict): The ``count`` and ``last_modified`` time of the
+            rates of the response.
+            params (dict): The request parameters.
+
+        Returns:
+            dict: The ``etag`` and ``last_modified`` timestamp, or None when
+            there are no rates.
+        """
+        if not version["count"]:
+            return None
+
+        last_modified = version["last_modified"]
+        fingerprint = "|".join(
+            [*(f"{name}={value}" for name, value in sorted(params.items()))]
+            + [last_modified.isoformat(), str(version["count"])]
+        )
+        return {
+            "etag": quote_etag(hashlib.sha1(fingerprint.encode()).hexdigest()),
+            "last_modified": int(last_modified.timestamp()),
+        }
+
+    def _conditional_response(self, request, validators, date, until_date):
+        """
+        Answer a conditional request whose representation did not change.
+
+        Args:
+            request: The HTTP request object.
+            validators (dict): The validators of the current representation.
+            date (datetime.date): The first day of the response.
+            until_date (datetime.date): The last day of the response.
+
+        Returns:
+            HttpResponse: A 304 response, or None when the representation
+            changed or the request is not conditional.
+        """
+        if not validators:
+            return None
 
-        return Response(result, status=status_code)
+        response = get_conditional_response(
+            request,
+            etag=validators["etag"],
+            last_modified=validators["last_modified"],
+        )
+        if response is None:
+            return None
+        return self._set_validators(response, validators, date, until_date)
+
+    def _set_validators(self, response, validators, date, until_date):
+        """
+        Add the validators and caching headers to a response.
+
+        Args:
+            response: The response to be completed.
+            validators (dict): The validators of the representation.
+            date (datetime.date): The first day of the response.
+            until_date (datetime.date): The last day of the response.
+
+        Returns:
+            Response: The same response.
+        """
+        if not validators:
+            return response
+
+        response["ETag"] = validators["etag"]
+        response["Last-Modified"] = http_date(validators["last_modified"])
+        if RatesResponseCache.is_historical(date, until_date):
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=self.historical_max_age,
+                must_revalidate=True,
+            )
+        else:
+            patch_cache_control(
+                response, public=True, max_age=RatesResponseCache.recent_ttl
+            )
+        return response
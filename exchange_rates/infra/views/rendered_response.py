@@ -0,0 +1,34 @@
+"""
+Response carrying an already rendered body.
+"""
+from rest_framework.response import Response
+
+
+class RenderedResponse(Response):
+    """
+    A DRF Response whose JSON body was rendered beforehand, e.g. read from a
+    cache, so it is not rendered again when the response is finalized.
+
+    Attributes:
+        content_bytes (bytes): The rendered JSON body.
+    """
+
+    def __init__(self, content: bytes, data=None, **kwargs) -> None:
+        """
+        Initializes the response.
+
+        Args:
+            content (bytes): The rendered JSON body.
+            data (optional): The unrendered data, if still available.
+            **kwargs: Additional Response arguments, like status.
+        """
+        super().__init__(data=data, content_type="application/json", **kwargs)
+        self.content_bytes = content
+
+    @property
+    def rendered_content(self) -> bytes:
+        """
+        Returns the body rendered beforehand.
+        """
+        self["Content-Type"] = self.content_type
+        return self.content_bytes
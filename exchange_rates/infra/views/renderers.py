@@ -0,0 +1,130 @@
+"""
+Renderers for the exchange rates views.
+"""
+import csv
+import io
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from exchange_rates.infra.serializers.fast_rates_serializer import FastRateSerializer
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    JSON renderer selected with ``?format=columnar``.
+
+    It lets views answer the columnar layout of their data through DRF's
+    content negotiation. The body itself is a plain JSON document.
+    """
+
+    format = "columnar"
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline delimited JSON renderer, one JSON document per line.
+
+    Besides ``render``, it can ``stream`` records chunk by chunk, to feed a
+    StreamingHttpResponse.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render a record, or a list of records, as NDJSON.
+
+        Args:
+            data (dict or list): The record(s) to be rendered.
+            accepted_media_type (str, optional): The negotiated media type.
+            renderer_context (dict, optional): The view context.
+
+        Returns:
+            bytes: The NDJSON document.
+        """
+        if data is None:
+            return b""
+        records = [data] if isinstance(data, dict) else data
+        return b"".join(self.stream([records]))
+
+    def stream(self, chunks, header: tuple = None):
+        """
+        Render chunks of records as NDJSON.
+
+        Args:
+            chunks (iterable): Lists of records.
+            header (tuple, optional): The keys of the records (unused).
+
+        Yields:
+            bytes: The NDJSON lines of each chunk.
+        """
+        for records in chunks:
+            yield b"".join(
+                FastRateSerializer.dumps(record) + b"\n" for record in records
+            )
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    CSV renderer, with a header line.
+
+    Besides ``render``, it can ``stream`` records chunk by chunk, to feed a
+    StreamingHttpResponse.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render a record, or a list of records, as CSV.
+
+        Args:
+            data (dict or list): The record(s) to be rendered.
+            accepted_media_type (str, optional): The negotiated media type.
+            renderer_context (dict, optional): The view context.
+
+        Returns:
+            bytes: The CSV document.
+        """
+        if not data:
+            return b""
+        records = [data] if isinstance(data, dict) else data
+        return b"".join(self.stream([records], tuple(records[0])))
+
+    def stream(self, chunks, header: tuple):
+        """
+        Render chunks of records as CSV.
+
+        Args:
+            chunks (iterable): Lists of records.
+            header (tuple): The keys of the records, in column order.
+
+        Yields:
+            bytes: The header line, then the CSV lines of each chunk.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=header)
+        writer.writeheader()
+        yield self._flush(buffer)
+        for records in chunks:
+            writer.writerows(records)
+            yield self._flush(buffer)
+
+    def _flush(self, buffer: io.StringIO) -> bytes:
+        """
+        Empty the buffer the CSV lines are written to.
+
+        Args:
+            buffer (io.StringIO): The buffer.
+
+        Returns:
+            bytes: The buffered CSV lines.
+        """
+        content = buffer.getvalue().encode(self.charset)
+        buffer.seek(0)
+        buffer.truncate()
+        return content
@@ -0,0 +1,109 @@
+"""
+Command importing historical exchange rates from files.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.infra.importers.rate_file_reader import RateFileReader
+
+
+class Command(BaseCommand):
+    """
+    Import historical exchange rates from CSV, ECB XML or VATcomply JSON
+    files, without calling the VAT service.
+
+    Files are read a chunk of days at a time, so memory stays flat whatever
+    their length. The currencies of each chunk are resolved with a single
+    lookup and its rates loaded against the canonical base with a single
+    ``COPY`` on PostgreSQL (an upsert elsewhere), overwriting the rates
+    already stored, and recorded in the ledger of fetched days. The cached
+    responses of every process are retired once the files are imported, or
+    once a file fails, since the chunks imported before it are kept (see
+    RatesResponseCache.clear).
+
+    Usage:
+        python manage.py import_rates eurofxref-hist.csv
+        python manage.py import_rates dump.ndjson --format json --chunk-size 500
+        python manage.py import_rates rates.csv --base USD
+    """
+
+    help = "Import historical exchange rates from CSV, ECB XML or JSON files."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Declare the arguments of the command.
+
+        Args:
+            parser (ArgumentParser): The parser of the command.
+        """
+        parser.add_argument("paths", nargs="+")
+        parser.add_argument("--format", choices=["csv", "xml", "json"])
+        parser.add_argument(
+            "--base",
+            default=RatesService.canonical_base_rate,
+            help="Base of the files not stating one.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=250)
+
+    def handle(self, *args, **options) -> None:
+        """
+        Import every file in turn.
+
+        Raises:
+            CommandError: If a file can not be read.
+        """
+        service = RatesService(base_rate=RatesService.canonical_base_rate)
+        totals = {"days": 0, "skipped": 0, "rates": 0}
+        started = time.perf_counter()
+
+        try:
+            for path in options["paths"]:
+                self.import_file(service, path, options, totals)
+        finally:
+            # chunks imported before a failure are stored as well
+            RatesResponseCache.clear()
+            if not RatesResponseCache.is_shared():
+                self.stdout.write(
+                    "WARNING: the rates cache is local to this process, restart "
+                    "the web workers to serve the imported rates."
+                )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"INFO: {totals['days']} days and {totals['rates']} rates imported "
+            f"in {elapsed:.1f}s ({totals['rates'] / elapsed if elapsed else 0:,.0f} "
+            f"rates/s), {totals['skipped']} days skipped."
+        )
+
+    def import_file(
+        self, service: RatesService, path: str, options: dict, totals: dict
+    ) -> None:
+        """
+        Import a file, a chunk of days at a time.
+
+        Args:
+            service (RatesService): The service storing the rates.
+            path (str): The path of the file.
+            options (dict): The options of the command.
+            totals (dict): The running totals, updated after every chunk.
+
+        Raises:
+            CommandError: If the file can not be read.
+        """
+        try:
+            reader = RateFileReader(
+                path, file_format=options["format"], base=options["base"]
+            )
+            for days in reader.chunks(options["chunk_size"]):
+                imported = service.import_days(days)
+                for key, value in imported.items():
+                    totals[key] += value
+                self.stdout.write(
+                    f"INFO: {path}: {days[-1]['date']} reached, "
+                    f"{totals['rates']} rates imported."
+                )
+        except Exception as err:  # pylint: disable=W0703
+            raise CommandError(f"{path} could not be imported: {err}") from err
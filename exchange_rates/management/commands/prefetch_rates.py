@@ -0,0 +1,312 @@
+"""
+Command prefetching exchange rates from the VAT service.
+"""
+import json
+import os
+import time
+from datetime import date as Date
+from datetime import datetime
+from datetime import time as Time
+from datetime import timedelta, timezone
+
+from decouple import config
+from django.core.management.base import BaseCommand, CommandError
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.core.services.rates_service import RatesService
+
+
+class Command(BaseCommand):
+    """
+    Prefetch the canonical exchange rates, so requests never wait for the
+    VAT service.
+
+    Rates are fetched for the canonical base only, every other base being
+    derived from it on read.
+
+    Modes:
+        (default): Fetch the latest published business day.
+        --watch: Run forever, fetching each business day right after its
+        publication (``RATES_PREFETCH_AT``, UTC), retrying failed fetches and
+        days not published yet until the next publication.
+        --backfill: Fetch every missing week day of a range, a batch at a
+        time, with bounded concurrency. With --checkpoint, the last stored
+        day is saved after each batch and an interrupted backfill resumes
+        from it.
+
+    Usage:
+        python manage.py prefetch_rates
+        python manage.py prefetch_rates --watch
+        python manage.py prefetch_rates --backfill --date 2010-01-01 \
+            --until-date 2023-08-31 --workers 4 --checkpoint backfill.json
+
+    Attributes:
+        publication_time (str): The UTC time of the daily publication.
+        retry_seconds (int): Seconds between the retries of a failed fetch,
+        or of a day not published yet.
+        rates_provider (type[RatesProvider]): The provider rates are fetched
+        from.
+    """
+
+    help = "Prefetch exchange rates from the VAT service."
+
+    publication_time = config("RATES_PREFETCH_AT", default="16:30")
+    retry_seconds = config("RATES_PREFETCH_RETRY_SECONDS", default=300, cast=int)
+    rates_provider = VATClient
+
+    def add_arguments(self, parser) -> None:
+        """
+        Declare the arguments of the command.
+
+        Args:
+            parser (ArgumentParser): The parser of the command.
+        """
+        parser.add_argument("--watch", action="store_true")
+        parser.add_argument("--backfill", action="store_true")
+        parser.add_argument("--date", type=Date.fromisoformat)
+        parser.add_argument("--until-date", type=Date.fromisoformat)
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument("--workers", type=int)
+        parser.add_argument("--checkpoint")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the requested mode.
+
+        Raises:
+            CommandError: If the arguments are invalid.
+        """
+        service = RatesService(
+            base_rate=RatesService.canonical_base_rate,
+            rates_provider=self.rates_provider,
+        )
+        if options["workers"]:
+            service.max_workers = options["workers"]
+
+        if options["backfill"]:
+            self.backfill(service, **options)
+        elif options["watch"]:
+            self.watch(service)
+        else:
+            self.prefetch(service, self.last_publication(self.now()).date())
+
+    def prefetch(self, service: RatesService, day: Date) -> bool:
+        """
+        Fetch a day, unless it is already stored.
+
+        A day fetched without rates, e.g. before its publication, when the
+        provider answers with the previous business day, is fetched again.
+
+        Args:
+            service (RatesService): The service of the canonical base.
+            day (datetime.date): The day to be fetched.
+
+        Returns:
+            bool: Whether the rates of the day are stored.
+        """
+        fetched = service.prefetch([day], refetch_no_data=True)
+        if service.get_unfetched_days([day]):
+            self.stdout.write(f"INFO: No rates published for {day} yet.")
+            return False
+
+        if fetched:
+            self.stdout.write(f"INFO: Rates of {day} prefetched.")
+        else:
+            self.stdout.write(f"INFO: Rates of {day} already stored.")
+        return True
+
+    def watch(self, service: RatesService) -> None:
+        """
+        Fetch each business day right after its publication, forever.
+
+        The latest published day is fetched on start, so a restart never
+        leaves a gap.
+
+        Args:
+            service (RatesService): The service of the canonical base.
+        """
+        run_at = self.last_publication(self.now())
+        while True:
+            self.prefetch_until_stored(
+                service, run_at.date(), give_up_at=self.next_publication(self.now())
+            )
+
+            run_at = self.next_publication(self.now())
+            self.stdout.write(f"INFO: Next prefetch at {run_at.isoformat()}.")
+            time.sleep(max((run_at - self.now()).total_seconds(), 0))
+
+    def prefetch_until_stored(
+        self, service: RatesService, day: Date, give_up_at: datetime = None
+    ) -> bool:
+        """
+        Fetch a day, retrying every ``retry_seconds`` until its rates are
+        stored, whether the fetch failed or the day is not published yet.
+
+        Args:
+            service (RatesService): The service of the canonical base.
+            day (datetime.date): The day to be fetched.
+            give_up_at (datetime, optional): When to stop retrying, e.g. at
+            the next publication when the day turns out to be a holiday.
+
+        Returns:
+            bool: Whether the rates of the day are stored.
+        """
+        while True:
+            try:
+                if self.prefetch(service, day):
+                    return True
+            # pylint: disable=W0703
+            except Exception as err:
+                # pylint: enable=W0703
+                self.stderr.write(f"ERROR: Prefetch of {day} failed ({err}).")
+
+            if (
+                give_up_at
+                and self.now() + timedelta(seconds=self.retry_seconds) >= give_up_at
+            ):
+                self.stderr.write(
+                    f"WARNING: Rates of {day} not stored, giving up before the "
+                    "next publication."
+                )
+                return False
+            self.stdout.write(f"INFO: Retrying {day} in {self.retry_seconds}s.")
+            time.sleep(self.retry_seconds)
+
+    def backfill(self, service: RatesService, **options) -> None:
+        """
+        Fetch every missing week day of a range, a batch at a time.
+
+        Args:
+            service (RatesService): The service of the canonical base.
+            **options: The command options.
+
+        Raises:
+            CommandError: If the range is missing or invalid.
+        """
+        date = options["date"]
+        until_date = options["until_date"] or self.last_publication(self.now()).date()
+        if not date:
+            raise CommandError("--backfill requires --date.")
+        if until_date < date:
+            raise CommandError("--until-date must not be before --date.")
+
+        checkpoint = options["checkpoint"]
+        if last_date := self.read_checkpoint(checkpoint, date, until_date):
+            self.stdout.write(f"INFO: Resuming after {last_date}.")
+            date = last_date + timedelta(days=1)
+
+        days = (
+            RatesService.extract_week_days(date, until_date)
+            if date <= until_date
+            else []
+        )
+        batch_size = options["batch_size"]
+        fetched = 0
+        for index in range(0, len(days), batch_size):
+            batch = days[index : index + batch_size]
+            fetched += len(service.prefetch(batch))
+            self.write_checkpoint(checkpoint, options["date"], until_date, batch[-1])
+            self.stdout.write(
+                f"INFO: {batch[-1]} reached, {fetched} days fetched "
+                f"({index + len(batch)}/{len(days)})."
+            )
+
+    @staticmethod
+    def read_checkpoint(path: str, date: Date, until_date: Date) -> Date:
+        """
+        Read the last stored day of an interrupted backfill.
+
+        Args:
+            path (str): The checkpoint file, if any.
+            date (datetime.date): The first day of the range.
+            until_date (datetime.date): The last day of the range.
+
+        Returns:
+            datetime.date: The last stored day, None when there is no
+            checkpoint of the same range.
+        """
+        if not path or not os.path.exists(path):
+            return None
+
+        with open(path, encoding="utf-8") as file:
+            checkpoint = json.load(file)
+        if checkpoint.get("range") != [date.isoformat(), until_date.isoformat()]:
+            return None
+        return Date.fromisoformat(checkpoint["last_date"])
+
+    @staticmethod
+    def write_checkpoint(
+        path: str, date: Date, until_date: Date, last_date: Date
+    ) -> None:
+        """
+        Save the last stored day of a backfill, atomically.
+
+        Args:
+            path (str): The checkpoint file, if any.
+            date (datetime.date): The first day of the range.
+            until_date (datetime.date): The last day of the range.
+            last_date (datetime.date): The last stored day.
+        """
+        if not path:
+            return
+
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "range": [date.isoformat(), until_date.isoformat()],
+                    "last_date": last_date.isoformat(),
+                },
+                file,
+            )
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def now() -> datetime:
+        """
+        Returns the current UTC time.
+        """
+        return datetime.now(timezone.utc)
+
+    def last_publication(self, now: datetime) -> datetime:
+        """
+        Get the time of the latest publication, up to a moment.
+
+        Args:
+            now (datetime): The moment.
+
+        Returns:
+            datetime: The time of the latest publication.
+        """
+        publication = self._publication(now.date())
+        while publication > now or publication.weekday() > 4:
+            publication = self._publication(publication.date() - timedelta(days=1))
+        return publication
+
+    def next_publication(self, now: datetime) -> datetime:
+        """
+        Get the time of the next publication, after a moment.
+
+        Args:
+            now (datetime): The moment.
+
+        Returns:
+            datetime: The time of the next publication.
+        """
+        publication = self._publication(now.date())
+        while publication <= now or publication.weekday() > 4:
+            publication = self._publication(publication.date() + timedelta(days=1))
+        return publication
+
+    def _publication(self, day: Date) -> datetime:
+        """
+        Get the time of the publication of a day.
+
+        Args:
+            day (datetime.date): The day.
+
+        Returns:
+            datetime: The UTC publication time of the day.
+        """
+        return datetime.combine(
+            day, Time.fromisoformat(self.publication_time), tzinfo=timezone.utc
+        )
@@ -0,0 +1,84 @@
+"""
+Command repairing the exchange rates stored with 2 decimal places only.
+"""
+from datetime import date as Date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+
+
+class Command(BaseCommand):
+    """
+    Repair the exchange rates truncated to 2 decimal places before prices
+    were stored with 10.
+
+    The days holding truncated canonical rates are found with a single query,
+    fetched again from the VAT service a batch at a time, and upserted. The
+    rates stored against any other base are then recomputed from the
+    repaired canonical ones with a single update per batch, and the cached
+    responses of every process are retired (see RatesResponseCache.clear).
+
+    Usage:
+        python manage.py repair_rates --dry-run
+        python manage.py repair_rates --date 2010-01-01 --until-date 2023-08-31
+
+    Attributes:
+        rates_provider (type[RatesProvider]): The provider rates are fetched
+        from.
+    """
+
+    help = "Repair the exchange rates stored with 2 decimal places only."
+
+    rates_provider = VATClient
+
+    def add_arguments(self, parser) -> None:
+        """
+        Declare the arguments of the command.
+
+        Args:
+            parser (ArgumentParser): The parser of the command.
+        """
+        parser.add_argument("--date", type=Date.fromisoformat)
+        parser.add_argument("--until-date", type=Date.fromisoformat)
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Repair the truncated days of the requested range.
+
+        Raises:
+            CommandError: If the range is invalid.
+        """
+        date, until_date = options["date"], options["until_date"]
+        if date and until_date and until_date < date:
+            raise CommandError("--until-date must not be before --date.")
+
+        service = RatesService(
+            base_rate=RatesService.canonical_base_rate,
+            rates_provider=self.rates_provider,
+        )
+        days = service.get_imprecise_days(date, until_date)
+        self.stdout.write(f"INFO: {len(days)} days to be repaired.")
+        if options["dry_run"] or not days:
+            return
+
+        batch_size = options["batch_size"]
+        repaired = 0
+        for index in range(0, len(days), batch_size):
+            batch = days[index : index + batch_size]
+            repaired += len(service.repair(batch))
+            self.stdout.write(
+                f"INFO: {batch[-1]} reached, {repaired} days repaired "
+                f"({index + len(batch)}/{len(days)})."
+            )
+
+        RatesResponseCache.clear()
+        if not RatesResponseCache.is_shared():
+            self.stdout.write(
+                "WARNING: the rates cache is local to this process, restart "
+                "the web workers to serve the repaired rates."
+            )
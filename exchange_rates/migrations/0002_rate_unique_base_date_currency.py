@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:09
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicated_rates(apps, schema_editor):
+    """
+    Keep only the oldest rate of each (base, date, currency), so the unique
+    constraint can be created over tables filled by concurrent requests.
+    """
+    Rate = apps.get_model("exchange_rates", "Rate")
+
+    duplicated = (
+        Rate.objects.values("base", "date", "currency")
+        .annotate(first_id=Min("id"), total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for row in duplicated.iterator():
+        Rate.objects.filter(
+            base=row["base"], date=row["date"], currency=row["currency"]
+        ).exclude(id=row["first_id"]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exchange_rates", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicated_rates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="rate",
+            index=models.Index(
+                fields=["base", "date"],
+                include=("currency", "price"),
+                name="rate_base_date_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="rate",
+            constraint=models.UniqueConstraint(
+                fields=("base", "date", "currency"),
+                name="unique_rate_base_date_currency",
+            ),
+        ),
+    ]
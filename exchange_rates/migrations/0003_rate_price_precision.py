@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exchange_rates", "0002_rate_unique_base_date_currency"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="rate",
+            name="price",
+            field=models.DecimalField(decimal_places=10, max_digits=20),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exchange_rates", "0003_rate_price_precision"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FetchedDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("fetched", "Fetched"), ("no_data", "No data")],
+                        max_length=7,
+                    ),
+                ),
+                ("effective_date", models.DateField(null=True)),
+                (
+                    "base",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fetched_days",
+                        to="exchange_rates.currency",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="fetchedday",
+            constraint=models.UniqueConstraint(
+                fields=("base", "date"), name="unique_fetched_day_base_date"
+            ),
+        ),
+    ]
@@ -57,7 +57,8 @@ class Rate(BaseModel):
         base (Currency): The base currency for the exchange rate.
         date (date): The date of the exchange rate.
         currency (Currency): The target currency of the exchange rate.
-        price (Decimal): The exchange rate price.
+        price (Decimal): The exchange rate price, kept with 10 decimal places
+        so the cross rates derived from it stay exact (e.g. JPY to BRL).
     """
 
     base = models.ForeignKey(
@@ -67,7 +68,30 @@ class Rate(BaseModel):
     currency = models.ForeignKey(
         Currency, on_delete=models.CASCADE, related_name="currency"
     )
-    price = models.DecimalField(max_digits=10, decimal_places=2)
+    price = models.DecimalField(max_digits=20, decimal_places=10)
+
+    class Meta:
+        """
+        Meta:
+            constraints (list): A rate is unique for each base, date and
+            currency, so concurrent fills can not store the same rate twice.
+            indexes (list): A covering index on base and date, so date range
+            lookups of a base are served from the index.
+        """
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["base", "date", "currency"],
+                name="unique_rate_base_date_currency",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["base", "date"],
+                include=["currency", "price"],
+                name="rate_base_date_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """
@@ -102,3 +126,49 @@ class Rate(BaseModel):
             updated=self.updated.isoformat(),
             id=self.id,
         )
+
+
+class FetchedDay(BaseModel):
+    """
+    Represents a day fetched from the rates provider for a base currency, so
+    days without rates (weekends aside, e.g. holidays) are not fetched again.
+
+    Attributes:
+        base (Currency): The base currency the day was fetched for.
+        date (date): The day requested.
+        status (str): Whether the provider had rates for the day
+        (``fetched``) or not (``no_data``).
+        effective_date (date): The day of the rates the provider answered
+        with, which differs from ``date`` when it had none for it.
+    """
+
+    FETCHED = "fetched"
+    NO_DATA = "no_data"
+    STATUS_CHOICES = [(FETCHED, "Fetched"), (NO_DATA, "No data")]
+
+    base = models.ForeignKey(
+        Currency, on_delete=models.CASCADE, related_name="fetched_days"
+    )
+    date = models.DateField()
+    status = models.CharField(max_length=7, choices=STATUS_CHOICES)
+    effective_date = models.DateField(null=True)
+
+    class Meta:
+        """
+        Meta:
+            constraints (list): A day is fetched once for each base, the
+            unique index also serving the coverage lookups of a range.
+        """
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["base", "date"],
+                name="unique_fetched_day_base_date",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the fetched day.
+        """
+        return f"{self.base.short_name} | {self.date} | {self.status}"
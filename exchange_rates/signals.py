@@ -0,0 +1,28 @@
+"""
+Signal receivers of the exchange_rates app.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from exchange_rates.infra.repositories.currency_registry import CurrencyRegistry
+from exchange_rates.models import Currency
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_currency_registry(sender, using=None, **kwargs):
+    """
+    Invalidate the currency registry whenever a currency changes.
+
+    The registry is invalidated right away and once more when the current
+    transaction commits, so a reload made before the commit can not keep
+    uncommitted rows around.
+
+    Args:
+        sender (Currency): The model class sending the signal.
+        using (str, optional): The database alias being used.
+        **kwargs: Additional signal arguments (unused).
+    """
+    CurrencyRegistry.invalidate()
+    transaction.on_commit(CurrencyRegistry.invalidate, using=using)
@@ -0,0 +1,149 @@
+"""Test for evaluate the rates response cache"""
+import time
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.core.cache import caches
+
+from exchange_rates.infra.cache.rates_response_cache import (
+    LRUCache,
+    RatesResponseCache,
+)
+
+
+class TestRatesResponseCache(unittest.TestCase):
+    """
+    Unit tests for the RatesResponseCache and LRUCache classes.
+    """
+
+    def setUp(self):
+        """
+        Start every test with empty caches.
+        """
+        RatesResponseCache.clear()
+
+    def expire_generation(self):
+        """
+        Let the process local copy of the generation expire.
+        """
+        RatesResponseCache._generation = (time.monotonic() - 1, None)
+
+    def test_lru_evicts_least_recently_used(self):
+        """
+        Test that the least recently used entry is evicted first.
+        """
+        cache = LRUCache(max_size=2)
+        expires = time.time() + 60
+        cache.set("a", 1, expires)
+        cache.set("b", 2, expires)
+        cache.get("a")
+        cache.set("c", 3, expires)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_lru_expires_entries(self):
+        """
+        Test that expired entries are not returned.
+        """
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1, time.time() - 1)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_ttl(self):
+        """
+        Test that past days are kept longer than today.
+        """
+        today = datetime.now(timezone.utc).date()
+
+        self.assertEqual(
+            RatesResponseCache.ttl(date(2023, 8, 18)),
+            RatesResponseCache.historical_ttl,
+        )
+        self.assertEqual(
+            RatesResponseCache.ttl(today - timedelta(days=3), today),
+            RatesResponseCache.recent_ttl,
+        )
+        self.assertEqual(RatesResponseCache.ttl(), RatesResponseCache.recent_ttl)
+
+    def test_shared_tier(self):
+        """
+        Test that responses are found in the shared tier once the process
+        local tier lost them.
+        """
+        key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        RatesResponseCache.set(key, b'{"rates": []}', 60)
+        RatesResponseCache._memory.clear()
+
+        self.assertEqual(RatesResponseCache.get(key), b'{"rates": []}')
+        self.assertNotEqual(
+            key, RatesResponseCache.key(rate_base="EUR", date=date(2023, 8, 18))
+        )
+
+    def test_clear_from_another_process(self):
+        """
+        Test that bumping the shared generation, as a management command
+        does, retires the responses held by the process local tier, while
+        keeping the other entries of the shared tier.
+        """
+        key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        RatesResponseCache.set(key, b'{"rates": []}', 60)
+        shared = caches[RatesResponseCache.cache_alias]
+        shared.set("unrelated", 1)
+
+        shared.incr(RatesResponseCache.generation_key)
+        self.expire_generation()
+
+        new_key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        self.assertNotEqual(new_key, key)
+        self.assertIsNone(RatesResponseCache.get(new_key))
+        self.assertEqual(shared.get("unrelated"), 1)
+
+    def test_lost_generation(self):
+        """
+        Test that a lost generation counter does not bring back the responses
+        of a previous generation.
+        """
+        key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        caches[RatesResponseCache.cache_alias].delete(RatesResponseCache.generation_key)
+        self.expire_generation()
+
+        self.assertNotEqual(
+            RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18)), key
+        )
+
+    def test_local_hit_skips_shared_tier(self):
+        """
+        Test that a response held by the process local tier is served
+        without any call to the shared tier, the generation included.
+        """
+        key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        RatesResponseCache.set(key, b'{"rates": []}', 60)
+
+        with patch(
+            "exchange_rates.infra.cache.rates_response_cache.caches"
+        ) as shared_caches:
+            hit_key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+            self.assertEqual(RatesResponseCache.get(hit_key), b'{"rates": []}')
+
+        self.assertEqual(hit_key, key)
+        shared_caches.__getitem__.assert_not_called()
+
+    def test_generation_kept_until_ttl(self):
+        """
+        Test that a bump from another process is seen once the local copy of
+        the generation expires.
+        """
+        key = RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18))
+        caches[RatesResponseCache.cache_alias].incr(RatesResponseCache.generation_key)
+
+        self.assertEqual(
+            RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18)), key
+        )
+        self.expire_generation()
+        self.assertNotEqual(
+            RatesResponseCache.key(rate_base="USD", date=date(2023, 8, 18)), key
+        )
@@ -0,0 +1,169 @@
+"""Test for the import_rates command"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.models import Currency, FetchedDay, Rate
+
+ECB_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<gesmes:Envelope xmlns:gesmes="http://www.gesmes.org/xml/2002-08-01"
+    xmlns="http://www.ecb.int/vocabulary/2002-08-01/eurofxref">
+    <Cube>
+        <Cube time="2023-08-18">
+            <Cube currency="USD" rate="1.0872"/>
+            <Cube currency="BRL" rate="5.4213"/>
+        </Cube>
+        <Cube time="2023-08-17">
+            <Cube currency="USD" rate="1.0866"/>
+            <Cube currency="BRL" rate="5.4049"/>
+        </Cube>
+    </Cube>
+</gesmes:Envelope>
+"""
+
+
+@pytest.mark.django_db
+class TestImportRates(unittest.TestCase):
+    """
+    Unit tests for the import_rates command.
+    """
+
+    def setUp(self):
+        """
+        Load the currencies and create a directory for the imported files.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.eur = Currency.objects.get(short_name="EUR")
+
+    def write(self, name: str, content: str) -> str:
+        """
+        Write a file to be imported, returning its path.
+        """
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def run_command(self, *args) -> str:
+        """
+        Run the command, returning its output.
+        """
+        stdout = io.StringIO()
+        call_command("import_rates", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def price(self, short_name: str, day: date) -> Decimal:
+        """
+        Returns the stored canonical price of a currency on a day.
+        """
+        return Rate.objects.get(
+            base=self.eur, currency__short_name=short_name, date=day
+        ).price
+
+    def test_import_ecb_csv(self):
+        """
+        Test that a CSV with a column per currency is imported against the
+        canonical base, leaving the missing prices out.
+        """
+        path = self.write(
+            "eurofxref-hist.csv",
+            "Date,USD,BRL,CYP,\n2023-08-18,1.0872,5.4213,N/A,\n"
+            "2023-08-17,1.0866,5.4049,N/A,\n",
+        )
+
+        output = self.run_command(path)
+
+        self.assertIn("2 days and 6 rates imported", output)
+        self.assertIn("WARNING: the rates cache is local", output)
+        self.assertEqual(self.price("BRL", date(2023, 8, 18)), Decimal("5.4213"))
+        self.assertEqual(self.price("EUR", date(2023, 8, 17)), Decimal("1"))
+        self.assertEqual(
+            FetchedDay.objects.filter(status=FetchedDay.FETCHED).count(), 2
+        )
+
+    def test_import_csv_rows_of_another_base(self):
+        """
+        Test that a CSV with a rate per row is expressed against the
+        canonical base.
+        """
+        path = self.write(
+            "rates.csv",
+            "date,base,currency,price\n2023-08-18,USD,EUR,0.5\n"
+            "2023-08-18,USD,BRL,5\n2023-08-21,USD,BRL,5\n",
+        )
+
+        output = self.run_command(path)
+
+        self.assertIn("1 days skipped", output)
+        self.assertEqual(self.price("BRL", date(2023, 8, 18)), Decimal("10"))
+        self.assertEqual(self.price("USD", date(2023, 8, 18)), Decimal("2"))
+        self.assertFalse(Rate.objects.filter(date=date(2023, 8, 21)).exists())
+
+    def test_import_ecb_xml(self):
+        """
+        Test that an ECB XML file is imported.
+        """
+        path = self.write("eurofxref.xml", ECB_XML)
+
+        self.run_command(path)
+
+        self.assertEqual(self.price("USD", date(2023, 8, 17)), Decimal("1.0866"))
+        self.assertEqual(Rate.objects.count(), 6)
+
+    def test_import_vatcomply_json(self):
+        """
+        Test that VATcomply day and timeseries responses are imported, and
+        that importing them again updates the stored rates.
+        """
+        day = {"date": "2023-08-18", "base": "EUR", "rates": {"BRL": 5.1}}
+        timeseries = {
+            "base": "EUR",
+            "rates": {"2023-08-18": {"BRL": 5.4213}, "2023-08-17": {"BRL": 5.4049}},
+        }
+        day_path = self.write("day.ndjson", json.dumps(day) + "\n")
+        timeseries_path = self.write("timeseries.json", json.dumps(timeseries))
+
+        self.run_command(day_path, timeseries_path, "--chunk-size", "1")
+
+        self.assertEqual(self.price("BRL", date(2023, 8, 18)), Decimal("5.4213"))
+        self.assertEqual(Rate.objects.count(), 4)
+
+    def test_unreadable_file(self):
+        """
+        Test that a file of an unknown format is reported.
+        """
+        path = self.write("rates.txt", "")
+
+        with self.assertRaises(CommandError):
+            self.run_command(path)
+
+    def test_partial_failure_clears_cache(self):
+        """
+        Test that the rates imported before a failing file are kept and the
+        cached responses retired all the same.
+        """
+        path = self.write("eurofxref.xml", ECB_XML)
+        broken_path = self.write(
+            "broken.csv", "Date,USD\n2023-08-16,1.0860\nnot a date,1.0870\n"
+        )
+
+        with patch.object(RatesResponseCache, "clear") as clear:
+            with self.assertRaises(CommandError):
+                self.run_command(path, broken_path, "--chunk-size", "1")
+
+        clear.assert_called_once_with()
+        self.assertEqual(self.price("USD", date(2023, 8, 16)), Decimal("1.0860"))
+        self.assertEqual(Rate.objects.count(), 6 + 2)
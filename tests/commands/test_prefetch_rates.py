@@ -0,0 +1,175 @@
+"""Test for the prefetch_rates command"""
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from django.core.management import call_command
+
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.management.commands.prefetch_rates import Command
+from exchange_rates.models import FetchedDay, Rate
+from tests.service.test_rate_service import FakeVATClient
+
+
+class UnpublishedVATClient(FakeVATClient):
+    """
+    A FakeVATClient answering with the previous business day, as before the
+    publication, for the first ``unpublished_calls`` calls.
+    """
+
+    unpublished_calls = 0
+
+    def rate(self):
+        """
+        Return the canned response of the previous business day while the
+        requested one is not published.
+        """
+        response = super().rate()
+        if UnpublishedVATClient.unpublished_calls:
+            UnpublishedVATClient.unpublished_calls -= 1
+            response["date"] = (self.date - timedelta(days=3)).isoformat()
+        return response
+
+
+@pytest.mark.django_db
+class TestPrefetchRates(unittest.TestCase):
+    """
+    Unit tests for the prefetch_rates command.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment, fetching from the fake VAT client.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        FakeVATClient.fetched_dates = []
+        patchers = [
+            unittest.mock.patch.object(Command, "rates_provider", FakeVATClient),
+            unittest.mock.patch.object(FakeVATClient, "latency", 0),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_command(self, *args) -> str:
+        """
+        Run the command, returning its output.
+        """
+        stdout = io.StringIO()
+        call_command("prefetch_rates", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_prefetch_latest_publication(self):
+        """
+        Test that the latest published business day is fetched once.
+        """
+        now = datetime(2023, 8, 21, 10, tzinfo=timezone.utc)  # Monday morning
+        with unittest.mock.patch.object(Command, "now", return_value=now):
+            self.run_command()
+            output = self.run_command()
+
+        self.assertEqual(FakeVATClient.fetched_dates, [date(2023, 8, 18)])
+        self.assertIn("already stored", output)
+
+    def test_backfill_resumes_from_checkpoint(self):
+        """
+        Test that a backfill fetches missing week days only and resumes
+        after the day saved in its checkpoint.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "backfill.json")
+            args = [
+                "--backfill",
+                "--date=2023-08-14",
+                "--until-date=2023-08-25",
+                "--batch-size=3",
+                f"--checkpoint={checkpoint}",
+            ]
+            with open(checkpoint, "w", encoding="utf-8") as file:
+                json.dump(
+                    {"range": ["2023-08-14", "2023-08-25"], "last_date": "2023-08-18"},
+                    file,
+                )
+
+            output = self.run_command(*args)
+            with open(checkpoint, encoding="utf-8") as file:
+                last_date = json.load(file)["last_date"]
+
+        self.assertIn("Resuming after 2023-08-18", output)
+        self.assertEqual(
+            sorted(FakeVATClient.fetched_dates),
+            [date(2023, 8, day) for day in range(21, 26)],
+        )
+        self.assertEqual(last_date, "2023-08-25")
+        self.assertEqual(Rate.objects.values("date").distinct().count(), 5)
+
+    def test_next_publication(self):
+        """
+        Test that publications are scheduled on business days only.
+        """
+        command = Command()
+        friday_evening = datetime(2023, 8, 18, 20, tzinfo=timezone.utc)
+
+        self.assertEqual(
+            command.next_publication(friday_evening).date(), date(2023, 8, 21)
+        )
+        self.assertEqual(
+            command.last_publication(friday_evening).date(), date(2023, 8, 18)
+        )
+
+    def test_watch_retries_until_published(self):
+        """
+        Test that a day answered with the previous business day is fetched
+        again until its own rates are stored.
+        """
+        UnpublishedVATClient.unpublished_calls = 2
+        command = Command(stdout=io.StringIO(), stderr=io.StringIO())
+        service = RatesService(
+            base_rate=RatesService.canonical_base_rate,
+            rates_provider=UnpublishedVATClient,
+        )
+
+        with unittest.mock.patch("time.sleep") as sleep:
+            stored = command.prefetch_until_stored(service, date(2023, 8, 21))
+
+        output = command.stdout._out.getvalue()
+        self.assertTrue(stored)
+        self.assertEqual(FakeVATClient.fetched_dates, [date(2023, 8, 21)] * 3)
+        self.assertEqual(
+            sleep.call_args_list.count(unittest.mock.call(Command.retry_seconds)), 2
+        )
+        self.assertIn("No rates published for 2023-08-21 yet", output)
+        self.assertIn("Rates of 2023-08-21 prefetched", output)
+        self.assertEqual(
+            FetchedDay.objects.get(date=date(2023, 8, 21)).status,
+            FetchedDay.FETCHED,
+        )
+
+    def test_watch_gives_up_at_next_publication(self):
+        """
+        Test that a day never published, e.g. a holiday, is given up before
+        the next publication.
+        """
+        UnpublishedVATClient.unpublished_calls = 10
+        command = Command(stdout=io.StringIO(), stderr=io.StringIO())
+        service = RatesService(
+            base_rate=RatesService.canonical_base_rate,
+            rates_provider=UnpublishedVATClient,
+        )
+
+        with unittest.mock.patch("time.sleep") as sleep:
+            stored = command.prefetch_until_stored(
+                service, date(2023, 8, 21), give_up_at=command.now()
+            )
+
+        self.assertFalse(stored)
+        self.assertNotIn(
+            unittest.mock.call(Command.retry_seconds), sleep.call_args_list
+        )
+        self.assertIn("giving up", command.stderr._out.getvalue())
+        self.assertFalse(Rate.objects.filter(date=date(2023, 8, 21)).exists())
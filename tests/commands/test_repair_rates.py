@@ -0,0 +1,85 @@
+"""Test for the repair_rates command"""
+import io
+import unittest
+import unittest.mock
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from exchange_rates.management.commands.repair_rates import Command
+from exchange_rates.models import Currency, Rate
+from tests.service.test_rate_service import FakeVATClient
+
+
+@pytest.mark.django_db
+class TestRepairRates(unittest.TestCase):
+    """
+    Unit tests for the repair_rates command.
+    """
+
+    def setUp(self):
+        """
+        Store truncated and precise rates, fetching from the fake VAT client.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        FakeVATClient.fetched_dates = []
+        patchers = [
+            unittest.mock.patch.object(Command, "rates_provider", FakeVATClient),
+            unittest.mock.patch.object(FakeVATClient, "latency", 0),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.eur = Currency.objects.get(short_name="EUR")
+        self.brl = Currency.objects.get(short_name="BRL")
+        for day, price in (
+            (date(2023, 8, 21), Decimal("5.00")),
+            (date(2023, 8, 22), Decimal("5.4321234567")),
+        ):
+            Rate.objects.create(base=self.eur, currency=self.eur, date=day, price=1)
+            Rate.objects.create(base=self.eur, currency=self.brl, date=day, price=price)
+        Rate.objects.create(
+            base=self.brl, currency=self.eur, date=date(2023, 8, 21), price="0.20"
+        )
+
+    def run_command(self, *args) -> str:
+        """
+        Run the command, returning its output.
+        """
+        stdout = io.StringIO()
+        call_command("repair_rates", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_dry_run(self):
+        """
+        Test that a dry run only counts the truncated days.
+        """
+        output = self.run_command("--dry-run")
+
+        self.assertIn("1 days to be repaired", output)
+        self.assertEqual(FakeVATClient.fetched_dates, [])
+
+    def test_repair(self):
+        """
+        Test that only the truncated days are fetched again, and the rates of
+        other bases are recomputed from them.
+        """
+        output = self.run_command()
+
+        self.assertIn("WARNING: the rates cache is local", output)
+        self.assertEqual(FakeVATClient.fetched_dates, [date(2023, 8, 21)])
+        self.assertEqual(
+            Rate.objects.get(
+                base=self.eur, currency=self.brl, date=date(2023, 8, 21)
+            ).price,
+            Decimal("4.97"),
+        )
+        self.assertEqual(
+            Rate.objects.get(
+                base=self.brl, currency=self.eur, date=date(2023, 8, 21)
+            ).price.quantize(Decimal("0.0000000001")),
+            Decimal("0.2012072435"),
+        )
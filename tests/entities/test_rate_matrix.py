@@ -0,0 +1,85 @@
+"""Test for rate matrix entities"""
+import unittest
+from datetime import date
+
+import pytest
+
+from exchange_rates.core.entities import RateMatrix
+
+np = pytest.importorskip("numpy")
+
+
+class TestRateMatrix(unittest.TestCase):
+    """
+    Unit tests for the RateMatrix entity.
+    """
+
+    def setUp(self):
+        """
+        Set up a matrix of 3 days, BRL missing on the last one.
+        """
+        rows = [
+            (date(2023, 8, 21), 1, "1.00"),
+            (date(2023, 8, 21), 2, "1.25"),
+            (date(2023, 8, 21), 4, "5.00"),
+            (date(2023, 8, 22), 1, "1.00"),
+            (date(2023, 8, 22), 2, "1.50"),
+            (date(2023, 8, 22), 4, "6.00"),
+            (date(2023, 8, 23), 2, "1.20"),
+            (date(2023, 8, 23), 1, "1.00"),
+        ]
+        self.matrix = RateMatrix.from_rows("EUR", rows, {1: "EUR", 2: "USD", 4: "BRL"})
+
+    def test_from_rows(self):
+        """
+        Test that rows are indexed by date and currency, NaN when missing.
+        """
+        self.assertEqual(self.matrix.currencies, ["EUR", "USD", "BRL"])
+        self.assertEqual(
+            self.matrix.dates.tolist(),
+            [date(2023, 8, 21), date(2023, 8, 22), date(2023, 8, 23)],
+        )
+        np.testing.assert_array_equal(
+            self.matrix.prices,
+            [[1, 1.25, 5], [1, 1.5, 6], [1, 1.2, np.nan]],
+        )
+
+    def test_cross_rates(self):
+        """
+        Test that rates are expressed against another base.
+        """
+        cross_rates = self.matrix.cross_rates("USD")
+
+        self.assertEqual(cross_rates.base, "USD")
+        np.testing.assert_allclose(cross_rates.prices[:, 1], [1, 1, 1])
+        np.testing.assert_allclose(cross_rates.prices[:2, 2], [4, 4])
+        np.testing.assert_allclose(self.matrix.rate("USD", "BRL")[:2], [4, 4])
+
+    def test_convert(self):
+        """
+        Test that amounts are converted each with its currencies and date.
+        """
+        converted = self.matrix.convert(
+            [10, 10, 3],
+            ["USD", "BRL", "USD"],
+            ["BRL", "EUR", "USD"],
+            [date(2023, 8, 21), date(2023, 8, 22), date(2023, 8, 23)],
+        )
+
+        np.testing.assert_allclose(converted, [40, 10 / 6, 3])
+
+    def test_convert_unknown_date(self):
+        """
+        Test that converting on a date without rates is rejected.
+        """
+        with self.assertRaises(Exception):
+            self.matrix.convert([1], "USD", "EUR", date(2023, 8, 24))
+
+    def test_returns_and_rolling_mean(self):
+        """
+        Test returns and rolling averages of every currency.
+        """
+        np.testing.assert_allclose(self.matrix.returns()[:, 1], [0.2, -0.2])
+        np.testing.assert_allclose(self.matrix.returns(log=True)[0, 1], np.log(1.2))
+        np.testing.assert_allclose(self.matrix.rolling_mean(2)[:, 1], [1.375, 1.35])
+        self.assertEqual(self.matrix.rolling_mean(4).shape, (0, 3))
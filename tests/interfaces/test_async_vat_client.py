@@ -0,0 +1,112 @@
+"""Test for called requests from the asyncio provider VAT"""
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from exchange_rates.core.interfaces.rates_provider import TimeseriesNotSupported
+from exchange_rates.core.interfaces.vatcomply.async_client import AsyncVATClient
+from exchange_rates.core.interfaces.vatcomply.client import VATClientError
+from tests.stubs.vatcomply import VATComplyStub
+
+
+class TestAsyncVATClientAgainstStub(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the AsyncVATClient against a local stub of the VAT service.
+    """
+
+    async def asyncSetUp(self):  # pylint: disable=C0103
+        """
+        Start a stub server and point the client at it.
+        """
+        self.stub = VATComplyStub().start()
+        self.addCleanup(self.stub.stop)
+        for name, value in {
+            "base_url": self.stub.url,
+            "backoff_factor": 0.01,
+            "read_timeout": 0.5,
+            "supports_timeseries": True,
+        }.items():
+            patcher = patch.object(AsyncVATClient, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = AsyncVATClient.build_client()
+        self.addAsyncCleanup(self.client.aclose)
+
+    async def test_rate(self):
+        """
+        Test that rates are fetched and the call is measured.
+        """
+        calls = AsyncVATClient.metrics.snapshot()["calls"]
+
+        result = await AsyncVATClient(base_rate="EUR", client=self.client).rate()
+
+        self.assertEqual(result["base"], "EUR")
+        self.assertEqual(result["rates"]["EUR"], 1.0)
+        self.assertEqual(AsyncVATClient.metrics.snapshot()["calls"], calls + 1)
+
+    async def test_connections_are_reused(self):
+        """
+        Test that every client of an event loop shares the same pool.
+        """
+        self.assertIs(AsyncVATClient.shared_client(), AsyncVATClient.shared_client())
+        await AsyncVATClient.shared_client().aclose()
+
+    async def test_retries_server_errors(self):
+        """
+        Test that 5xx answers are retried until the service recovers.
+        """
+        self.stub.failures = 2
+
+        result = await AsyncVATClient(client=self.client).rate()
+
+        self.assertEqual(result["base"], "USD")
+        self.assertEqual(len(self.stub.requests), 3)
+
+    async def test_gives_up_after_the_retries(self):
+        """
+        Test that a service failing every retry raises VATClientError.
+        """
+        self.stub.failures = AsyncVATClient.max_retries + 1
+
+        with self.assertRaises(VATClientError):
+            await AsyncVATClient(client=self.client).rate()
+
+        self.assertEqual(len(self.stub.requests), AsyncVATClient.max_retries + 1)
+
+    async def test_timeout(self):
+        """
+        Test that a hung service raises VATClientError instead of hanging.
+        """
+        self.stub.latency = 1.0
+
+        with patch.object(AsyncVATClient, "max_retries", 0):
+            with self.assertRaises(VATClientError):
+                await AsyncVATClient(client=self.client).rate()
+
+    async def test_timeseries(self):
+        """
+        Test that a range of days is fetched with a single call.
+        """
+        client = AsyncVATClient(date=date(2023, 8, 18), client=self.client)
+
+        result = await client.timeseries(until_date=date(2023, 8, 22))
+
+        self.assertEqual(
+            list(result["rates"]), ["2023-08-18", "2023-08-21", "2023-08-22"]
+        )
+        self.assertEqual(len(self.stub.requests), 1)
+
+    async def test_timeseries_not_supported(self):
+        """
+        Test that a service without timeseries endpoint turns the range mode
+        off for the answering client only, not for every client.
+        """
+        self.stub.timeseries = False
+        client = AsyncVATClient(date=date(2023, 8, 18), client=self.client)
+
+        with self.assertRaises(TimeseriesNotSupported):
+            await client.timeseries(until_date=date(2023, 8, 22))
+
+        self.assertFalse(client.supports_timeseries)
+        self.assertTrue(AsyncVATClient.supports_timeseries)
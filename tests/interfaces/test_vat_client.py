@@ -1,8 +1,11 @@
 """Test for called requests from provider VAT"""
 import unittest
+from datetime import date
 from unittest.mock import MagicMock, patch
 
-from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.core.interfaces.rates_provider import TimeseriesNotSupported
+from exchange_rates.core.interfaces.vatcomply.client import VATClient, VATClientError
+from tests.stubs.vatcomply import VATComplyStub
 
 
 class TestVATClient(unittest.TestCase):
@@ -10,13 +13,13 @@ class TestVATClient(unittest.TestCase):
     Unit tests for the VATClient class.
     """
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_rate(self, mock_get):
         """
         Test the rate() method of VATClient.
 
         This test verifies that the rate() method of VATClient returns the
-        expected result by mocking the requests.get function and simulating
+        expected result by mocking the requests.Session.get function and simulating
         a response with pre-defined data.
 
         The expected_result variable contains a dictionary representing
@@ -28,7 +31,7 @@ class TestVATClient(unittest.TestCase):
 
         If the result matches the expected result, the test passes.
 
-        :param mock_get: Mocked requests.get function.
+        :param mock_get: Mocked requests.Session.get function.
         """
         expected_result = {
             "date": "2023-08-18",
@@ -77,3 +80,102 @@ class TestVATClient(unittest.TestCase):
         result = client.rate()
 
         self.assertEqual(result, expected_result)
+
+
+class TestVATClientAgainstStub(unittest.TestCase):
+    """
+    Tests of the VATClient against a local stub of the VAT service.
+    """
+
+    def setUp(self):
+        """
+        Start a stub server and point the client at it.
+        """
+        self.stub = VATComplyStub().start()
+        self.addCleanup(self.stub.stop)
+        for name, value in {
+            "base_url": self.stub.url,
+            "backoff_factor": 0.01,
+            "read_timeout": 0.5,
+            "supports_timeseries": True,
+        }.items():
+            patcher = patch.object(VATClient, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rate(self):
+        """
+        Test that rates are fetched and the call is measured.
+        """
+        calls = VATClient.metrics.snapshot()["calls"]
+
+        result = VATClient(base_rate="EUR", session=VATClient.build_session()).rate()
+
+        self.assertEqual(result["base"], "EUR")
+        self.assertEqual(result["rates"]["EUR"], 1.0)
+        self.assertEqual(VATClient.metrics.snapshot()["calls"], calls + 1)
+
+    def test_connections_are_reused(self):
+        """
+        Test that every client shares the same pooled session.
+        """
+        self.assertIs(VATClient().session, VATClient().session)
+
+    def test_retries_server_errors(self):
+        """
+        Test that 5xx answers are retried until the service recovers.
+        """
+        self.stub.failures = 2
+
+        result = VATClient(session=VATClient.build_session()).rate()
+
+        self.assertEqual(result["base"], "USD")
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_gives_up_after_the_retries(self):
+        """
+        Test that a service failing every retry raises VATClientError.
+        """
+        self.stub.failures = VATClient.max_retries + 1
+
+        with self.assertRaises(VATClientError):
+            VATClient(session=VATClient.build_session()).rate()
+
+        self.assertEqual(len(self.stub.requests), VATClient.max_retries + 1)
+
+    def test_timeout(self):
+        """
+        Test that a hung service raises VATClientError instead of hanging.
+        """
+        self.stub.latency = 1.0
+
+        with patch.object(VATClient, "max_retries", 0):
+            with self.assertRaises(VATClientError):
+                VATClient(session=VATClient.build_session()).rate()
+
+    def test_timeseries(self):
+        """
+        Test that a range of days is fetched with a single call.
+        """
+        client = VATClient(date=date(2023, 8, 18), session=VATClient.build_session())
+
+        result = client.timeseries(until_date=date(2023, 8, 22))
+
+        self.assertEqual(
+            list(result["rates"]), ["2023-08-18", "2023-08-21", "2023-08-22"]
+        )
+        self.assertEqual(len(self.stub.requests), 1)
+
+    def test_timeseries_not_supported(self):
+        """
+        Test that a service without timeseries endpoint turns the range mode
+        off for the answering client only, not for every client.
+        """
+        self.stub.timeseries = False
+        client = VATClient(date=date(2023, 8, 18), session=VATClient.build_session())
+
+        with self.assertRaises(TimeseriesNotSupported):
+            client.timeseries(until_date=date(2023, 8, 22))
+
+        self.assertFalse(client.supports_timeseries)
+        self.assertTrue(VATClient.supports_timeseries)
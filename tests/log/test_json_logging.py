@@ -0,0 +1,106 @@
+"""Test for the structured logging"""
+import io
+import json
+import logging
+import unittest
+from unittest.mock import patch
+
+from exchange_rates.infra.log.json_formatter import JSONFormatter
+from exchange_rates.infra.log.queue_handler import QueueLogHandler
+from exchange_rates.infra.log.sampling_filter import SamplingFilter
+
+
+class TestJSONLogging(unittest.TestCase):
+    """
+    Unit tests for the JSONFormatter, SamplingFilter and QueueLogHandler
+    classes.
+    """
+
+    @staticmethod
+    def build_record(**extra) -> logging.LogRecord:
+        """
+        Build an INFO log record with the given extra fields.
+        """
+        record = logging.makeLogRecord(
+            {"name": "exchange_rates.test", "levelno": logging.INFO, "msg": "%s rates"}
+        )
+        record.levelname, record.args = "INFO", (3,)
+        record.__dict__.update(extra)
+        return record
+
+    def test_format_extra_fields(self):
+        """
+        Test that a record is formatted as a JSON line holding its extra
+        fields.
+        """
+        line = json.loads(JSONFormatter().format(self.build_record(count=3)))
+
+        self.assertEqual(line["level"], "INFO")
+        self.assertEqual(line["logger"], "exchange_rates.test")
+        self.assertEqual(line["message"], "3 rates")
+        self.assertEqual(line["count"], 3)
+        self.assertNotIn("args", line)
+
+    def test_sampling(self):
+        """
+        Test that only sampled records are dropped, and that the kept ones
+        carry the sampling rate.
+        """
+        record = self.build_record(sample=True)
+
+        self.assertFalse(SamplingFilter(rate=0).filter(self.build_record(sample=True)))
+        self.assertTrue(SamplingFilter(rate=0).filter(self.build_record()))
+        self.assertTrue(SamplingFilter(rate=1).filter(record))
+        self.assertEqual(record.sample, 1)
+
+    def test_queue_handler_writes_in_background(self):
+        """
+        Test that the records enqueued are all written once the handler is
+        closed.
+        """
+        stream = io.StringIO()
+        handler = QueueLogHandler(stream=stream)
+        logger = logging.getLogger("exchange_rates.test.queue")
+        logger.addHandler(handler)
+        logger.propagate = False
+        try:
+            for index in range(10):
+                logger.warning("Rate %s created.", index, extra={"index": index})
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["index"] for line in lines], list(range(10)))
+        self.assertEqual(lines[0]["message"], "Rate 0 created.")
+
+    def test_queue_handler_starts_on_first_record(self):
+        """
+        Test that the listener thread is only started by the first record.
+        """
+        handler = QueueLogHandler(stream=io.StringIO())
+        try:
+            self.assertIsNone(handler.listener._thread)
+            handler.handle(self.build_record())
+            self.assertIsNotNone(handler.listener._thread)
+        finally:
+            handler.close()
+
+    def test_queue_handler_drops_records_when_full(self):
+        """
+        Test that records are dropped and counted once the queue is full,
+        and that the count is written when the handler is closed.
+        """
+        stream = io.StringIO()
+        handler = QueueLogHandler(stream=stream, max_size=2)
+        with patch.object(QueueLogHandler, "start"):
+            for index in range(5):
+                handler.handle(self.build_record(index=index))
+        handler.start()
+        handler.close()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(handler.dropped, 3)
+        self.assertEqual([line.get("index") for line in lines], [0, 1, None])
+        self.assertEqual(lines[-1]["level"], "WARNING")
+        self.assertEqual(lines[-1]["dropped"], 3)
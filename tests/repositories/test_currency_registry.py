@@ -0,0 +1,55 @@
+"""Test for evaluate the currency registry"""
+import unittest
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from exchange_rates.infra.repositories.currency_registry import CurrencyRegistry
+from exchange_rates.models import Currency
+
+
+@pytest.mark.django_db
+class TestCurrencyRegistry(unittest.TestCase):
+    """
+    Unit tests for the CurrencyRegistry class.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by loading fixture data.
+        """
+        # Load fixtures
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+
+    def test_lookups_hit_the_database_once(self):
+        """
+        Test that the registry is loaded once and serves every index.
+        """
+        with CaptureQueriesContext(connection) as context:
+            usd = CurrencyRegistry.get_by_short_name("USD")
+            self.assertEqual(CurrencyRegistry.get_by_id(usd.id), usd)
+            self.assertEqual(CurrencyRegistry.get_by_name("US Dollar"), usd)
+            self.assertEqual(
+                set(CurrencyRegistry.get_many_by_short_names(["EUR", "XXX"])),
+                {"EUR"},
+            )
+
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_unknown_currency(self):
+        """
+        Test that unknown currencies raise DoesNotExist, like the ORM does.
+        """
+        with self.assertRaises(Currency.DoesNotExist):
+            CurrencyRegistry.get_by_short_name("XXX")
+
+    def test_invalidated_on_save(self):
+        """
+        Test that saving a currency invalidates the registry.
+        """
+        CurrencyRegistry.get_by_short_name("USD")
+        Currency.objects.create(name="Pound Sterling", short_name="GBP", symbol="£")
+
+        self.assertEqual(CurrencyRegistry.get_by_short_name("GBP").symbol, "£")
@@ -0,0 +1,122 @@
+"""Test for evaluate the django rate repository"""
+import unittest
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from exchange_rates.infra.repositories.django_rate_repository import (
+    DjangoRateRepository,
+)
+from exchange_rates.models import Currency, FetchedDay, Rate
+
+
+@pytest.mark.django_db
+class TestDjangoRateRepository(unittest.TestCase):
+    """
+    Unit tests for the DjangoRateRepository class.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by loading fixture data.
+        """
+        # Load fixtures
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        self.base_rate = Currency.objects.get(short_name="USD")
+        self.currency = Currency.objects.get(short_name="EUR")
+        self.repository = DjangoRateRepository(base_rate=self.base_rate)
+
+    def test_create_rate_is_idempotent(self):
+        """
+        Test that creating the same rate twice keeps a single row holding
+        the latest price.
+        """
+        for price in (0.91, 0.92):
+            self.repository.create_rate(
+                base_rate=self.base_rate,
+                currency=self.currency,
+                date=date(2023, 8, 18),
+                price=price,
+            )
+
+        rates = Rate.objects.filter(base=self.base_rate, currency=self.currency)
+        self.assertEqual(rates.count(), 1)
+        self.assertEqual(float(rates.first().price), 0.92)
+
+    def test_bulk_create_rates_skips_duplicates(self):
+        """
+        Test that a bulk insert overlapping stored rates does not duplicate
+        them.
+        """
+        rates = [
+            {"currency": self.currency, "date": date(2023, 8, 18), "price": 0.92},
+        ]
+        self.repository.bulk_create_rates(base_rate=self.base_rate, rates=rates)
+        self.repository.bulk_create_rates(base_rate=self.base_rate, rates=rates)
+
+        self.assertEqual(Rate.objects.filter(base=self.base_rate).count(), 1)
+
+    def test_get_rates_is_lazy(self):
+        """
+        Test that retrieving the rates does not run a query until they are
+        read.
+        """
+        with CaptureQueriesContext(connection) as context:
+            self.repository.get_rates(date="2023-08-18")
+
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_bulk_create_rates_logs_a_summary(self):
+        """
+        Test that a bulk insert is logged once, with the number of rates.
+        """
+        rates = [
+            {"currency": currency, "date": date(2023, 8, 18), "price": 1}
+            for currency in Currency.objects.all()[:3]
+        ]
+        with self.assertLogs(
+            "exchange_rates.infra.repositories.django_rate_repository", "INFO"
+        ) as logs:
+            self.repository.bulk_create_rates(base_rate=self.base_rate, rates=rates)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].count, 3)
+
+    @unittest.skipUnless(
+        connection.vendor == "postgresql", "COPY is only used on PostgreSQL."
+    )
+    def test_load_rates_copy(self):
+        """
+        Test that rates loaded through COPY are upserted along with the
+        ledger of their days.
+        """
+        brl = Currency.objects.get(short_name="BRL")
+        day = date(2023, 8, 18)
+        fetched_days = [
+            {"date": day, "status": FetchedDay.FETCHED, "effective_date": day}
+        ]
+
+        for price in ("0.91", "0.92"):
+            loaded = self.repository.load_rates(
+                base_rate=self.base_rate,
+                rates=[
+                    {"currency": self.currency, "date": day, "price": price},
+                    {"currency": brl, "date": day, "price": "4.97"},
+                ],
+                fetched_days=fetched_days,
+            )
+
+        self.assertEqual(loaded, 2)
+        self.assertEqual(Rate.objects.filter(base=self.base_rate).count(), 2)
+        self.assertEqual(
+            str(Rate.objects.get(base=self.base_rate, currency=self.currency).price),
+            "0.9200000000",
+        )
+        self.assertTrue(
+            FetchedDay.objects.filter(
+                base=self.base_rate, date=day, status=FetchedDay.FETCHED
+            ).exists()
+        )
@@ -0,0 +1,84 @@
+"""Test for evaluate the single flight locks"""
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from exchange_rates.infra.repositories.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Unit tests for the SingleFlight class.
+    """
+
+    def test_concurrent_workers_fetch_once(self):
+        """
+        Test that concurrent workers missing the same key fetch it once.
+        """
+        store = {}
+        fetches = []
+        key = ("USD", "2023-08-18")
+
+        def worker():
+            if key in store:
+                return
+            with SingleFlight.acquire([key]):
+                if key not in store:
+                    time.sleep(0.05)
+                    fetches.append(key)
+                    store[key] = "rates"
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(fetches, [key])
+        self.assertEqual(SingleFlight._locks, {})
+
+    def test_lock_id_is_stable(self):
+        """
+        Test that lock ids are stable signed 64 bits integers.
+        """
+        lock_id = SingleFlight.lock_id(("USD", "2023-08-18"))
+
+        self.assertEqual(lock_id, SingleFlight.lock_id(("USD", "2023-08-18")))
+        self.assertNotEqual(lock_id, SingleFlight.lock_id(("EUR", "2023-08-18")))
+        self.assertTrue(-(2**63) <= lock_id < 2**63)
+
+    def test_advisory_locks_released_when_acquisition_fails(self):
+        """
+        Test that the advisory locks already taken are released when taking
+        a later one fails, and that the in-process locks are dropped.
+        """
+        keys = [("USD", "2023-08-17"), ("USD", "2023-08-18"), ("USD", "2023-08-21")]
+        lock_ids = [SingleFlight.lock_id(key) for key in sorted(keys, key=repr)]
+        statements = []
+
+        def execute(sql, params):
+            statements.append((sql.split("(")[0], params[0]))
+            if sql.startswith("SELECT pg_advisory_lock") and params == [lock_ids[1]]:
+                raise RuntimeError("canceling statement due to statement timeout")
+
+        connection = MagicMock(vendor="postgresql")
+        connection.cursor.return_value.__enter__.return_value.execute = execute
+
+        with patch.object(SingleFlight, "use_advisory_locks", True), patch(
+            "exchange_rates.infra.repositories.single_flight.connections",
+            {"default": connection},
+        ):
+            with self.assertRaises(RuntimeError):
+                with SingleFlight.acquire(keys):
+                    self.fail("The block must not run.")
+
+        self.assertEqual(
+            statements,
+            [
+                ("SELECT pg_advisory_lock", lock_ids[0]),
+                ("SELECT pg_advisory_lock", lock_ids[1]),
+                ("SELECT pg_advisory_unlock", lock_ids[0]),
+            ],
+        )
+        self.assertEqual(SingleFlight._locks, {})
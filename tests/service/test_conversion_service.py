@@ -0,0 +1,142 @@
+"""Test for evaluate the conversion service"""
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClientError
+from exchange_rates.core.services.conversion_service import ConversionService
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.repositories.currency_registry import CurrencyRegistry
+from exchange_rates.infra.repositories.single_flight import SingleFlight
+from tests.service.test_rate_service import FakeVATClient
+
+
+class FailingVATClient(FakeVATClient):
+    """
+    A FakeVATClient rejecting the dates in the future.
+    """
+
+    latency = 0
+
+    def rate(self):
+        """
+        Return a canned response, or fail for a future date.
+        """
+        if self.date > datetime(2023, 9, 1).date():
+            raise VATClientError("VAT service answered 422.")
+        return super().rate()
+
+
+@pytest.mark.django_db
+class TestConversionService(unittest.TestCase):
+    """
+    Unit tests for the ConversionService class.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment with the canonical rates of a day.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        CurrencyRegistry.invalidate()
+        self.day = datetime(2023, 8, 21).date()
+        RatesService(base_rate="EUR").get_or_create_rate(
+            self.day, {"rates": {"USD": 1.25, "BRL": 5.5, "JPY": 150}}
+        )
+        FakeVATClient.fetched_dates = []
+
+    def test_convert(self):
+        """
+        Test that amounts are converted in input order, with per-line errors.
+        """
+        results = ConversionService(rates_provider=FakeVATClient).convert(
+            [
+                (Decimal("10"), "USD", "BRL", self.day),
+                (Decimal("3"), "EUR", "JPY", self.day),
+                (Decimal("1"), "USD", "XXX", self.day),
+                (Decimal("10"), "USD", "BRL", self.day),
+            ]
+        )
+
+        self.assertEqual(
+            results,
+            [
+                {"amount": "44.00", "rate": "4.4000000000"},
+                {"amount": "450.00", "rate": "150.0000000000"},
+                {"error": "Unknown currency XXX."},
+                {"amount": "44.00", "rate": "4.4000000000"},
+            ],
+        )
+        self.assertEqual(FakeVATClient.fetched_dates, [])
+
+    def test_convert_batch_queries(self):
+        """
+        Test that a large batch over several days, some of them missing,
+        takes a handful of queries and one fetch per missing day.
+        """
+        days = [self.day, datetime(2023, 8, 22).date(), datetime(2023, 8, 24).date()]
+        conversions = [
+            (Decimal(index), "EUR", "BRL", days[index % len(days)])
+            for index in range(3000)
+        ]
+        CurrencyRegistry.get_all()
+
+        with CaptureQueriesContext(connection) as context:
+            results = ConversionService(rates_provider=FakeVATClient).convert(
+                conversions
+            )
+
+        self.assertEqual(sorted(FakeVATClient.fetched_dates), days[1:])
+        self.assertEqual(results[3], {"amount": "16.50", "rate": "5.5000000000"})
+        # the fake client prices BRL at 4.97, EUR keeping its rate of 1
+        self.assertEqual(results[4], {"amount": "19.88", "rate": "4.9700000000"})
+        self.assertLessEqual(len(context.captured_queries), 8)
+
+    def test_convert_unfetchable_day(self):
+        """
+        Test that a day failing to be fetched only fails its own
+        conversions, the missing days being fetched and locked in batches,
+        and the failing batch day by day.
+        """
+        future = datetime(2023, 9, 4).date()
+        days = [
+            datetime(2023, 8, 22).date(),
+            datetime(2023, 8, 23).date(),
+            datetime(2023, 8, 24).date(),
+        ]
+
+        with patch.object(RatesService, "prices_batch_size", 2), patch.object(
+            SingleFlight, "acquire", wraps=SingleFlight.acquire
+        ) as acquire:
+            results = ConversionService(rates_provider=FailingVATClient).convert(
+                [
+                    (Decimal("10"), "USD", "BRL", future),
+                    (Decimal("10"), "USD", "BRL", self.day),
+                    (Decimal("2"), "EUR", "BRL", days[0]),
+                    (Decimal("2"), "EUR", "BRL", days[1]),
+                    (Decimal("2"), "EUR", "BRL", days[2]),
+                ]
+            )
+
+        self.assertEqual(
+            results,
+            [
+                {
+                    "error": f"Rates of {future} could not be fetched: "
+                    "VAT service answered 422."
+                },
+                {"amount": "44.00", "rate": "4.4000000000"},
+                {"amount": "9.94", "rate": "4.9700000000"},
+                {"amount": "9.94", "rate": "4.9700000000"},
+                {"amount": "9.94", "rate": "4.9700000000"},
+            ],
+        )
+        self.assertEqual(
+            [len(call.args[0]) for call in acquire.call_args_list], [2, 2, 1, 1]
+        )
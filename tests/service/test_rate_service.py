@@ -1,12 +1,69 @@
 """Test for evaluate the currency service"""
+import time
 import unittest
+import unittest.mock
 from datetime import datetime, timedelta
+from decimal import Decimal
 
 import pytest
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from exchange_rates.core.interfaces.rates_provider import (
+    RatesProvider,
+    TimeseriesNotSupported,
+)
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
 from exchange_rates.core.services.rates_service import RatesService
-from exchange_rates.models import Rate
+from exchange_rates.models import FetchedDay, Rate
+from tests.stubs.vatcomply import VATComplyStub
+
+
+class FakeVATClient(RatesProvider):
+    """
+    A VATClient stand-in answering after a fixed latency.
+    """
+
+    latency = 0.2
+    supports_timeseries = False
+    fetched_dates = []
+    fetched_ranges = []
+
+    def __init__(self, base_rate: str = "USD", date=None) -> None:
+        self.base_rate = base_rate
+        self.date = date
+
+    def rate(self):
+        """
+        Return a canned response for the requested date.
+        """
+        time.sleep(self.latency)
+        self.fetched_dates.append(self.date)
+        return {
+            "date": self.date.isoformat(),
+            "base": self.base_rate,
+            "rates": {"EUR": 0.92, "BRL": 4.97},
+        }
+
+    def timeseries(self, until_date):
+        """
+        Return a canned response for every week day of the requested range.
+        """
+        if not self.supports_timeseries:
+            raise TimeseriesNotSupported("Ranges not supported.")
+
+        time.sleep(self.latency)
+        self.fetched_ranges.append((self.date, until_date))
+        return {
+            "base": self.base_rate,
+            "start_date": self.date.isoformat(),
+            "end_date": until_date.isoformat(),
+            "rates": {
+                item.isoformat(): {"EUR": 0.92, "BRL": 4.97}
+                for item in RatesService.extract_week_days(self.date, until_date)
+            },
+        }
 
 
 @pytest.mark.django_db
@@ -32,11 +89,207 @@ class TestRatesService(unittest.TestCase):
         date = datetime.strptime("2023-08-19", "%Y-%m-%d").date()
         until_date = datetime.strptime("2023-08-22", "%Y-%m-%d").date()
         service = RatesService(base_rate="USD")
-        response = service.proccess(date, until_date)
+        with VATComplyStub() as stub:
+            with unittest.mock.patch.object(VATClient, "base_url", stub.url):
+                response = service.proccess(date, until_date)
 
         self.assertIsNotNone(response)
         self.assertIsInstance(response.first(), Rate)
 
+    def test_get_or_create_rates_in_bulk(self):
+        """
+        Test the get_or_create_rates method of RatesService.
+
+        It checks that the rates of several days are stored with a constant
+        number of queries, skipping currency codes that are not registered,
+        and that an upstream rate of the canonical base does not overwrite
+        its rate of 1 against itself.
+        """
+        service = RatesService(base_rate="USD")
+        response_rates = {
+            datetime(2023, 8, 21).date(): {
+                "rates": {"EUR": 0.92, "BRL": 4.97, "XXX": 1.0},
+            },
+            datetime(2023, 8, 22).date(): {
+                "rates": {"EUR": 0.93, "BRL": 4.98, "XXX": 1.0},
+            },
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            response = service.get_or_create_rates(response_rates)
+
+        self.assertEqual(len(response), 4)
+        self.assertEqual(Rate.objects.filter(base=service.canonical_base).count(), 4)
+        self.assertLessEqual(len(context.captured_queries), 4)
+        self.assertEqual(
+            set(
+                Rate.objects.filter(
+                    base=service.canonical_base, currency=service.canonical_base
+                ).values_list("price", flat=True)
+            ),
+            {1},
+        )
+
+    def test_missing_days_are_fetched_concurrently(self):
+        """
+        Test that the missing days of a range are fetched in parallel, each
+        one for its own date, and stored in a single batch.
+        """
+        date = datetime(2023, 8, 21).date()
+        until_date = datetime(2023, 8, 25).date()
+        service = RatesService(base_rate="USD", rates_provider=FakeVATClient)
+        FakeVATClient.fetched_dates = []
+
+        started = time.monotonic()
+        response = service.proccess(date, until_date)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(
+            sorted(FakeVATClient.fetched_dates),
+            service.extract_week_days(date, until_date),
+        )
+        self.assertLess(elapsed, FakeVATClient.latency * 3)
+        self.assertEqual(response.count(), 10)
+
+    def test_consecutive_missing_days_are_fetched_as_a_range(self):
+        """
+        Test that consecutive missing days, across a weekend, are fetched
+        with a single timeseries call.
+        """
+        date = datetime(2023, 8, 17).date()
+        until_date = datetime(2023, 8, 22).date()
+        service = RatesService(base_rate="USD", rates_provider=FakeVATClient)
+        service.get_or_create_rate(date, {"rates": {"EUR": 0.92}})
+        FakeVATClient.fetched_dates = []
+        FakeVATClient.fetched_ranges = []
+
+        with unittest.mock.patch.object(FakeVATClient, "supports_timeseries", True):
+            response = service.proccess(date, until_date)
+
+        self.assertEqual(
+            FakeVATClient.fetched_ranges,
+            [(datetime(2023, 8, 18).date(), until_date)],
+        )
+        self.assertEqual(FakeVATClient.fetched_dates, [])
+        self.assertEqual(response.count(), 7)
+
+    def test_missing_days_are_found_with_a_single_query(self):
+        """
+        Test that the coverage of a range is resolved with a single query.
+        """
+        days = RatesService.extract_week_days(
+            datetime(2023, 8, 21).date(), datetime(2023, 8, 25).date()
+        )
+        service = RatesService(base_rate="USD")
+        service.get_or_create_rate(days[0], {"rates": {"BRL": 5.4}})
+        service.get_or_create_rate(days[1], {"rates": {}})
+
+        with CaptureQueriesContext(connection) as context:
+            missing_days = service.get_missing_days(days)
+
+        self.assertEqual(missing_days, days[2:])
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_days_without_rates_are_not_fetched_again(self):
+        """
+        Test that a holiday, answered with the rates of the previous business
+        day, is recorded without rates and not fetched again.
+        """
+        holiday = datetime(2023, 8, 22).date()
+        service = RatesService(base_rate="USD", rates_provider=FakeVATClient)
+        FakeVATClient.fetched_dates = []
+
+        with unittest.mock.patch.object(
+            FakeVATClient,
+            "rate",
+            lambda client: FakeVATClient.fetched_dates.append(client.date)
+            or {"date": "2023-08-21", "rates": {"BRL": 4.97}},
+        ):
+            service.proccess(holiday, None)
+            response = service.proccess(holiday, None)
+
+        self.assertEqual(FakeVATClient.fetched_dates, [holiday])
+        self.assertEqual(response.count(), 0)
+        fetched_day = FetchedDay.objects.get(date=holiday)
+        self.assertEqual(fetched_day.status, FetchedDay.NO_DATA)
+        self.assertEqual(fetched_day.effective_date, datetime(2023, 8, 21).date())
+
+    def test_days_without_rates_of_today_expire(self):
+        """
+        Test that a day fetched without rates during the day itself is
+        fetched again once the ledger entry expires.
+        """
+        today = datetime.now().date()
+        service = RatesService(base_rate="USD")
+        service.get_or_create_rate(today, {"rates": {}})
+
+        self.assertEqual(service.get_missing_days([today]), [])
+        with unittest.mock.patch.object(RatesService, "no_data_ttl", -60):
+            self.assertEqual(service.get_missing_days([today]), [today])
+
+    def test_rates_are_derived_from_the_canonical_base(self):
+        """
+        Test that the rates of any base are derived from the stored canonical
+        rates, without fetching them again.
+        """
+        date = datetime(2023, 8, 21).date()
+        canonical = RatesService(base_rate="EUR", rates_provider=FakeVATClient)
+        canonical.get_or_create_rate(
+            date, {"rates": {"USD": 1.25, "BRL": 5.5, "JPY": 150}}
+        )
+        FakeVATClient.fetched_dates = []
+
+        service = RatesService(base_rate="USD", rates_provider=FakeVATClient)
+        rates = service.derive_rates(service.proccess(date, None))
+        prices = {rate.currency.short_name: rate.price for rate in rates}
+        rows = service.derive_rows(
+            service.proccess(date, None).values_list("date", "price", "base_id"),
+            ("date", "price", "base_id"),
+        )
+
+        self.assertEqual(FakeVATClient.fetched_dates, [])
+        self.assertEqual(Rate.objects.count(), 4)
+        self.assertEqual(
+            prices,
+            {"EUR": Decimal("0.8"), "USD": 1, "BRL": Decimal("4.4"), "JPY": 120},
+        )
+        self.assertEqual({rate.base for rate in rates}, {service.base_rate})
+        self.assertEqual({row[2] for row in rows}, {service.base_rate.id})
+        self.assertEqual(sorted(row[1] for row in rows), sorted(prices.values()))
+
+    def test_get_rate_matrix(self):
+        """
+        Test that the stored rates of a range are loaded as a matrix against
+        the requested base.
+        """
+        pytest.importorskip("numpy")
+        canonical = RatesService(base_rate="EUR", rates_provider=FakeVATClient)
+        for day, price in ((21, 1.25), (22, 1.5)):
+            canonical.get_or_create_rate(
+                datetime(2023, 8, day).date(), {"rates": {"USD": price, "BRL": 5}}
+            )
+
+        matrix = RatesService(base_rate="USD").get_rate_matrix(
+            datetime(2023, 8, 21).date(), datetime(2023, 8, 22).date()
+        )
+
+        self.assertEqual(matrix.base, "USD")
+        self.assertEqual(matrix.currencies, ["EUR", "USD", "BRL"])
+        self.assertEqual(matrix.rate("USD", "BRL").tolist(), [4.0, 5 / 1.5])
+
+    def test_split_in_ranges(self):
+        """
+        Test that week days are split in runs of consecutive week days.
+        """
+        days = [datetime(2023, 8, day).date() for day in (14, 15, 17, 18, 21, 23)]
+
+        ranges = RatesService.split_in_ranges(days)
+
+        self.assertEqual(
+            [[item.day for item in days] for days in ranges],
+            [[14, 15], [17, 18, 21], [23]],
+        )
+
     def test_until_date_bigger_than_date(self):
         """
         Test behavior when until_date is not greater than date.
@@ -0,0 +1,183 @@
+"""A local stub of the VATcomply API, used to test the VAT client offline.
+"""
+import json
+import threading
+import time
+from datetime import date as Date
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_RATES = {
+    "EUR": 0.9202171712524155,
+    "USD": 1.0,
+    "JPY": 145.49553694671943,
+    "BRL": 4.976166375264563,
+}
+
+
+class VATComplyStub:
+    """
+    A threaded HTTP server answering like the VATcomply ``/rates`` API.
+
+    Attributes:
+        latency (float): Seconds waited before answering each request.
+        failures (int): Number of upcoming requests answered with a 503.
+        rates (dict): The rates returned, relative to USD.
+        timeseries (bool): Whether the ``/timeseries`` endpoint is served.
+        requests (list): The query strings of the requests received.
+
+    Usage:
+        with VATComplyStub(latency=0.05) as stub:
+            client = VATClient(...)
+            client.base_url = stub.url
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failures: int = 0,
+        rates=None,
+        timeseries: bool = True,
+    ):
+        """
+        Initializes the stub server, bound to a free local port.
+
+        Args:
+            latency (float, optional): Seconds waited before answering.
+            failures (int, optional): Number of requests answered with a 503
+            before the stub starts answering normally.
+            rates (dict, optional): The rates returned, relative to USD.
+            timeseries (bool, optional): Whether the ``/timeseries`` endpoint
+            is served.
+        """
+        self.latency = latency
+        self.failures = failures
+        self.rates = rates or DEFAULT_RATES
+        self.timeseries = timeseries
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The base url of the stub server."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "VATComplyStub":
+        """Start serving requests on a background thread."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release its port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "VATComplyStub":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def payload(self, base: str, date: str) -> dict:
+        """
+        Build the rates payload of a day, converted to the given base.
+
+        Args:
+            base (str): The base currency code.
+            date (str): The ISO date of the rates.
+
+        Returns:
+            dict: A VATcomply-like payload.
+        """
+        base_price = self.rates.get(base, 1.0)
+        return {
+            "date": date,
+            "base": base,
+            "rates": {code: price / base_price for code, price in self.rates.items()},
+        }
+
+    def timeseries_payload(self, base: str, start_date: str, end_date: str) -> dict:
+        """
+        Build the rates payload of a range of days, skipping weekends.
+
+        Args:
+            base (str): The base currency code.
+            start_date (str): The ISO date of the first day.
+            end_date (str): The ISO date of the last day.
+
+        Returns:
+            dict: A timeseries payload with the rates keyed by ISO date.
+        """
+        day = Date.fromisoformat(start_date)
+        rates = {}
+        while day <= Date.fromisoformat(end_date):
+            if day.weekday() < 5:
+                rates[day.isoformat()] = self.payload(base, day.isoformat())["rates"]
+            day += timedelta(days=1)
+        return {
+            "base": base,
+            "start_date": start_date,
+            "end_date": end_date,
+            "rates": rates,
+        }
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            if self.failures > 0:
+                self.failures -= 1
+                return True
+            return False
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Request handler bound to the stub instance."""
+
+            def do_GET(self):  # pylint: disable=C0103
+                """Answer a GET request."""
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                with stub._lock:
+                    stub.requests.append({"path": url.path, **query})
+
+                time.sleep(stub.latency)
+
+                if stub._should_fail():
+                    return self._reply(503, {"detail": "Service Unavailable"})
+                if url.path == "/timeseries" and stub.timeseries:
+                    return self._reply(
+                        200,
+                        stub.timeseries_payload(
+                            query.get("base", "EUR"),
+                            query["start_date"],
+                            query["end_date"],
+                        ),
+                    )
+                if url.path != "/rates":
+                    return self._reply(404, {"detail": "Not Found"})
+
+                date = query.get("date") or Date.today().isoformat()
+                return self._reply(200, stub.payload(query.get("base", "EUR"), date))
+
+            def _reply(self, status: int, body: dict):
+                content = json.dumps(body).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    # the client gave up waiting, e.g. on timeout tests
+                    pass
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                """Keep the test output quiet."""
+
+        return Handler
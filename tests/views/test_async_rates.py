@@ -0,0 +1,123 @@
+"""Test for the async rate view layer"""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from exchange_rates.core.interfaces.vatcomply.async_client import AsyncVATClient
+from exchange_rates.core.services.async_rates_service import AsyncRatesService
+from exchange_rates.core.services.rates_service import RatesService
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.models import Rate
+from tests.stubs.vatcomply import VATComplyStub
+
+
+class AsyncRatesViewTest(TestCase):
+    """
+    Test case for the AsyncRatesView class, against a local stub of the VAT
+    service.
+    """
+
+    # pytest: disable=C0103
+    def setUp(self):  # no-qa
+        """
+        Load the currencies and point the async client at a stub server.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        RatesResponseCache.clear()
+
+        self.stub = VATComplyStub(latency=0.05).start()
+        self.addCleanup(self.stub.stop)
+        for name, value in {
+            "base_url": self.stub.url,
+            "backoff_factor": 0.01,
+            "supports_timeseries": False,
+        }.items():
+            patcher = patch.object(AsyncVATClient, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    # pytest: enable=C0103
+
+    async def test_async_rates_view(self):
+        """
+        Test that the missing days are fetched concurrently, then read like
+        in RatesView.
+        """
+        response = await self.async_client.get(
+            "/rates/async/?rate_base=USD&date=2023-08-21&until_date=2023-08-25"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stub.requests), 5)
+        self.assertEqual(
+            {rate["date"] for rate in response.json()["rates"]},
+            {f"2023-08-{day}" for day in range(21, 26)},
+        )
+        self.assertTrue(
+            await Rate.objects.filter(
+                base__short_name="EUR", date=date(2023, 8, 25)
+            ).aexists()
+        )
+
+    async def test_async_rates_view_stored_days(self):
+        """
+        Test that stored days are not fetched again.
+        """
+        url = "/rates/async/?rate_base=USD&date=2023-08-21&format=columnar"
+        await self.async_client.get(url)
+        RatesResponseCache.clear()
+
+        response = await self.async_client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertTrue(response.json()["prices"])
+
+    async def test_async_rates_view_missing_days_once(self):
+        """
+        Test that the missing days are looked up by the prefetch only, not
+        again when the rates are read.
+        """
+        with patch.object(
+            RatesService,
+            "get_missing_days",
+            autospec=True,
+            side_effect=RatesService.get_missing_days,
+        ) as get_missing_days:
+            response = await self.async_client.get(
+                "/rates/async/?rate_base=USD&date=2023-08-21"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_missing_days.call_count, 1)
+
+    async def test_async_rates_view_cached(self):
+        """
+        Test that a cached response is served before any prefetch.
+        """
+        url = "/rates/async/?rate_base=USD&date=2023-08-21&format=columnar"
+        first = await self.async_client.get(url)
+
+        with patch.object(
+            AsyncRatesService, "create", side_effect=AssertionError
+        ) as create:
+            second = await self.async_client.get(url)
+
+        create.assert_not_called()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    async def test_async_rates_view_error(self):
+        """
+        Test that the business rules are enforced before any fetch.
+        """
+        response = await self.async_client.get(
+            "/rates/async/?date=2023-08-14&until_date=2023-08-25"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
+        self.assertEqual(self.stub.requests, [])
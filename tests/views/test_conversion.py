@@ -0,0 +1,70 @@
+"""Test for conversion view layer"""
+from datetime import date
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+
+from exchange_rates.models import Currency, Rate
+
+
+class ConversionBatchViewTest(TestCase):
+    """
+    Test case for the ConversionBatchView class.
+    """
+
+    # pytest: disable=C0103
+    def setUp(self):  # no-qa
+        """
+        Set up the test environment with the canonical rates of a day.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        self.client = Client()
+
+        base = Currency.objects.get(short_name="EUR")
+        prices = {"EUR": 1, "USD": 2, "JPY": 300, "BRL": 10}
+        for currency in Currency.objects.all():
+            Rate.objects.create(
+                base=base,
+                currency=currency,
+                date=date(2023, 8, 21),
+                price=prices[currency.short_name],
+            )
+
+    # pytest: enable=C0103
+
+    def test_convert_batch(self):
+        """
+        Test that a batch is converted in input order.
+        """
+        response = self.client.post(
+            "/convert/batch",
+            {
+                "conversions": [
+                    ["10.50", "usd", "BRL", "2023-08-21"],
+                    [7, "JPY", "EUR", "2023-08-21"],
+                ]
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {"amount": "52.50", "rate": "5.0000000000"},
+                {"amount": "0.02", "rate": "0.0033333333"},
+            ],
+        )
+
+    def test_convert_batch_invalid(self):
+        """
+        Test that malformed conversions are rejected.
+        """
+        response = self.client.post(
+            "/convert/batch",
+            {"conversions": [["10", "USD", "BRL"], ["x", "USD", "BRL", "2023"]]},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["conversions"]), {"0", "1"})
@@ -0,0 +1,43 @@
+"""Test for rate keyset pagination"""
+import unittest
+from datetime import date
+
+from exchange_rates.infra.views.pagination import RateKeysetPagination
+
+
+class TestRateKeysetPagination(unittest.TestCase):
+    """
+    Unit tests for the RateKeysetPagination class.
+    """
+
+    def test_page_size_is_capped(self):
+        """
+        Test that the requested page size can not exceed the maximum.
+        """
+        pagination = RateKeysetPagination(
+            page_size=RateKeysetPagination.max_page_size + 1
+        )
+
+        self.assertEqual(pagination.page_size, RateKeysetPagination.max_page_size)
+        self.assertEqual(
+            RateKeysetPagination().page_size, RateKeysetPagination.page_size
+        )
+
+    def test_cursor_round_trip(self):
+        """
+        Test that a cursor decodes to the position it was built from.
+        """
+        cursor = RateKeysetPagination.encode_cursor(date(2023, 8, 18), 2, 42)
+
+        self.assertEqual(
+            RateKeysetPagination.decode_cursor(cursor), (date(2023, 8, 18), 2, 42)
+        )
+
+    def test_invalid_cursor(self):
+        """
+        Test that an invalid cursor raises an exception.
+        """
+        with self.assertRaises(Exception) as context:
+            RateKeysetPagination.decode_cursor("invalid")
+
+        self.assertEqual(str(context.exception), "Invalid cursor.")
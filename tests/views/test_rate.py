@@ -1,6 +1,18 @@
 """Test for rate view layer"""
+import json
+from datetime import date
+from unittest.mock import patch
+
 from django.core.management import call_command
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.infra.repositories.currency_registry import CurrencyRegistry
+from exchange_rates.models import Currency, Rate
+from tests.stubs.vatcomply import VATComplyStub
 
 
 class RatesViewTest(TestCase):
@@ -29,6 +41,7 @@ class RatesViewTest(TestCase):
         """
         # Load fixtures
         call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        RatesResponseCache.clear()
         self.client = Client()
 
     # pytest: enable=C0103
@@ -38,10 +51,222 @@ class RatesViewTest(TestCase):
         Test the exchange rate endpoint.
 
         This method sends a GET request to the exchange rate endpoint with
-        specific parameters and asserts the expected response.
+        specific parameters and asserts the expected response, the missing
+        day being fetched from a local stub of the VAT service.
 
         """
-        response = self.client.get("/rates/?rate_base=USD&date=2023-08-18")
+        with VATComplyStub() as stub, patch.object(VATClient, "base_url", stub.url):
+            response = self.client.get("/rates/?rate_base=USD&date=2023-08-18")
 
         self.assertEqual(response.status_code, 200)
         self.assertTrue("rates" in response.data)
+        self.assertEqual(len(stub.requests), 1)
+
+    def seed_rates(self, day=date(2023, 8, 18)):
+        """
+        Store the canonical rates of a day, so no upstream call is needed.
+        """
+        base = Currency.objects.get(short_name="EUR")
+        for currency in Currency.objects.all():
+            Rate.objects.create(base=base, currency=currency, date=day, price=1)
+
+    def test_rates_view_cached(self):
+        """
+        Test that a repeated query is served from the response cache, without
+        touching the database.
+        """
+        self.seed_rates()
+
+        first = self.client.get("/rates/?rate_base=USD&date=2023-08-18")
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get("/rates/?rate_base=USD&date=2023-08-18")
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(len(first.data["rates"]), 4)
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_rates_view_not_modified(self):
+        """
+        Test that a conditional request for an unchanged representation is
+        answered with a 304, from the cache or from the database.
+        """
+        self.seed_rates()
+        url = "/rates/?rate_base=USD&date=2023-08-18"
+
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertIn("max-age=3600", response["Cache-Control"])
+        self.assertIn("must-revalidate", response["Cache-Control"])
+        self.assertNotIn("immutable", response["Cache-Control"])
+        self.assertIn("Last-Modified", response)
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        RatesResponseCache.clear()
+        uncached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(uncached.status_code, 304)
+        self.assertEqual(uncached["ETag"], etag)
+
+    def test_rates_view_modified(self):
+        """
+        Test that the ETag changes when the rates of the response change.
+        """
+        self.seed_rates()
+        url = "/rates/?rate_base=USD&date=2023-08-18"
+        etag = self.client.get(url)["ETag"]
+
+        RatesResponseCache.clear()
+        Rate.objects.filter(date=date(2023, 8, 18)).first().save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_rates_view_query_count(self):
+        """
+        Test that the number of queries does not grow with the number of
+        rates in the response.
+        """
+        self.seed_rates(date(2023, 8, 17))
+        self.seed_rates(date(2023, 8, 18))
+        Rate.objects.filter(date=date(2023, 8, 17)).exclude(
+            currency__short_name="EUR"
+        ).delete()
+        CurrencyRegistry.get_by_short_name("USD")
+
+        queries = []
+        for day in ("2023-08-17", "2023-08-18"):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(f"/rates/?rate_base=USD&date={day}")
+            self.assertEqual(response.status_code, 200)
+            queries.append(len(context.captured_queries))
+
+        self.assertEqual(len(response.data["rates"]), 4)
+        self.assertEqual(queries[0], queries[1])
+
+    def test_rates_view_keyset_pagination(self):
+        """
+        Test that walking the pages through their cursors returns every rate
+        once, in (date, currency, id) order.
+        """
+        for day in range(14, 19):
+            self.seed_rates(date(2023, 8, day))
+
+        rates = []
+        url = "/rates/?rate_base=USD&page_size=6"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["rates"]), 6)
+            rates.extend(response.data["rates"])
+            cursor = response.data["next"]
+            url = cursor and f"/rates/?rate_base=USD&page_size=6&cursor={cursor}"
+
+        self.assertEqual(len(rates), 20)
+        self.assertEqual(
+            [(rate["date"], rate["currency"]["id"]) for rate in rates],
+            sorted((rate["date"], rate["currency"]["id"]) for rate in rates),
+        )
+
+    def test_rates_view_pages_without_date_are_bounded(self):
+        """
+        Test that a request without a date never reads the rates without a
+        limit, whatever the serializer (the base prices of the dates of the
+        page aside).
+        """
+        for day in range(14, 19):
+            self.seed_rates(date(2023, 8, day))
+
+        for params in ("", "&serializer=fast", "&format=columnar"):
+            RatesResponseCache.clear()
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(f"/rates/?rate_base=USD&page_size=6{params}")
+
+            self.assertEqual(response.status_code, 200)
+            rate_reads = [
+                query["sql"]
+                for query in context.captured_queries
+                if query["sql"].startswith("SELECT")
+                and 'FROM "exchange_rates_rate"' in query["sql"]
+                and "COUNT(" not in query["sql"]
+                and "MAX(" not in query["sql"]
+                and '"date" IN (' not in query["sql"]
+            ]
+            self.assertTrue(rate_reads)
+            for sql in rate_reads:
+                self.assertIn("LIMIT", sql)
+
+    def test_rates_view_invalid_cursor(self):
+        """
+        Test that an invalid cursor is rejected.
+        """
+        response = self.client.get("/rates/?rate_base=USD&cursor=invalid")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_rates_view_fast_serializer(self):
+        """
+        Test that the fast serializer renders the same JSON as the DRF
+        serializers.
+        """
+        for day in range(14, 19):
+            self.seed_rates(date(2023, 8, day))
+        url = "/rates/?rate_base=USD&date=2023-08-14&until_date=2023-08-18"
+
+        default = self.client.get(f"{url}&page_size=7")
+        fast = self.client.get(f"{url}&page_size=7&serializer=fast")
+
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast["Content-Type"], "application/json")
+        self.assertEqual(json.loads(fast.content), json.loads(default.content))
+
+    def test_rates_view_columnar(self):
+        """
+        Test that format=columnar lists each currency once and the rates as
+        parallel arrays, matching the default response.
+        """
+        for day in range(17, 19):
+            self.seed_rates(date(2023, 8, day))
+        url = "/rates/?rate_base=USD&date=2023-08-17&until_date=2023-08-18"
+
+        default = self.client.get(url).data["rates"]
+        columnar = self.client.get(f"{url}&format=columnar")
+        data = json.loads(columnar.content)
+
+        self.assertEqual(columnar.status_code, 200)
+        self.assertEqual(columnar["Content-Type"], "application/json")
+        self.assertEqual(data["base"], default[0]["base"]["id"])
+        self.assertEqual(
+            data["currencies"][str(default[0]["currency"]["id"])]["short_name"],
+            default[0]["currency"]["short_name"],
+        )
+        self.assertEqual(data["dates"], [rate["date"] for rate in default])
+        self.assertEqual(
+            data["currency_ids"], [rate["currency"]["id"] for rate in default]
+        )
+        self.assertEqual(data["prices"], [rate["price"] for rate in default])
+        self.assertIsNone(data["next"])
+        self.assertNotIn("pivot", data)
+        self.assertLess(len(columnar.content), len(json.dumps(default)) / 2)
+
+    def test_rates_view_columnar_pivot(self):
+        """
+        Test that pivot=true adds the date x currency price matrix.
+        """
+        for day in range(17, 19):
+            self.seed_rates(date(2023, 8, day))
+        url = (
+            "/rates/?rate_base=USD&date=2023-08-17&until_date=2023-08-18"
+            "&format=columnar&pivot=true"
+        )
+
+        pivot = json.loads(self.client.get(url).content)["pivot"]
+
+        self.assertEqual(pivot["dates"], ["2023-08-17", "2023-08-18"])
+        self.assertEqual(
+            pivot["currency_ids"],
+            sorted(Currency.objects.values_list("id", flat=True)),
+        )
+        self.assertEqual(pivot["prices"], [["1.0000000000"] * 4, ["1.0000000000"] * 4])
@@ -0,0 +1,127 @@
+"""Test for rate export view layer"""
+import csv
+import io
+import json
+from datetime import date
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+
+from exchange_rates.infra.views.rates_export_view import RatesExportView
+from exchange_rates.models import Currency, Rate
+
+
+class RatesExportViewTest(TestCase):
+    """
+    Test case for the RatesExportView class.
+    """
+
+    # pytest: disable=C0103
+    def setUp(self):  # no-qa
+        """
+        Set up the test environment, with canonical rates stored for 10 week
+        days.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        self.client = Client()
+
+        base = Currency.objects.get(short_name="EUR")
+        prices = {"EUR": 1, "USD": 2, "JPY": 300, "BRL": 10}
+        for day in [*range(1, 6), *range(8, 13)]:
+            for currency in Currency.objects.all():
+                Rate.objects.create(
+                    base=base,
+                    currency=currency,
+                    date=date(2023, 5, day),
+                    price=prices[currency.short_name],
+                )
+
+    # pytest: enable=C0103
+
+    def test_export_ndjson(self):
+        """
+        Test that the rates of a range longer than 5 days are streamed as
+        NDJSON, one rate per line.
+        """
+        response = self.client.get(
+            "/rates/export/?rate_base=USD&date=2023-05-02&until_date=2023-05-11"
+        )
+        lines = b"".join(response.streaming_content).splitlines()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(lines), 8 * 4)
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                "date": "2023-05-02",
+                "base": "USD",
+                "currency": "EUR",
+                "price": "0.5000000000",
+            },
+        )
+        self.assertEqual(json.loads(lines[-1])["date"], "2023-05-11")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="rates-USD.ndjson"'
+        )
+
+    def test_export_csv_chunks(self):
+        """
+        Test that the CSV export has a header and is sent chunk by chunk.
+        """
+        chunk_size = RatesExportView.chunk_size
+        RatesExportView.chunk_size = 10
+        try:
+            response = self.client.get("/rates/export/?rate_base=USD&format=csv")
+            chunks = list(response.streaming_content)
+        finally:
+            RatesExportView.chunk_size = chunk_size
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(len(chunks), 1 + 4)
+        self.assertEqual(len(rows), 10 * 4)
+        self.assertEqual(
+            rows[0],
+            {
+                "date": "2023-05-01",
+                "base": "USD",
+                "currency": "EUR",
+                "price": "0.5000000000",
+            },
+        )
+
+    def test_export_empty_csv(self):
+        """
+        Test that an empty CSV export still holds its header.
+        """
+        response = self.client.get("/rates/export/?date=2024-01-01&format=csv")
+
+        self.assertEqual(
+            b"".join(response.streaming_content), b"date,base,currency,price\r\n"
+        )
+
+    def test_export_invalid_range(self):
+        """
+        Test that a range ending before it starts is rejected.
+        """
+        response = self.client.get(
+            "/rates/export/?date=2023-05-11&until_date=2023-05-02"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_unknown_base(self):
+        """
+        Test that an unknown base is rejected before it reaches the
+        Content-Disposition header.
+        """
+        response = self.client.get(
+            "/rates/export/", {"rate_base": 'USD"; filename="evil.sh'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("Content-Disposition", response)
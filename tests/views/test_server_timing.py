@@ -0,0 +1,94 @@
+"""Test for the Server-Timing instrumentation"""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+
+from exchange_rates.core.interfaces.vatcomply.client import VATClient
+from exchange_rates.infra.cache.rates_response_cache import RatesResponseCache
+from exchange_rates.infra.timing.middleware import ServerTimingMiddleware
+from exchange_rates.infra.timing.request_timings import RequestTimings
+from exchange_rates.models import Currency, Rate
+from tests.stubs.vatcomply import VATComplyStub
+
+
+class ServerTimingTest(TestCase):
+    """
+    Test case for the ServerTimingMiddleware class.
+    """
+
+    # pytest: disable=C0103
+    def setUp(self):  # no-qa
+        """
+        Load the currencies and clear the response cache.
+        """
+        call_command("loaddata", "fixtures/currencies.json", verbosity=0)
+        RatesResponseCache.clear()
+        self.client = Client()
+
+    # pytest: enable=C0103
+
+    @staticmethod
+    def parse(header: str) -> dict:
+        """
+        Parse a Server-Timing header into its metrics, keyed by name.
+        """
+        return {
+            metric.split(";")[0]: metric.split(";")[1:] for metric in header.split(", ")
+        }
+
+    def test_stored_rates(self):
+        """
+        Test that the queries and serialization of a request are reported.
+        """
+        base = Currency.objects.get(short_name="EUR")
+        for currency in Currency.objects.all():
+            Rate.objects.create(
+                base=base, currency=currency, date=date(2023, 8, 18), price=1
+            )
+
+        response = self.client.get("/rates/?rate_base=USD&date=2023-08-18")
+
+        metrics = self.parse(response["Server-Timing"])
+        self.assertEqual(set(metrics), {"currency", "db", "serialize", "total"})
+        self.assertRegex(metrics["db"][1], r'^desc="\d+ queries"$')
+
+    def test_upstream_calls(self):
+        """
+        Test that the VAT service calls of a request are reported, including
+        the calls made on worker threads.
+        """
+        with VATComplyStub() as stub, patch.object(VATClient, "base_url", stub.url):
+            with patch.object(VATClient, "supports_timeseries", False):
+                response = self.client.get(
+                    "/rates/?rate_base=USD&date=2023-08-21&until_date=2023-08-22"
+                )
+
+        metrics = self.parse(response["Server-Timing"])
+        self.assertEqual(metrics["upstream"][1], 'desc="2 calls"')
+
+    def test_timing_log_line(self):
+        """
+        Test that the timings of a request are logged through the logging
+        subsystem, as structured fields, unless disabled.
+        """
+        with self.assertLogs("exchange_rates.infra.timing.middleware", "INFO") as logs:
+            self.client.get("/rates/?rate_base=USD&date=2023-08-18&cursor=invalid")
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "Request timed.")
+        self.assertEqual((record.path, record.status), ("/rates/", 400))
+        self.assertIsInstance(record.total_ms, float)
+
+        with patch.object(ServerTimingMiddleware, "log", False):
+            with self.assertNoLogs("exchange_rates.infra.timing.middleware"):
+                self.client.get("/rates/?rate_base=USD&date=2023-08-18&cursor=invalid")
+
+    def test_no_recording_outside_of_requests(self):
+        """
+        Test that work done outside of a request is not recorded.
+        """
+        RequestTimings.record("db", 1.0)
+
+        self.assertIsNone(RequestTimings.current())